@@ -9,11 +9,28 @@ Aplikasi ini memprediksi nilai matematika siswa berdasarkan faktor sosial:
 - Kursus Persiapan Ujian
 """
 
+import os
+import tempfile
+import time
+
 import streamlit as st
-import joblib
 import pandas as pd
 import numpy as np
 
+from encoding import OPSI_FITUR, KOLOM_FITUR, kolom_hilang, encode_codes, encode_records, build_coef_lookup, score_codes
+from schema import TARGET
+from batch_predict import KOLOM_PREDIKSI, score_chunk
+from artifact import ARTIFACT_PATH
+from dashboard_stats import DATASET_PATH, load_dashboard_stats
+from fileio import file_signature
+from metrics import METRICS_PATH, REGISTRY
+from model_reload import ModelHolder, predict_cell
+from explain import explain_student
+from subgroups import MIN_N
+from drift import DRIFT_PATH, PSI_WASPADA, PSI_DRIFT, DriftMonitor, distribution_counts
+from dataset import KOLOM_SKOR, load_dataset
+from whatif import KEBIJAKAN_CONTOH, simulate, summarize, compare_policies, per_student
+
 # ========================================
 # KONFIGURASI HALAMAN
 # ========================================
@@ -24,19 +41,203 @@ st.set_page_config(
 )
 
 # ========================================
-# LOAD MODEL
+# METRIK HOT PATH
+# ========================================
+# REGISTRY hidup selama proses Streamlit (bukan per rerun); metrik ditulis
+# ke METRICS_PATH dalam format Prometheus, paling sering tiap beberapa detik
+INTERVAL_TULIS_METRIK = 5.0
+prediksi_dilayani = REGISTRY.counter("predictions_served_total", "Jumlah siswa yang berhasil diprediksi")
+prediksi_error = REGISTRY.counter("prediction_errors_total", "Jumlah error yang tertangkap saat prediksi")
+
+# ========================================
+# LOAD MODEL (HOT RELOAD)
 # ========================================
 @st.cache_resource
-def load_model():
+def get_model_holder():
+    # Satu holder per proses: artefak baru dari main.py dipasang otomatis
+    # di background tanpa restart app (lihat model_reload.py)
     try:
-        model = joblib.load("model.pkl")
-        feature_names = joblib.load("feature_names.pkl")
-        return model, feature_names
+        return ModelHolder(ARTIFACT_PATH)
     except FileNotFoundError:
         st.error("⚠️ Model belum di-training! Jalankan 'python main.py' terlebih dahulu.")
         st.stop()
+    except ValueError as e:
+        st.error(f"⚠️ Artefak model tidak valid: {e}. Jalankan ulang 'python main.py'.")
+        st.stop()
+
+
+model_holder = get_model_holder()
+model_aktif = model_holder.get()
+
+
+def lookup_matematika(aktif):
+    """Lookup koefisien target math score saja (untuk simulasi intervensi)."""
+    model_math = aktif.model.for_target(TARGET)
+    return build_coef_lookup(model_math, model_math.feature_names)
+
+
+def info_model(aktif):
+    """Versi model aktif (checksum artefak) & waktu dipasang."""
+    dimuat = time.strftime("%d-%m-%Y %H:%M:%S", time.localtime(aktif.loaded_at))
+    st.caption(f"🧠 Model aktif: `{aktif.model.checksum[:12]}` (dimuat {dimuat})")
+    if model_holder.last_error:
+        st.warning(f"⚠️ Artefak model baru ditolak, model lama tetap dipakai: {model_holder.last_error}")
+
+
+# ========================================
+# STATISTIK DASHBOARD (DARI DATASET & MODEL)
+# ========================================
+# Cache yang dikunci checksum model / signature dataset: setiap hot reload
+# menambah entri baru, jadi hanya beberapa versi terakhir yang disimpan
+MAKS_ENTRI_CACHE = 2
+
+
+@st.cache_data(show_spinner=False, max_entries=MAKS_ENTRI_CACHE)
+def get_dashboard_stats(dataset_signature, model_checksum, _model):
+    # Signature CSV (mtime, ukuran) & checksum model aktif adalah kunci
+    # cache: statistik hanya dihitung ulang saat dataset atau model berganti
+    return load_dashboard_stats(_model, DATASET_PATH)
+
+
+try:
+    stats = get_dashboard_stats(file_signature(DATASET_PATH), model_aktif.model.checksum, model_aktif.model)
+except FileNotFoundError:
+    st.error(f"⚠️ Dataset '{DATASET_PATH}' tidak ditemukan!")
+    st.stop()
+except ValueError as e:
+    st.error(f"⚠️ Dataset '{DATASET_PATH}' tidak bisa dibaca: {e}")
+    st.stop()
+
+metrics = stats["metrics"]
+n_siswa = stats["nilai"]["jumlah"]
+
+# ========================================
+# SIMULASI INTERVENSI (WHAT-IF)
+# ========================================
+KEBIJAKAN_UTAMA = "Kursus persiapan untuk siswa makan siang bersubsidi"
+
+# Fitur yang bisa diintervensi: penjelasan prediksi menyebut potensi kenaikannya
+FITUR_DAPAT_DIUBAH = ["test preparation course"]
+
+# Profil contoh di tab Insight: Kelompok A, orang tua SMA tidak lulus,
+# makan siang bersubsidi, belum ikut kursus (dirata-rata untuk kedua gender)
+PROFIL_CONTOH = [
+    {
+        "gender": gender, "race/ethnicity": "group A",
+        "parental level of education": "some high school",
+        "lunch": "free/reduced", "test preparation course": "none",
+    }
+    for gender in OPSI_FITUR["gender"]
+]
+
+
+@st.cache_data(show_spinner=False, max_entries=MAKS_ENTRI_CACHE)
+def get_kode_dataset(dataset_signature):
+    # Kohort dataset di-encode sekali per versi CSV, dipakai ulang semua simulasi
+    return encode_codes(load_dataset(DATASET_PATH, KOLOM_FITUR))
+
+
+@st.cache_data(show_spinner=False, max_entries=MAKS_ENTRI_CACHE)
+def get_skenario_intervensi(dataset_signature, model_checksum, _coef_lookup):
+    """Dampak kebijakan utama pada profil contoh & seluruh kohort dataset."""
+    kebijakan = KEBIJAKAN_CONTOH[KEBIJAKAN_UTAMA]
+    return {
+        "profil": summarize(simulate(encode_records(PROFIL_CONTOH), _coef_lookup, kebijakan)),
+        "kohort": summarize(simulate(get_kode_dataset(dataset_signature), _coef_lookup, kebijakan)),
+    }
+
+
+# ========================================
+# MONITORING DRIFT (INPUT & PREDIKSI YANG DILAYANI)
+# ========================================
+@st.cache_resource(show_spinner=False, max_entries=1)
+def get_drift_monitor(dataset_signature, model_checksum, _aktif):
+    # Satu monitor per proses untuk versi model aktif (bukan per sesi);
+    # max_entries=1: monitor model lama dibuang saat hot reload. Referensi =
+    # distribusi input dataset training & prediksi model ini untuk dataset itu
+    kode = get_kode_dataset(dataset_signature)
+    referensi = distribution_counts(kode, score_codes(kode, lookup_matematika(_aktif)))
+    return DriftMonitor(referensi, model_checksum)
+
+
+skenario = get_skenario_intervensi(
+    file_signature(DATASET_PATH), model_aktif.model.checksum, lookup_matematika(model_aktif)
+)
+
+
+def ranking_kelompok(stats):
+    """Ringkasan per kelompok etnis, diurutkan dari rata-rata tertinggi."""
+    per_kelompok = stats["per_kategori"]["race/ethnicity"]
+    return sorted(per_kelompok.items(), key=lambda item: item[1]["mean"], reverse=True)
+
+
+def gap_kategori(stats, kolom):
+    """(kategori tertinggi, kategori terendah, selisih rata-rata) satu fitur."""
+    per_nilai = stats["per_kategori"][kolom]
+    tinggi = max(per_nilai, key=lambda nilai: per_nilai[nilai]["mean"])
+    rendah = min(per_nilai, key=lambda nilai: per_nilai[nilai]["mean"])
+    return tinggi, rendah, per_nilai[tinggi]["mean"] - per_nilai[rendah]["mean"]
+
+
+def ukuran_file(path):
+    """Ukuran file untuk ditampilkan, misalnya '1.4 KB'."""
+    try:
+        ukuran = os.path.getsize(path)
+    except OSError:
+        return "belum ada"
+    return f"{ukuran / 1024:.1f} KB" if ukuran < 1024 ** 2 else f"{ukuran / 1024 ** 2:.1f} MB"
+
+
+# ========================================
+# LABEL KATEGORI (BAHASA INDONESIA)
+# ========================================
+target_label = {"math score": "🔢 Matematika", "reading score": "📖 Membaca", "writing score": "✍️ Menulis"}
+gender_label = {"female": "Perempuan", "male": "Laki-laki"}
+race_label = {
+    kelompok: f"Kelompok {kelompok[-1]} (Rata-rata: {ringkasan['mean']:.1f})"
+    for kelompok, ringkasan in stats["per_kategori"]["race/ethnicity"].items()
+}
+lunch_label = {"standard": "Standard", "free/reduced": "Bersubsidi (Gratis/Diskon)"}
+edu_label = {
+    "some high school": "SMA Tidak Lulus",
+    "high school": "Lulusan SMA",
+    "some college": "Kuliah Tidak Lulus",
+    "associate's degree": "Diploma (D3)",
+    "bachelor's degree": "Sarjana (S1)",
+    "master's degree": "Magister (S2)"
+}
+test_label = {"none": "Tidak Ikut", "completed": "Selesai"}
 
-model, feature_names = load_model()
+# Label singkat untuk tabel
+label_singkat = {
+    "gender": gender_label,
+    "race/ethnicity": {kelompok: f"Kelompok {kelompok[-1]}" for kelompok in OPSI_FITUR["race/ethnicity"]},
+    "parental level of education": edu_label,
+    "lunch": {"standard": "Standard", "free/reduced": "Bersubsidi"},
+    "test preparation course": test_label,
+}
+nama_fitur = {
+    "gender": "Jenis Kelamin",
+    "race/ethnicity": "Kelompok Etnis",
+    "parental level of education": "Pendidikan Orang Tua",
+    "lunch": "Makan Siang",
+    "test preparation course": "Kursus Persiapan",
+}
+prefix_fitur = {
+    "gender": "Jenis Kelamin ",
+    "race/ethnicity": "",
+    "parental level of education": "Pendidikan Ortu: ",
+    "lunch": "Makan Siang ",
+    "test preparation course": "Kursus Persiapan: ",
+}
+
+
+def label_fitur(feature_name):
+    """Label Indonesia untuk nama kolom dummy, misal 'lunch_standard'."""
+    for kolom, label in label_singkat.items():
+        if feature_name.startswith(f"{kolom}_"):
+            return prefix_fitur[kolom] + label[feature_name[len(kolom) + 1:]]
+    return feature_name
 
 # ========================================
 # HEADER
@@ -48,43 +249,47 @@ st.markdown("---")
 # ========================================
 # PENJELASAN SISTEM (UNTUK PRESENTASI)
 # ========================================
-with st.expander("📖 Tentang Sistem Ini", expanded=False):
-    st.markdown("### 🎯 Konsep Sistem")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("**📌 Input (5 Fitur):**")
-        st.info("""
-        1. Jenis Kelamin
-        2. Kelompok Etnis (A-E)
-        3. Pendidikan Orang Tua
-        4. Tipe Makan Siang
-        5. Kursus Persiapan Ujian
-        """)
+@st.cache_data(show_spinner=False, max_entries=MAKS_ENTRI_CACHE)
+def render_tentang_sistem(stats):
+    # Konten statis (di sini & render_tabs_informasi): dibangun sekali,
+    # rerun berikutnya cukup replay dari cache
+    with st.expander("📖 Tentang Sistem Ini", expanded=False):
+        st.markdown("### 🎯 Konsep Sistem")
         
-        st.markdown("**📌 Output:**")
-        st.success("""
-        - Prediksi Nilai (0-100)
-        - Kategori Nilai
-        - Insight & Penjelasan
-        """)
-    
-    with col2:
-        st.markdown("**🤖 Model:**")
-        st.warning("""
-        **Algoritma:** Linear Regression
+        col1, col2 = st.columns(2)
         
-        **Dataset:** 1000 siswa
+        with col1:
+            st.markdown("**📌 Input (5 Fitur):**")
+            st.info("""
+            1. Jenis Kelamin
+            2. Kelompok Etnis (A-E)
+            3. Pendidikan Orang Tua
+            4. Tipe Makan Siang
+            5. Kursus Persiapan Ujian
+            """)
+            
+            st.markdown("**📌 Output:**")
+            st.success("""
+            - Prediksi Nilai (0-100)
+            - Kategori Nilai
+            - Insight & Penjelasan
+            """)
         
-        **Metode:** Ordinary Least Squares (OLS)
+        with col2:
+            st.markdown("**🤖 Model:**")
+            st.warning(f"""
+            **Algoritma:** Linear Regression
+            
+            **Dataset:** {stats['nilai']['jumlah']} siswa
+            
+            **Metode:** Ordinary Least Squares (OLS)
+            
+            **Akurasi:** MAE ±{stats['metrics']['mae']:.2f} poin
+            """)
         
-        **Akurasi:** MAE ±11.27 poin
-        """)
-    
-    st.markdown("---")
-    st.markdown("### 🏗️ Arsitektur Sistem")
-    st.code("""
+        st.markdown("---")
+        st.markdown("### 🏗️ Arsitektur Sistem")
+        st.code("""
     Input Pengguna (5 Fitur)
            ↓
     Antarmuka Streamlit
@@ -93,612 +298,896 @@ with st.expander("📖 Tentang Sistem Ini", expanded=False):
            ↓
     Prediksi Nilai Matematika
     """, language="")
-    
-    st.markdown("---")
-    st.markdown("### 📊 Apa itu Kelompok Etnis A-E?")
-    
-    st.warning("""
-    **PENTING:** Kelompok A-E adalah klasifikasi **DEMOGRAFI** berdasarkan 
-    **latar belakang SOSIAL-EKONOMI**, BUKAN tentang ras atau suku bangsa.
-    """)
-    
-    # Tabel rata-rata per kelompok
-    kelompok_data = {
-        "Kelompok": ["Kelompok E", "Kelompok D", "Kelompok C", "Kelompok B", "Kelompok A"],
-        "Rata-rata Nilai": [73.82, 67.36, 64.46, 63.45, 61.63],
-        "Jumlah Siswa": [140, 262, 319, 190, 89],
-        "Status": ["⭐ Tertinggi", "✅ Tinggi", "📊 Menengah", "📉 Rendah", "⚠️ Terendah"]
-    }
-    st.dataframe(kelompok_data, use_container_width=True)
-    
-    st.info("""
-    **Insight:** Perbedaan 12.19 poin antara Kelompok E dan A menunjukkan 
-    **pengaruh SIGNIFIKAN** latar belakang sosial-ekonomi terhadap prestasi akademik.
-    
-    Kelompok ini mencerminkan:
-    - Status ekonomi keluarga
-    - Lokasi geografis (urban vs rural)  
-    - Akses ke sumber daya pendidikan
-    - Lingkungan sosial
-    """)
+        
+        st.markdown("---")
+        st.markdown("### 📊 Apa itu Kelompok Etnis A-E?")
+        
+        st.warning("""
+        **PENTING:** Kelompok A-E adalah klasifikasi **DEMOGRAFI** berdasarkan 
+        **latar belakang SOSIAL-EKONOMI**, BUKAN tentang ras atau suku bangsa.
+        """)
+        
+        # Tabel rata-rata per kelompok
+        ranking = ranking_kelompok(stats)
+        kelompok_data = {
+            "Kelompok": [label_singkat["race/ethnicity"][kelompok] for kelompok, _ in ranking],
+            "Rata-rata Nilai": [round(ringkasan["mean"], 2) for _, ringkasan in ranking],
+            "Jumlah Siswa": [ringkasan["jumlah"] for _, ringkasan in ranking],
+            "Status": ["⭐ Tertinggi", "✅ Tinggi", "📊 Menengah", "📉 Rendah", "⚠️ Terendah"][:len(ranking)]
+        }
+        st.dataframe(kelompok_data, use_container_width=True)
+        
+        tertinggi, terendah, gap = gap_kategori(stats, "race/ethnicity")
+        st.info(f"""
+        **Insight:** Perbedaan {gap:.2f} poin antara {label_singkat["race/ethnicity"][tertinggi]} dan {terendah[-1]} menunjukkan 
+        **pengaruh SIGNIFIKAN** latar belakang sosial-ekonomi terhadap prestasi akademik.
+        
+        Kelompok ini mencerminkan:
+        - Status ekonomi keluarga
+        - Lokasi geografis (urban vs rural)  
+        - Akses ke sumber daya pendidikan
+        - Lingkungan sosial
+        """)
+
+
+render_tentang_sistem(stats)
 
 st.markdown("---")
 
 # ========================================
 # TABS INFORMASI LENGKAP
 # ========================================
-tab1, tab2, tab3, tab4 = st.tabs(["🎯 Cara Kerja", "📊 Analisis Data", "🤖 Algoritma", "💡 Insight"])
+@st.cache_data(show_spinner=False, max_entries=MAKS_ENTRI_CACHE)
+def render_tabs_informasi(stats, skenario):
+    tab1, tab2, tab3, tab4 = st.tabs(["🎯 Cara Kerja", "📊 Analisis Data", "🤖 Algoritma", "💡 Insight"])
 
-with tab1:
-    st.markdown("## 🎯 Cara Kerja Sistem")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("### 1️⃣ Input")
-        st.info("""
-        User memasukkan 5 faktor sosial:
-        - Jenis Kelamin
-        - Kelompok Etnis
-        - Pendidikan Orang Tua
-        - Tipe Makan Siang
-        - Kursus Persiapan
+    with tab1:
+        st.markdown("## 🎯 Cara Kerja Sistem")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown("### 1️⃣ Input")
+            st.info("""
+            User memasukkan 5 faktor sosial:
+            - Jenis Kelamin
+            - Kelompok Etnis
+            - Pendidikan Orang Tua
+            - Tipe Makan Siang
+            - Kursus Persiapan
+            """)
+        
+        with col2:
+            st.markdown("### 2️⃣ Proses")
+            st.warning("""
+            Model Linear Regression:
+            - Encoding One-Hot
+            - Kalkulasi koefisien
+            - Formula: y = β₀ + Σ(βᵢXᵢ)
+            - Prediksi nilai
+            """)
+        
+        with col3:
+            st.markdown("### 3️⃣ Output")
+            st.success("""
+            Hasil prediksi:
+            - Nilai matematika (0-100)
+            - Kategori prestasi
+            - Insight & rekomendasi
+            - Visual progress bar
+            """)
+        
+        st.markdown("---")
+        st.markdown("### 🏗️ Arsitektur Sistem")
+        
+        col1, col2, col3, col4, col5 = st.columns([1, 0.3, 1, 0.3, 1])
+        
+        with col1:
+            st.info("**USER INPUT**\n\n5 Fitur Sosial")
+        
+        with col2:
+            st.markdown("### →")
+        
+        with col3:
+            st.warning("**STREAMLIT UI**\n\nEncoding & Validasi")
+        
+        with col4:
+            st.markdown("### →")
+        
+        with col5:
+            st.success("**ML MODEL**\n\nPrediksi Nilai")
+
+    with tab2:
+        st.markdown("## 📊 Analisis Data - Objektif & Terbukti")
+        
+        nilai = stats["nilai"]
+        st.info(f"**Dataset:** {nilai['jumlah']} siswa | **Missing Values:** {stats['missing']} | "
+                f"**Fitur:** {len(KOLOM_FITUR)} input + {len(KOLOM_SKOR)} target")
+        
+        st.markdown("### 📈 Statistik Nilai Matematika")
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Rata-rata", f"{nilai['mean']:.2f}", help=f"Mean dari {nilai['jumlah']} siswa")
+        
+        with col2:
+            st.metric("Median", f"{nilai['median']:.2f}", help="Nilai tengah")
+        
+        with col3:
+            st.metric("Std Dev", f"{nilai['std']:.2f}", help="Standar deviasi")
+        
+        with col4:
+            st.metric("Range", f"{nilai['min']:.0f}-{nilai['max']:.0f}", help="Minimum - Maximum")
+        
+        st.markdown("---")
+        st.markdown("### 🔍 Gap Sosial-Ekonomi (TERBUKTI DARI DATA)")
+        
+        faktor_gap = {
+            "Tipe Makan Siang": "lunch",
+            "Kelompok Etnis": "race/ethnicity",
+            "Kursus Persiapan": "test preparation course",
+            "Jenis Kelamin": "gender",
+        }
+        gap_data = {"Faktor": [], "Kategori Tinggi": [], "Kategori Rendah": [], "Gap": [], "Dampak": []}
+        semua_gap = []
+        for faktor, kolom in faktor_gap.items():
+            tinggi, rendah, gap = gap_kategori(stats, kolom)
+            semua_gap.append(gap)
+            per_nilai = stats["per_kategori"][kolom]
+            gap_data["Faktor"].append(faktor)
+            gap_data["Kategori Tinggi"].append(f"{label_singkat[kolom][tinggi]} ({per_nilai[tinggi]['mean']:.2f})")
+            gap_data["Kategori Rendah"].append(f"{label_singkat[kolom][rendah]} ({per_nilai[rendah]['mean']:.2f})")
+            gap_data["Gap"].append(f"+{gap:.2f} poin")
+            gap_data["Dampak"].append("⭐ Tertinggi" if gap >= 10 else "✅ Signifikan")
+        
+        st.dataframe(gap_data, use_container_width=True)
+        
+        # Rentang dua gap terbesar (faktor sosial-ekonomi terkuat)
+        gap_kedua, gap_terbesar = sorted(semua_gap)[-2:]
+        st.success(f"""
+        **Kesimpulan:**
+        - Faktor sosial-ekonomi **TERBUKTI** mempengaruhi nilai secara signifikan
+        - Gap {gap_kedua:.0f}-{gap_terbesar:.0f} poin adalah perbedaan **BESAR** dalam skala 0-100
+        - Kursus persiapan adalah faktor yang **BISA DIINTERVENSI** oleh sekolah
         """)
-    
-    with col2:
-        st.markdown("### 2️⃣ Proses")
+        
+        st.markdown("---")
+        st.markdown("### 📊 Distribusi Kelompok Etnis")
+        
+        ranking = ranking_kelompok(stats)
+        kelompok_detail = {
+            "Kelompok": [label_singkat["race/ethnicity"][kelompok] for kelompok, _ in ranking],
+            "Jumlah Siswa": [ringkasan["jumlah"] for _, ringkasan in ranking],
+            "Persentase": [f"{ringkasan['jumlah'] / nilai['jumlah'] * 100:.1f}%" for _, ringkasan in ranking],
+            "Rata-rata Nilai": [round(ringkasan["mean"], 2) for _, ringkasan in ranking],
+            "Median": [ringkasan["median"] for _, ringkasan in ranking],
+            "Status": ["⭐ Terbaik", "✅ Baik", "📊 Menengah", "📉 Kurang", "⚠️ Rendah"][:len(ranking)]
+        }
+        
+        st.dataframe(kelompok_detail, use_container_width=True)
+        
         st.warning("""
-        Model Linear Regression:
-        - Encoding One-Hot
-        - Kalkulasi koefisien
-        - Formula: y = β₀ + Σ(βᵢXᵢ)
-        - Prediksi nilai
+        **PENTING:** Kelompok A-E adalah klasifikasi **DEMOGRAFI SOSIAL-EKONOMI**, 
+        BUKAN tentang ras/suku bangsa. Mencerminkan:
+        - Status ekonomi keluarga
+        - Lokasi geografis (urban vs rural)
+        - Akses ke sumber daya pendidikan
+        - Lingkungan sosial
         """)
-    
-    with col3:
-        st.markdown("### 3️⃣ Output")
-        st.success("""
-        Hasil prediksi:
-        - Nilai matematika (0-100)
-        - Kategori prestasi
-        - Insight & rekomendasi
-        - Visual progress bar
+
+    with tab3:
+        st.markdown("## 🤖 Algoritma & Training")
+        
+        st.markdown("### 📚 Linear Regression")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Apa itu Linear Regression?**")
+            st.info("""
+            Algoritma **supervised learning** yang memodelkan hubungan linear 
+            antara variabel input (X) dan output (y).
+            
+            **Formula:**
+            ```
+            y = β₀ + β₁X₁ + β₂X₂ + ... + βₙXₙ
+            ```
+            
+            **Dimana:**
+            - y = Prediksi nilai matematika
+            - β₀ = Intercept (konstanta)
+            - βᵢ = Koefisien fitur ke-i
+            - Xᵢ = Nilai fitur ke-i
+            """)
+            
+            st.markdown("**Kenapa Linear Regression?**")
+            st.success("""
+            ✅ **Interpretable** - Koefisien jelas
+            ✅ **Cepat** - Training <1 detik
+            ✅ **Simple** - Tidak overfitting
+            ✅ **Explainable** - Mudah dijelaskan
+            """)
+        
+        with col2:
+            metrics = stats["metrics"]
+            st.markdown("**Proses Training:**")
+            st.warning(f"""
+            **1. Preprocessing**
+            - One-Hot Encoding
+            - 5 fitur → {len(stats['koefisien'])} kolom binary
+            
+            **2. Split Data**
+            - Training: {metrics['n_train']} siswa ({metrics['n_train'] / (metrics['n_train'] + metrics['n_test']):.0%})
+            - Testing: {metrics['n_test']} siswa ({metrics['n_test'] / (metrics['n_train'] + metrics['n_test']):.0%})
+            
+            **3. Training**
+            - Metode: OLS (Ordinary Least Squares)
+            - Objective: Minimize Σ(y - ŷ)²
+            - Waktu: <1 detik
+            
+            **4. Evaluasi**
+            - MAE: {metrics['mae']:.2f} poin
+            - RMSE: {metrics['rmse']:.2f} poin
+            - R²: {metrics['r2']:.3f} ({metrics['r2'] * 100:.1f}%)
+            
+            **5. Save Model**
+            - model.pkl ({ukuran_file("model.pkl")})
+            """)
+        
+        st.markdown("---")
+        st.markdown("### 🔍 Koefisien Model (Interpretasi)")
+        
+        st.info(f"**Intercept (β₀):** {stats['intercept']:.2f} - Nilai dasar sebelum faktor lain")
+        
+        koefisien = sorted(stats["koefisien"].items(), key=lambda item: item[1], reverse=True)
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Top 3 Positif (Meningkatkan Nilai):**")
+            koef_positif = {
+                "Fitur": [label_fitur(fitur) for fitur, _ in koefisien[:3]],
+                "Koefisien": [f"{nilai:+.2f}" for _, nilai in koefisien[:3]],
+            }
+            st.dataframe(koef_positif, use_container_width=True)
+        
+        with col2:
+            st.markdown("**Top 3 Negatif (Menurunkan Nilai):**")
+            koef_negatif = {
+                "Fitur": [label_fitur(fitur) for fitur, _ in koefisien[::-1][:3]],
+                "Koefisien": [f"{nilai:+.2f}" for _, nilai in koefisien[::-1][:3]],
+            }
+            st.dataframe(koef_negatif, use_container_width=True)
+        
+        st.markdown("---")
+        st.markdown("### 📊 Evaluasi Model")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric(
+                "MAE",
+                f"{metrics['mae']:.2f} poin",
+                help=f"Mean Absolute Error - rata-rata meleset ±{metrics['mae']:.0f} poin"
+            )
+        
+        with col2:
+            st.metric(
+                "RMSE",
+                f"{metrics['rmse']:.2f} poin",
+                help="Root Mean Squared Error - lebih sensitif terhadap error besar"
+            )
+        
+        with col3:
+            st.metric(
+                "R²",
+                f"{metrics['r2'] * 100:.1f}%",
+                help=f"Model menjelaskan {metrics['r2'] * 100:.1f}% variasi nilai"
+            )
+        
+        st.warning(f"""
+        **❓ Kenapa R² hanya {metrics['r2'] * 100:.1f}%?**
+        
+        Model HANYA menggunakan **5 faktor sosial-demografis**. 
+        
+        Sisanya ({(1 - metrics['r2']) * 100:.1f}%) dipengaruhi faktor lain yang tidak ada di dataset:
+        - IQ / kemampuan kognitif
+        - Motivasi belajar
+        - Jam belajar per hari
+        - Kualitas guru/sekolah
+        - Metode pembelajaran
+        - Dukungan keluarga (non-material)
+        - Kondisi kesehatan
+        
+        **R² {metrics['r2'] * 100:.1f}% menunjukkan faktor sosial MEMANG berpengaruh signifikan!**
+        Ini WAJAR dan OBJEKTIF untuk model berbasis faktor sosial saja.
         """)
-    
-    st.markdown("---")
-    st.markdown("### 🏗️ Arsitektur Sistem")
-    
-    col1, col2, col3, col4, col5 = st.columns([1, 0.3, 1, 0.3, 1])
-    
-    with col1:
-        st.info("**USER INPUT**\n\n5 Fitur Sosial")
-    
-    with col2:
-        st.markdown("### →")
-    
-    with col3:
-        st.warning("**STREAMLIT UI**\n\nEncoding & Validasi")
-    
-    with col4:
-        st.markdown("### →")
-    
-    with col5:
-        st.success("**ML MODEL**\n\nPrediksi Nilai")
+        
+        st.markdown("---")
+        st.markdown("### ⚖️ Error Model per Kelompok")
+        
+        error_subgroup = stats["error_subgroup"]
+        keseluruhan = error_subgroup.iloc[0]
+        per_kelompok = error_subgroup[error_subgroup["level"] == 1]
+        st.dataframe({
+            "Kelompok": [
+                f"{nama_fitur[kolom]}: {label_singkat[kolom][baris[kolom]]}"
+                for _, baris in per_kelompok.iterrows()
+                for kolom in KOLOM_FITUR if isinstance(baris[kolom], str)
+            ],
+            "Jumlah Siswa": per_kelompok["n"].tolist(),
+            "MAE": [f"{nilai:.2f}" for nilai in per_kelompok["mae"]],
+            "Bias": [f"{nilai:+.2f}" for nilai in per_kelompok["bias"]],
+        }, use_container_width=True, hide_index=True)
+        
+        # Irisan dua fitur dengan error terbesar (hanya yang jumlah siswanya cukup)
+        irisan = error_subgroup[(error_subgroup["level"] == 2) & (error_subgroup["n"] >= MIN_N)]
+        if not irisan.empty:
+            terburuk = irisan.loc[irisan["mae"].idxmax()]
+            label_irisan = " & ".join(
+                f"{nama_fitur[kolom]} {label_singkat[kolom][terburuk[kolom]]}"
+                for kolom in KOLOM_FITUR if isinstance(terburuk[kolom], str)
+            )
+            st.caption(
+                f"Irisan dengan error terbesar: {label_irisan} - MAE {terburuk['mae']:.2f} "
+                f"({terburuk['n']} siswa) vs {keseluruhan['mae']:.2f} keseluruhan."
+            )
+        st.caption(
+            "Dihitung pada seluruh dataset. Bias positif = model memprediksi terlalu rendah "
+            "untuk kelompok itu, negatif = terlalu tinggi."
+        )
 
-with tab2:
-    st.markdown("## 📊 Analisis Data - Objektif & Terbukti")
-    
-    st.info("**Dataset:** 1000 siswa | **Missing Values:** 0 | **Fitur:** 5 input + 3 target")
-    
-    st.markdown("### 📈 Statistik Nilai Matematika")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Rata-rata", "66.09", help="Mean dari 1000 siswa")
-    
-    with col2:
-        st.metric("Median", "66.00", help="Nilai tengah")
-    
-    with col3:
-        st.metric("Std Dev", "15.16", help="Standar deviasi")
-    
-    with col4:
-        st.metric("Range", "0-100", help="Minimum - Maximum")
-    
-    st.markdown("---")
-    st.markdown("### 🔍 Gap Sosial-Ekonomi (TERBUKTI DARI DATA)")
-    
-    gap_data = {
-        "Faktor": [
-            "Tipe Makan Siang",
-            "Kelompok Etnis",
-            "Kursus Persiapan",
-            "Jenis Kelamin"
-        ],
-        "Kategori Tinggi": [
-            "Standard (70.03)",
-            "Kelompok E (73.82)",
-            "Selesai (69.70)",
-            "Laki-laki (68.73)"
-        ],
-        "Kategori Rendah": [
-            "Bersubsidi (58.92)",
-            "Kelompok A (61.63)",
-            "Tidak Ikut (64.08)",
-            "Perempuan (63.63)"
-        ],
-        "Gap": [
-            "+11.11 poin",
-            "+12.19 poin",
-            "+5.62 poin",
-            "+5.10 poin"
-        ],
-        "Dampak": ["⭐ Tertinggi", "⭐ Tertinggi", "✅ Signifikan", "✅ Signifikan"]
-    }
-    
-    st.dataframe(gap_data, use_container_width=True)
-    
-    st.success("""
-    **Kesimpulan:**
-    - Faktor sosial-ekonomi **TERBUKTI** mempengaruhi nilai secara signifikan
-    - Gap 11-12 poin adalah perbedaan **BESAR** dalam skala 0-100
-    - Kursus persiapan adalah faktor yang **BISA DIINTERVENSI** oleh sekolah
-    """)
-    
-    st.markdown("---")
-    st.markdown("### 📊 Distribusi Kelompok Etnis")
-    
-    kelompok_detail = {
-        "Kelompok": ["Kelompok E", "Kelompok D", "Kelompok C", "Kelompok B", "Kelompok A"],
-        "Jumlah Siswa": [140, 262, 319, 190, 89],
-        "Persentase": ["14%", "26.2%", "31.9%", "19%", "8.9%"],
-        "Rata-rata Nilai": [73.82, 67.36, 64.46, 63.45, 61.63],
-        "Median": [74.5, 69.0, 65.0, 63.0, 61.0],
-        "Status": ["⭐ Terbaik", "✅ Baik", "📊 Menengah", "📉 Kurang", "⚠️ Rendah"]
-    }
-    
-    st.dataframe(kelompok_detail, use_container_width=True)
-    
-    st.warning("""
-    **PENTING:** Kelompok A-E adalah klasifikasi **DEMOGRAFI SOSIAL-EKONOMI**, 
-    BUKAN tentang ras/suku bangsa. Mencerminkan:
-    - Status ekonomi keluarga
-    - Lokasi geografis (urban vs rural)
-    - Akses ke sumber daya pendidikan
-    - Lingkungan sosial
-    """)
-
-with tab3:
-    st.markdown("## 🤖 Algoritma & Training")
-    
-    st.markdown("### 📚 Linear Regression")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("**Apa itu Linear Regression?**")
-        st.info("""
-        Algoritma **supervised learning** yang memodelkan hubungan linear 
-        antara variabel input (X) dan output (y).
-        
-        **Formula:**
-        ```
-        y = β₀ + β₁X₁ + β₂X₂ + ... + βₙXₙ
-        ```
-        
-        **Dimana:**
-        - y = Prediksi nilai matematika
-        - β₀ = Intercept (konstanta)
-        - βᵢ = Koefisien fitur ke-i
-        - Xᵢ = Nilai fitur ke-i
+    with tab4:
+        st.markdown("## 💡 Insight Penting")
+        
+        st.markdown("### 🎯 Temuan Utama")
+        
+        # Faktor terkuat = koefisien dengan nilai mutlak terbesar di model aktif
+        terkuat, koef_terkuat = max(stats["koefisien"].items(), key=lambda item: abs(item[1]))
+        st.success(f"""
+        **1. {label_fitur(terkuat)} = Faktor Terkuat ({koef_terkuat:+.2f} poin)**
+        
+        Dengan faktor lain sama, {label_fitur(terkuat)} mengubah prediksi {koef_terkuat:+.2f} poin 
+        dibanding kategori dasarnya - pengaruh terbesar di model. Makan siang adalah indikator 
+        kuat kondisi ekonomi keluarga: siswa dengan makan siang standard memiliki nilai rata-rata 
+        {gap_kategori(stats, 'lunch')[2]:.0f} poin lebih tinggi dibanding siswa yang dapat subsidi makan.
         """)
         
-        st.markdown("**Kenapa Linear Regression?**")
-        st.success("""
-        ✅ **Interpretable** - Koefisien jelas
-        ✅ **Cepat** - Training <1 detik
-        ✅ **Simple** - Tidak overfitting
-        ✅ **Explainable** - Mudah dijelaskan
+        kelompok_tinggi, kelompok_rendah, gap_kelompok = gap_kategori(stats, "race/ethnicity")
+        st.info(f"""
+        **2. Kelompok Etnis = Pengaruh Signifikan (+{gap_kelompok:.2f} poin gap)**
+        
+        Perbedaan {gap_kelompok:.0f} poin antara {label_singkat['race/ethnicity'][kelompok_tinggi]} dan {label_singkat['race/ethnicity'][kelompok_rendah]} menunjukkan latar belakang 
+        sosial-ekonomi sangat mempengaruhi prestasi. Ini bukan tentang ras, 
+        tapi tentang akses ke sumber daya pendidikan.
         """)
-    
-    with col2:
-        st.markdown("**Proses Training:**")
-        st.warning("""
-        **1. Preprocessing**
-        - One-Hot Encoding
-        - 5 fitur → 12 kolom binary
-        
-        **2. Split Data**
-        - Training: 800 siswa (80%)
-        - Testing: 200 siswa (20%)
-        
-        **3. Training**
-        - Metode: OLS (Ordinary Least Squares)
-        - Objective: Minimize Σ(y - ŷ)²
-        - Waktu: <1 detik
-        
-        **4. Evaluasi**
-        - MAE: 11.27 poin
-        - RMSE: 14.16 poin
-        - R²: 0.176 (17.6%)
-        
-        **5. Save Model**
-        - model.pkl (1.4 KB)
+        
+        st.warning(f"""
+        **3. Kursus Persiapan = Faktor yang BISA DIINTERVENSI (+{gap_kategori(stats, 'test preparation course')[2]:.2f} poin)**
+        
+        Ini adalah INSIGHT PALING PENTING! Walaupun faktor ekonomi sulit diubah, 
+        sekolah BISA memberikan intervensi melalui program kursus persiapan ujian.
+        
+        **Rekomendasi:** Fokuskan program persiapan untuk siswa dari keluarga 
+        kurang mampu (yang dapat makan siang bersubsidi).
         """)
-    
-    st.markdown("---")
-    st.markdown("### 🔍 Koefisien Model (Interpretasi)")
-    
-    st.info("**Intercept (β₀):** 59.09 - Nilai dasar sebelum faktor lain")
+        
+        st.markdown("---")
+        st.markdown("### 🎓 Rekomendasi untuk Sekolah")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**✅ Apa yang BISA dilakukan:**")
+            st.success(f"""
+            1. **Program Kursus Gratis**
+               - Untuk siswa kurang mampu
+               - Fokus persiapan ujian
+               - Dampak: {skenario['profil']['rata_delta_terdampak']:+.1f} poin
+            
+            2. **Identifikasi Siswa Berisiko**
+               - Dari Kelompok A/B
+               - Orang tua pendidikan rendah
+               - Dapat makan siang bersubsidi
+            
+            3. **Program Mentoring**
+               - Peer tutoring
+               - Bimbingan akademik
+               - Dukungan psikososial
+            """)
+        
+        with col2:
+            st.markdown("**⚠️ Apa yang SULIT diubah:**")
+            st.warning("""
+            1. **Kondisi Ekonomi Keluarga**
+               - Butuh kebijakan makro
+               - Di luar kendali sekolah
+               
+            2. **Pendidikan Orang Tua**
+               - Sudah permanen
+               - Tidak bisa diubah
+               
+            3. **Latar Belakang Sosial**
+               - Faktor sistemik
+               - Butuh intervensi jangka panjang
+            """)
+        
+        st.markdown("---")
+        st.markdown("### 📈 Proyeksi Dampak Intervensi")
+        
+        profil = skenario["profil"]
+        kohort = skenario["kohort"]
+        st.info(f"""
+        **Skenario: Siswa Kurang Mampu**
+        - Kondisi awal: Kelompok A, Orang tua SMA tidak lulus, Makan siang bersubsidi
+        - Prediksi tanpa intervensi: ~{profil['rata_baseline']:.0f} poin
+        
+        **Jika diberi program kursus persiapan:**
+        - Prediksi dengan intervensi: ~{profil['rata_counterfactual']:.0f} poin ({profil['rata_delta']:+.2f} poin)
+        - Peningkatan: {profil['rata_delta'] / profil['rata_baseline'] * 100:.1f}%
+        - ROI: Tinggi (program murah, dampak signifikan)
+        
+        **Untuk seluruh {kohort['jumlah_siswa']} siswa di dataset:**
+        - {kohort['siswa_terdampak']} siswa bersubsidi belum ikut kursus → masing-masing {kohort['rata_delta_terdampak']:+.2f} poin
+        - Rata-rata seluruh siswa: {kohort['rata_baseline']:.2f} → {kohort['rata_counterfactual']:.2f} ({kohort['rata_delta']:+.2f} poin)
+        """)
+        
+        st.success("""
+        **Kesimpulan:** Investasi dalam program persiapan ujian untuk siswa 
+        kurang mampu adalah strategi cost-effective untuk meningkatkan prestasi 
+        akademik dan mengurangi kesenjangan sosial-ekonomi.
+        """)
+
+
+render_tabs_informasi(stats, skenario)
+
+st.markdown("---")
+
+# ========================================
+# FORM INPUT
+# ========================================
+
+@st.fragment
+def form_prediksi():
+    """
+    Form input + hasil prediksi sebagai fragment: mengubah selectbox atau
+    klik tombol hanya me-rerun fungsi ini, bukan seluruh app.py.
+    """
+    st.markdown("## 📝 Masukkan Data Siswa")
+    
+    # Satu snapshot per rerun: semua prediksi di bawah memakai versi model yang sama
+    aktif = model_holder.get()
+    info_model(aktif)
+    monitor = get_drift_monitor(file_signature(DATASET_PATH), aktif.model.checksum, aktif)
     
     col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("**Top 3 Positif (Meningkatkan Nilai):**")
-        koef_positif = {
-            "Fitur": [
-                "Makan Siang Standard",
-                "Kelompok E",
-                "Jenis Kelamin Laki-laki"
-            ],
-            "Koefisien": ["+11.52", "+9.08", "+4.52"],
-            "Interpretasi": [
-                "⭐ Paling berpengaruh!",
-                "Latar belakang terbaik",
-                "Cenderung lebih tinggi"
-            ]
-        }
-        st.dataframe(koef_positif, use_container_width=True)
-    
-    with col2:
-        st.markdown("**Top 3 Negatif (Menurunkan Nilai):**")
-        koef_negatif = {
-            "Fitur": [
-                "Tidak Ikut Kursus",
-                "Pendidikan Ortu: SMA",
-                "Pendidikan Ortu: <SMA"
-            ],
-            "Koefisien": ["-5.87", "-4.09", "-2.90"],
-            "Interpretasi": [
-                "⚠️ Bisa diintervensi!",
-                "Dukungan terbatas",
-                "Dukungan minimal"
-            ]
-        }
-        st.dataframe(koef_negatif, use_container_width=True)
-    
-    st.markdown("---")
-    st.markdown("### 📊 Evaluasi Model")
-    
-    col1, col2, col3 = st.columns(3)
-    
+
     with col1:
-        st.metric(
-            "MAE",
-            "11.27 poin",
-            help="Mean Absolute Error - rata-rata meleset ±11 poin"
+        gender = st.selectbox(
+            "👤 Jenis Kelamin",
+            OPSI_FITUR["gender"],
+            format_func=lambda x: gender_label[x],
+            help="Jenis kelamin siswa"
         )
-    
-    with col2:
-        st.metric(
-            "RMSE",
-            "14.16 poin",
-            help="Root Mean Squared Error - lebih sensitif terhadap error besar"
+        
+        race = st.selectbox(
+            "🌍 Kelompok Etnis",
+            OPSI_FITUR["race/ethnicity"],
+            format_func=lambda x: race_label[x],
+            help="Kelompok demografi siswa (A-E berdasarkan latar belakang sosial-ekonomi)"
         )
-    
-    with col3:
-        st.metric(
-            "R²",
-            "17.6%",
-            help="Model menjelaskan 17.6% variasi nilai"
+        
+        lunch = st.selectbox(
+            "🍽️ Tipe Makan Siang",
+            OPSI_FITUR["lunch"],
+            format_func=lambda x: lunch_label[x],
+            help="Tipe makan siang yang diterima siswa"
         )
-    
-    st.warning("""
-    **❓ Kenapa R² hanya 17.6%?**
-    
-    Model HANYA menggunakan **5 faktor sosial-demografis**. 
-    
-    Sisanya (82.4%) dipengaruhi faktor lain yang tidak ada di dataset:
-    - IQ / kemampuan kognitif
-    - Motivasi belajar
-    - Jam belajar per hari
-    - Kualitas guru/sekolah
-    - Metode pembelajaran
-    - Dukungan keluarga (non-material)
-    - Kondisi kesehatan
-    
-    **R² 17.6% menunjukkan faktor sosial MEMANG berpengaruh signifikan!**
-    Ini WAJAR dan OBJEKTIF untuk model berbasis faktor sosial saja.
-    """)
 
-with tab4:
-    st.markdown("## 💡 Insight Penting")
-    
-    st.markdown("### 🎯 Temuan Utama")
-    
-    st.success("""
-    **1. Makan Siang Standard = Faktor Terkuat (+11.52 poin)**
-    
-    Ini adalah indikator kuat kondisi ekonomi keluarga. Siswa dari keluarga 
-    mampu (makan siang standard) memiliki nilai 11 poin lebih tinggi dibanding 
-    siswa yang dapat subsidi makan.
-    """)
-    
-    st.info("""
-    **2. Kelompok Etnis = Pengaruh Signifikan (+12.19 poin gap)**
-    
-    Perbedaan 12 poin antara Kelompok E dan A menunjukkan latar belakang 
-    sosial-ekonomi sangat mempengaruhi prestasi. Ini bukan tentang ras, 
-    tapi tentang akses ke sumber daya pendidikan.
-    """)
-    
-    st.warning("""
-    **3. Kursus Persiapan = Faktor yang BISA DIINTERVENSI (+5.62 poin)**
-    
-    Ini adalah INSIGHT PALING PENTING! Walaupun faktor ekonomi sulit diubah, 
-    sekolah BISA memberikan intervensi melalui program kursus persiapan ujian.
-    
-    **Rekomendasi:** Fokuskan program persiapan untuk siswa dari keluarga 
-    kurang mampu (yang dapat makan siang bersubsidi).
-    """)
-    
-    st.markdown("---")
-    st.markdown("### 🎓 Rekomendasi untuk Sekolah")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("**✅ Apa yang BISA dilakukan:**")
-        st.success("""
-        1. **Program Kursus Gratis**
-           - Untuk siswa kurang mampu
-           - Fokus persiapan ujian
-           - Dampak: +5.6 poin
-        
-        2. **Identifikasi Siswa Berisiko**
-           - Dari Kelompok A/B
-           - Orang tua pendidikan rendah
-           - Dapat makan siang bersubsidi
-        
-        3. **Program Mentoring**
-           - Peer tutoring
-           - Bimbingan akademik
-           - Dukungan psikososial
-        """)
-    
     with col2:
-        st.markdown("**⚠️ Apa yang SULIT diubah:**")
-        st.warning("""
-        1. **Kondisi Ekonomi Keluarga**
-           - Butuh kebijakan makro
-           - Di luar kendali sekolah
-           
-        2. **Pendidikan Orang Tua**
-           - Sudah permanen
-           - Tidak bisa diubah
-           
-        3. **Latar Belakang Sosial**
-           - Faktor sistemik
-           - Butuh intervensi jangka panjang
-        """)
-    
+        parental_education = st.selectbox(
+            "🎓 Pendidikan Orang Tua",
+            OPSI_FITUR["parental level of education"],
+            format_func=lambda x: edu_label[x],
+            help="Tingkat pendidikan tertinggi orang tua/wali"
+        )
+        
+        test_prep = st.selectbox(
+            "📚 Kursus Persiapan Ujian",
+            OPSI_FITUR["test preparation course"],
+            format_func=lambda x: test_label[x],
+            help="Apakah siswa mengikuti kursus persiapan ujian"
+        )
+
     st.markdown("---")
-    st.markdown("### 📈 Proyeksi Dampak Intervensi")
-    
-    st.info("""
-    **Skenario: Siswa Kurang Mampu**
-    - Kondisi awal: Kelompok A, Orang tua SMA tidak lulus, Makan siang bersubsidi
-    - Prediksi tanpa intervensi: ~50 poin
-    
-    **Jika diberi program kursus persiapan:**
-    - Prediksi dengan intervensi: ~56 poin (+5.87 poin)
-    - Peningkatan: 11.7%
-    - ROI: Tinggi (program murah, dampak signifikan)
-    """)
-    
-    st.success("""
-    **Kesimpulan:** Investasi dalam program persiapan ujian untuk siswa 
-    kurang mampu adalah strategi cost-effective untuk meningkatkan prestasi 
-    akademik dan mengurangi kesenjangan sosial-ekonomi.
-    """)
 
-st.markdown("---")
+    # ========================================
+    # PREDIKSI
+    # ========================================
+    if st.button("🔮 Prediksi Nilai Matematika", type="primary", use_container_width=True):
+        
+        # Kode kategori (index opsi) untuk lookup di tabel prediksi
+        mulai = time.perf_counter()
+        kode = (
+            OPSI_FITUR["gender"].index(gender),
+            OPSI_FITUR["race/ethnicity"].index(race),
+            OPSI_FITUR["parental level of education"].index(parental_education),
+            OPSI_FITUR["lunch"].index(lunch),
+            OPSI_FITUR["test preparation course"].index(test_prep),
+        )
+        REGISTRY.observe("encode", time.perf_counter() - mulai)
+        
+        # Prediksi
+        try:
+            mulai = time.perf_counter()
+            # Satu lookup memberi semua target model (math, reading, writing,
+            # dibatasi 0-100) + interval bootstrap sel yang sama jika ada
+            nilai_target, rentang = predict_cell(aktif, kode)
+            prediction = nilai_target[TARGET]
+            if rentang:
+                level_interval = aktif.model.intervals["level"]
+            REGISTRY.observe("predict", time.perf_counter() - mulai)
+            
+            mulai = time.perf_counter()
+            # Tampilkan hasil
+            st.markdown("## 🎯 Hasil Prediksi")
+            
+            # Tampilan nilai prediksi besar
+            st.markdown(f"<h1 style='text-align: center; color: #1f77b4;'>{prediction:.1f}</h1>", 
+                        unsafe_allow_html=True)
+            st.markdown("<p style='text-align: center; font-size: 20px;'>Prediksi Nilai Matematika</p>", 
+                        unsafe_allow_html=True)
+            if TARGET in rentang:
+                bawah, atas = rentang[TARGET]
+                st.markdown(f"<p style='text-align: center; color: gray;'>Rentang {level_interval:.0%}: {bawah:.1f} – {atas:.1f}</p>", 
+                            unsafe_allow_html=True)
+            
+            # Progress bar visual
+            st.progress(prediction / 100)
+            
+            # Model multi-output: nilai membaca & menulis dari prediksi yang sama
+            if len(nilai_target) > 1:
+                for kolom, (target, nilai) in zip(st.columns(len(nilai_target)), nilai_target.items()):
+                    kolom.metric(target_label.get(target, target), f"{nilai:.1f}")
+                    if target in rentang:
+                        kolom.caption(f"Rentang {level_interval:.0%}: {rentang[target][0]:.1f} – {rentang[target][1]:.1f}")
+            
+            # Kategori nilai
+            if prediction >= 80:
+                kategori = "🌟 Sangat Baik"
+            elif prediction >= 70:
+                kategori = "✅ Baik"
+            elif prediction >= 60:
+                kategori = "⚠️ Cukup"
+            else:
+                kategori = "❌ Perlu Peningkatan"
+            
+            st.markdown(f"**Kategori:** {kategori}")
+            
+            # Penjelasan: prediksi diurai menjadi nilai dasar + kontribusi
+            # setiap fitur, langsung dari koefisien model aktif
+            st.markdown("### 💡 Penjelasan")
+            dasar, rincian = explain_student(kode, lookup_matematika(aktif))
+            st.caption(f"Prediksi = nilai dasar model {dasar:.1f} + kontribusi setiap fitur "
+                       "(relatif terhadap kategori dasar model)")
+            st.dataframe(pd.DataFrame({
+                "Fitur": [nama_fitur[r.kolom] for r in rincian],
+                "Nilai": [label_singkat[r.kolom][r.nilai] for r in rincian],
+                "Kontribusi": [f"{r.kontribusi:+.1f} poin" for r in rincian],
+            }), hide_index=True, use_container_width=True)
+            
+            terbesar = max(rincian, key=lambda r: r.kontribusi)
+            terkecil = min(rincian, key=lambda r: r.kontribusi)
+            if terbesar.kontribusi > 0:
+                st.success(f"✅ Faktor yang paling menaikkan prediksi: {nama_fitur[terbesar.kolom]} "
+                           f"{label_singkat[terbesar.kolom][terbesar.nilai]} ({terbesar.kontribusi:+.1f} poin)")
+            if terkecil.kontribusi < 0:
+                st.warning(f"⚠️ Faktor yang paling menurunkan prediksi: {nama_fitur[terkecil.kolom]} "
+                           f"{label_singkat[terkecil.kolom][terkecil.nilai]} ({terkecil.kontribusi:+.1f} poin)")
+            for r in rincian:
+                if r.kolom in FITUR_DAPAT_DIUBAH and r.potensi > 0:
+                    st.info(f"💡 Dengan {nama_fitur[r.kolom]} {label_singkat[r.kolom][r.nilai_terbaik]}, "
+                            f"prediksi naik {r.potensi:+.1f} poin.")
+            
+            kelompok_tertinggi, kelompok_terendah, _ = gap_kategori(stats, "race/ethnicity")
+            rata_kelompok = stats["per_kategori"]["race/ethnicity"]
+            
+            # Info tambahan
+            if rentang:
+                catatan_rentang = (f"Rentang: interval prediksi bootstrap {level_interval:.0%} untuk kombinasi input ini "
+                                   f"(sekitar {level_interval:.0%} siswa dengan profil sama mendapat nilai di dalamnya)")
+            else:
+                catatan_rentang = "Rentang prediksi belum tersedia untuk model ini (jalankan 'python main.py')"
+            with st.expander("ℹ️ Informasi Tambahan"):
+                st.markdown(f"""
+                **Data Input:**
+                - Jenis Kelamin: {gender_label[gender]}
+                - Kelompok Etnis: {race_label[race]}
+                - Pendidikan Orang Tua: {edu_label[parental_education]}
+                - Tipe Makan Siang: {lunch_label[lunch]}
+                - Kursus Persiapan: {test_label[test_prep]}
+                
+                **Tentang Kelompok Etnis:**
+                - Kelompok A-E adalah klasifikasi demografi dalam dataset
+                - Mencerminkan perbedaan latar belakang sosial-ekonomi
+                - {label_singkat['race/ethnicity'][kelompok_tertinggi]} (rata-rata {rata_kelompok[kelompok_tertinggi]['mean']:.1f}) vs {label_singkat['race/ethnicity'][kelompok_terendah]} (rata-rata {rata_kelompok[kelompok_terendah]['mean']:.1f})
+                - Ini menunjukkan pentingnya faktor sosial dalam prestasi akademik
+                
+                **Catatan:**
+                - Prediksi berdasarkan model Linear Regression
+                - Model dilatih menggunakan data {n_siswa} siswa
+                - Akurasi: MAE ±{metrics['mae']:.2f} poin
+                - {catatan_rentang}
+                - Prediksi bersifat estimasi, bukan penilaian pasti
+                """)
+            REGISTRY.observe("render", time.perf_counter() - mulai)
+            prediksi_dilayani.inc()
+            monitor.observe(np.array([kode]), [prediction])
+        
+        except Exception as e:
+            prediksi_error.inc()
+            st.error(f"❌ Terjadi kesalahan saat prediksi: {str(e)}")
+            st.info("Pastikan model sudah di-training dengan benar menggunakan 'python main.py'")
+        
+        # State drift ditulis bersama metrik (throttle yang sama)
+        if REGISTRY.write_file(METRICS_PATH, min_interval=INTERVAL_TULIS_METRIK):
+            monitor.write_file(DRIFT_PATH)
+
+
+form_prediksi()
 
 # ========================================
-# FORM INPUT
+# PREDIKSI BATCH (UPLOAD CSV)
 # ========================================
-st.markdown("## 📝 Masukkan Data Siswa")
+UKURAN_CHUNK = 50_000
+# File hasil batch disimpan di satu direktori & dihapus setelah tidak
+# dipakai (tidak ditampilkan) selama TTL_HASIL_BATCH detik, termasuk milik
+# sesi yang sudah ditinggalkan
+DIR_HASIL_BATCH = os.path.join(tempfile.gettempdir(), "prediksi_batch")
+TTL_HASIL_BATCH = 3600
 
-# Mapping untuk label Indonesia
-gender_label = {"female": "Perempuan", "male": "Laki-laki"}
-race_label = {
-    "group A": "Kelompok A (Rata-rata: 61.6)",
-    "group B": "Kelompok B (Rata-rata: 63.5)",
-    "group C": "Kelompok C (Rata-rata: 64.5)",
-    "group D": "Kelompok D (Rata-rata: 67.4)",
-    "group E": "Kelompok E (Rata-rata: 73.8)"
-}
-lunch_label = {"standard": "Standard", "free/reduced": "Bersubsidi (Gratis/Diskon)"}
-edu_label = {
-    "some high school": "SMA Tidak Lulus",
-    "high school": "Lulusan SMA",
-    "some college": "Kuliah Tidak Lulus",
-    "associate's degree": "Diploma (D3)",
-    "bachelor's degree": "Sarjana (S1)",
-    "master's degree": "Magister (S2)"
-}
-test_label = {"none": "Tidak Ikut", "completed": "Selesai"}
 
-col1, col2 = st.columns(2)
+def sapu_hasil_batch(ttl=TTL_HASIL_BATCH):
+    """Hapus file hasil batch yang lebih lama dari ttl (mtime) dari sesi mana pun."""
+    batas = time.time() - ttl
+    try:
+        entri = list(os.scandir(DIR_HASIL_BATCH))
+    except FileNotFoundError:
+        return
+    for file in entri:
+        try:
+            if file.stat().st_mtime < batas:
+                os.remove(file.path)
+        except FileNotFoundError:
+            pass
+
+
+def hapus_hasil_batch():
+    """Hapus file hasil batch sebelumnya milik sesi ini (jika ada)."""
+    hasil = st.session_state.pop("hasil_batch", None)
+    if hasil is not None:
+        try:
+            os.remove(hasil[1])
+        except FileNotFoundError:
+            pass
 
-with col1:
-    gender = st.selectbox(
-        "👤 Jenis Kelamin",
-        ["female", "male"],
-        format_func=lambda x: gender_label[x],
-        help="Jenis kelamin siswa"
-    )
-    
-    race = st.selectbox(
-        "🌍 Kelompok Etnis",
-        ["group A", "group B", "group C", "group D", "group E"],
-        format_func=lambda x: race_label[x],
-        help="Kelompok demografi siswa (A-E berdasarkan latar belakang sosial-ekonomi)"
-    )
-    
-    lunch = st.selectbox(
-        "🍽️ Tipe Makan Siang",
-        ["standard", "free/reduced"],
-        format_func=lambda x: lunch_label[x],
-        help="Tipe makan siang yang diterima siswa"
-    )
 
-with col2:
-    parental_education = st.selectbox(
-        "🎓 Pendidikan Orang Tua",
-        ["some high school", "high school", "some college", 
-         "associate's degree", "bachelor's degree", "master's degree"],
-        format_func=lambda x: edu_label[x],
-        help="Tingkat pendidikan tertinggi orang tua/wali"
+def buka_file(path):
+    # Dipanggil saat tombol download diklik (data deferred), bukan saat
+    # render; Streamlit membaca dari file handle, bukan dari salinan bytes
+    def buka():
+        return open(path, "rb")
+    return buka
+
+
+@st.fragment
+def prediksi_batch():
+    # Fragment: upload & proses batch tidak me-rerun konten lain di halaman
+    st.markdown("---")
+    st.markdown("## 📂 Prediksi Batch (Upload CSV)")
+    st.caption(
+        "Upload file CSV dengan kolom yang sama seperti StudentsPerformance.csv. "
+        "File diproses per chunk sehingga memori tetap terbatas walaupun berisi ratusan ribu siswa."
     )
-    
-    test_prep = st.selectbox(
-        "📚 Kursus Persiapan Ujian",
-        ["none", "completed"],
-        format_func=lambda x: test_label[x],
-        help="Apakah siswa mengikuti kursus persiapan ujian"
+
+    uploaded_file = st.file_uploader("📄 File CSV Siswa", type="csv")
+    sertakan_kontribusi = st.checkbox(
+        "💡 Sertakan kontribusi setiap fitur",
+        help="Tambahkan kolom 'contribution ...': bagian prediksi yang berasal dari setiap fitur"
     )
 
-st.markdown("---")
+    if uploaded_file is not None and st.button("🔮 Prediksi Semua Siswa", use_container_width=True):
+        progress = st.progress(0.0, text="Memproses...")
+        # Hasil ditulis ke file sementara di disk: memori tidak bertambah
+        # sesuai ukuran file, session_state hanya menyimpan path-nya
+        hapus_hasil_batch()
+        sapu_hasil_batch()
+        os.makedirs(DIR_HASIL_BATCH, exist_ok=True)
+        fd, path_hasil = tempfile.mkstemp(prefix="prediksi_", suffix=".csv", dir=DIR_HASIL_BATCH)
+        total_baris = 0
+        total_invalid = 0
+        # Seluruh file diprediksi dengan satu versi model walaupun ada reload di tengah jalan
+        aktif = model_holder.get()
+        monitor = get_drift_monitor(file_signature(DATASET_PATH), aktif.model.checksum, aktif)
+        
+        try:
+            with open(fd, "w", newline="") as hasil_csv:
+                for i, chunk in enumerate(pd.read_csv(uploaded_file, chunksize=UKURAN_CHUNK)):
+                    hilang = kolom_hilang(chunk)
+                    if hilang:
+                        raise ValueError(f"Kolom tidak ditemukan: {', '.join(hilang)}")
+                
+                    # Encoding & prediksi satu chunk sekaligus (vectorized)
+                    with REGISTRY.span("batch_chunk"):
+                        chunk = score_chunk(chunk, aktif.coef_lookup, aktif.model.targets, sertakan_kontribusi, monitor)
+                
+                    # Hasil langsung ditulis sebagai teks CSV, chunk DataFrame dibuang
+                    chunk.to_csv(hasil_csv, header=(i == 0), index=False)
+                    total_baris += len(chunk)
+                    total_invalid += int(chunk[KOLOM_PREDIKSI].isna().sum())
+                
+                    progress.progress(
+                        min(uploaded_file.tell() / max(uploaded_file.size, 1), 1.0),
+                        text=f"{total_baris:,} siswa diproses..."
+                    )
+            
+            progress.progress(1.0, text=f"✅ Selesai: {total_baris:,} siswa")
+            prediksi_dilayani.inc(total_baris - total_invalid)
+            st.session_state["hasil_batch"] = (uploaded_file.name, path_hasil)
+            
+            if total_invalid:
+                st.warning(
+                    f"⚠️ {total_invalid:,} baris memiliki nilai kategori yang tidak dikenal "
+                    "- kolom prediksinya dikosongkan."
+                )
+        
+        except Exception as e:
+            prediksi_error.inc()
+            progress.empty()
+            os.remove(path_hasil)
+            st.error(f"❌ Terjadi kesalahan saat prediksi batch: {str(e)}")
+            st.info(f"Pastikan file memiliki kolom: {', '.join(KOLOM_FITUR)}")
+        
+        if REGISTRY.write_file(METRICS_PATH, min_interval=INTERVAL_TULIS_METRIK):
+            monitor.write_file(DRIFT_PATH)
+
+    if "hasil_batch" in st.session_state:
+        nama_file, path_hasil = st.session_state["hasil_batch"]
+        try:
+            # Hasil yang masih ditampilkan tidak ikut tersapu (TTL dihitung dari sini)
+            os.utime(path_hasil)
+        except FileNotFoundError:
+            del st.session_state["hasil_batch"]
+            st.info("ℹ️ Hasil prediksi batch sudah kedaluwarsa - upload ulang file untuk memprediksi lagi.")
+            return
+        st.download_button(
+            "⬇️ Download Hasil Prediksi",
+            data=buka_file(path_hasil),
+            file_name=f"prediksi_{nama_file}",
+            mime="text/csv",
+            use_container_width=True
+        )
+
+
+prediksi_batch()
 
 # ========================================
-# PREDIKSI
+# SIMULASI KEBIJAKAN (WHAT-IF KOHORT)
 # ========================================
-if st.button("🔮 Prediksi Nilai Matematika", type="primary", use_container_width=True):
-    
-    # Encoding manual (HARUS SAMA DENGAN TRAINING)
-    # Buat dictionary dengan SEMUA fitur dari training, default 0
-    data = {col: 0 for col in feature_names}
-    
-    # Update nilai berdasarkan input user
-    # Gender
-    if gender == "male":
-        if "gender_male" in data:
-            data["gender_male"] = 1
-    
-    # Race/Ethnicity
-    race_col = f"race/ethnicity_{race}"
-    if race_col in data:
-        data[race_col] = 1
-    
-    # Parental Education
-    parent_col = f"parental level of education_{parental_education}"
-    if parent_col in data:
-        data[parent_col] = 1
-    
-    # Lunch
-    if lunch == "standard":
-        if "lunch_standard" in data:
-            data["lunch_standard"] = 1
-    
-    # Test Prep
-    if test_prep == "none":
-        if "test preparation course_none" in data:
-            data["test preparation course_none"] = 1
-    
-    # Buat DataFrame dengan urutan kolom yang sama
-    df_input = pd.DataFrame([data])
-    
-    # Prediksi
+@st.fragment
+def simulasi_kebijakan():
+    # Fragment: memilih kebijakan / kohort hanya me-rerun bagian ini
+    st.markdown("---")
+    st.markdown("## 🧭 Simulasi Kebijakan Intervensi")
+    st.caption(
+        "Bandingkan dampak beberapa kebijakan pada satu kohort: prediksi setiap siswa "
+        "dihitung sebelum dan sesudah intervensi."
+    )
+
+    sumber = st.radio("Kohort", ["Dataset siswa", "Upload CSV kohort"], horizontal=True)
     try:
-        prediction = model.predict(df_input)[0]
-        
-        # Batasi nilai antara 0-100
-        prediction = max(0, min(100, prediction))
-        
-        # Tampilkan hasil
-        st.markdown("## 🎯 Hasil Prediksi")
-        
-        # Tampilan nilai prediksi besar
-        st.markdown(f"<h1 style='text-align: center; color: #1f77b4;'>{prediction:.1f}</h1>", 
-                    unsafe_allow_html=True)
-        st.markdown(f"<p style='text-align: center; font-size: 20px;'>Prediksi Nilai Matematika</p>", 
-                    unsafe_allow_html=True)
-        
-        # Progress bar visual
-        st.progress(prediction / 100)
-        
-        # Kategori nilai
-        if prediction >= 80:
-            kategori = "🌟 Sangat Baik"
-            warna = "success"
-        elif prediction >= 70:
-            kategori = "✅ Baik"
-            warna = "success"
-        elif prediction >= 60:
-            kategori = "⚠️ Cukup"
-            warna = "warning"
-        else:
-            kategori = "❌ Perlu Peningkatan"
-            warna = "error"
-        
-        st.markdown(f"**Kategori:** {kategori}")
-        
-        # Penjelasan singkat
-        st.markdown("### 💡 Penjelasan")
-        
-        if test_prep == "completed":
-            st.info("✅ Siswa mengikuti kursus persiapan ujian - ini dapat meningkatkan nilai sekitar 5-6 poin!")
-        else:
-            st.warning("⚠️ Siswa tidak mengikuti kursus persiapan ujian - mengikuti kursus dapat meningkatkan nilai sekitar 5-6 poin.")
-        
-        if lunch == "free/reduced":
-            st.info("📊 Siswa menerima makan siang bersubsidi - ini mungkin berkorelasi dengan faktor ekonomi keluarga yang dapat mempengaruhi nilai.")
+        if sumber == "Dataset siswa":
+            df_kohort = None
+            kode = get_kode_dataset(file_signature(DATASET_PATH))
         else:
-            st.success("✅ Siswa menerima makan siang standard - ini berkorelasi positif dengan nilai (+11.5 poin rata-rata).")
-        
-        # Insight tambahan berdasarkan kelompok
-        if race == "group E":
-            st.success("🌟 Kelompok E memiliki rata-rata nilai tertinggi (73.8) - prediksi cenderung lebih tinggi.")
-        elif race == "group A":
-            st.info("📊 Kelompok A memiliki rata-rata nilai terendah (61.6) - namun ini bisa ditingkatkan dengan kursus persiapan!")
-        
-        # Info tambahan
-        with st.expander("ℹ️ Informasi Tambahan"):
-            st.markdown(f"""
-            **Data Input:**
-            - Jenis Kelamin: {gender_label[gender]}
-            - Kelompok Etnis: {race_label[race]}
-            - Pendidikan Orang Tua: {edu_label[parental_education]}
-            - Tipe Makan Siang: {lunch_label[lunch]}
-            - Kursus Persiapan: {test_label[test_prep]}
-            
-            **Tentang Kelompok Etnis:**
-            - Kelompok A-E adalah klasifikasi demografi dalam dataset
-            - Mencerminkan perbedaan latar belakang sosial-ekonomi
-            - Group E (rata-rata 73.8) vs Group A (rata-rata 61.6)
-            - Ini menunjukkan pentingnya faktor sosial dalam prestasi akademik
-            
-            **Catatan:**
-            - Prediksi berdasarkan model Linear Regression
-            - Model dilatih menggunakan data 1000 siswa
-            - Akurasi: MAE ±11.27 poin
-            - Prediksi bersifat estimasi, bukan penilaian pasti
-            """)
-    
+            file_kohort = st.file_uploader("📄 File CSV Kohort", type="csv", key="kohort")
+            if file_kohort is None:
+                return
+            df_kohort = pd.read_csv(file_kohort)
+            hilang = kolom_hilang(df_kohort)
+            if hilang:
+                raise ValueError(f"Kolom tidak ditemukan: {', '.join(hilang)}")
+            kode = encode_codes(df_kohort)
+
+        dipilih = st.multiselect("Kebijakan", list(KEBIJAKAN_CONTOH), default=list(KEBIJAKAN_CONTOH))
+        if not dipilih:
+            return
+
+        coef_lookup = lookup_matematika(model_holder.get())
+        ringkasan = compare_policies(kode, coef_lookup, {nama: KEBIJAKAN_CONTOH[nama] for nama in dipilih})
     except Exception as e:
-        st.error(f"❌ Terjadi kesalahan saat prediksi: {str(e)}")
-        st.info("Pastikan model sudah di-training dengan benar menggunakan 'python main.py'")
+        st.error(f"❌ Terjadi kesalahan saat simulasi: {str(e)}")
+        return
+
+    st.dataframe(
+        ringkasan.rename(columns={
+            "jumlah_siswa": "Jumlah Siswa", "siswa_terdampak": "Siswa Terdampak",
+            "rata_baseline": "Rata-rata Awal", "rata_counterfactual": "Rata-rata Intervensi",
+            "rata_delta": "Δ Rata-rata", "rata_delta_terdampak": "Δ per Siswa Terdampak",
+            "total_delta": "Total Δ Poin",
+        }).round(2),
+        use_container_width=True
+    )
+
+    # Detail per siswa untuk satu kebijakan
+    if df_kohort is not None:
+        kebijakan = st.selectbox("Detail per siswa untuk kebijakan", dipilih)
+        hasil = simulate(kode, coef_lookup, KEBIJAKAN_CONTOH[kebijakan])
+        st.download_button(
+            "⬇️ Download Detail per Siswa",
+            data=per_student(df_kohort, hasil).to_csv(index=False),
+            file_name="simulasi_intervensi.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+
+
+simulasi_kebijakan()
+
+# ========================================
+# LAPORAN DRIFT
+# ========================================
+@st.fragment
+def laporan_drift():
+    # Fragment: laporan hanya dihitung saat tombol diklik
+    st.markdown("---")
+    st.markdown("## 📡 Monitoring Drift")
+    st.caption(
+        "Bandingkan input & prediksi yang dilayani app ini dengan distribusi data training. "
+        f"PSI < {PSI_WASPADA} stabil, {PSI_WASPADA}-{PSI_DRIFT} waspada, > {PSI_DRIFT} drift."
+    )
+
+    if not st.button("📡 Tampilkan Laporan Drift", use_container_width=True):
+        return
+
+    aktif = model_holder.get()
+    monitor = get_drift_monitor(file_signature(DATASET_PATH), aktif.model.checksum, aktif)
+    laporan = monitor.report()
+    n_dilayani = int(laporan["n"].iloc[-1])
+    if n_dilayani == 0:
+        st.info("Belum ada prediksi yang dilayani model aktif.")
+        return
+
+    st.caption(f"{n_dilayani:,} prediksi dilayani model `{aktif.model.checksum[:12]}` sejak app berjalan")
+    laporan["fitur"] = laporan["fitur"].map(lambda kolom: nama_fitur.get(kolom, "Prediksi Nilai"))
+    st.dataframe(
+        laporan.rename(columns={
+            "fitur": "Fitur", "n": "Jumlah", "tidak_dikenal": "Tidak Dikenal",
+            "psi": "PSI", "chi2": "Chi-square", "p_value": "p-value", "status": "Status",
+        }).round(4),
+        hide_index=True, use_container_width=True
+    )
+
+    drift = laporan[laporan["status"] == "drift"]
+    if len(drift):
+        st.warning(f"⚠️ Distribusi berubah signifikan: {', '.join(drift['fitur'])}. "
+                   "Pertimbangkan evaluasi ulang / training ulang model.")
+    elif (laporan["status"] == "data kurang").any():
+        st.info("Prediksi yang dilayani masih sedikit; status drift belum bisa disimpulkan.")
+    else:
+        st.success("✅ Input & prediksi yang dilayani masih sesuai distribusi data training.")
+
+
+laporan_drift()
 
 # ========================================
 # FOOTER
 # ========================================
 st.markdown("---")
-st.markdown("""
+st.markdown(f"""
 <div style='text-align: center; color: gray;'>
     <p>🎓 Sistem Prediksi Nilai Matematika Siswa Berbasis Faktor Sosial</p>
     <p>Dibuat menggunakan Python, Streamlit & Scikit-learn</p>
-    <p style='font-size: 12px;'>Model: Linear Regression | Dataset: 1000 siswa | MAE: ±11.27</p>
+    <p style='font-size: 12px;'>Model: Linear Regression | Dataset: {n_siswa} siswa | MAE: ±{metrics['mae']:.2f}</p>
 </div>
 """, unsafe_allow_html=True)
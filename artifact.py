@@ -0,0 +1,156 @@
+"""
+📦 ARTEFAK MODEL RINGAN (TANPA SCIKIT-LEARN)
+
+main.py menyimpan model Linear Regression ke 'model_artifact.json':
+intercept, koefisien, skema fitur, nama target, kosakata kategori, metrik
+evaluasi dan checksum.
+
+Model bisa multi-output (math, reading & writing sekaligus): intercept
+berupa vektor (k) dan koefisien matriks (k x p), satu baris per target,
+sama seperti LinearRegression yang di-fit dengan y 2 dimensi.
+Field opsional "intervals" berisi interval prediksi bootstrap untuk setiap
+kombinasi input (lihat intervals.py).
+Artefak ini di-load oleh LinearScorer yang hanya butuh NumPy, jadi worker
+Streamlit / batch tidak perlu meng-import scikit-learn (dan pandas) hanya
+untuk unpickle model.pkl.
+"""
+
+import hashlib
+import json
+
+import numpy as np
+
+from fileio import atomic_write
+from schema import TARGET
+
+ARTIFACT_VERSION = 2
+ARTIFACT_PATH = "model_artifact.json"
+# Versi 1: satu target (math score), tanpa field "targets"
+VERSI_DIDUKUNG = (1, 2)
+TARGET_DEFAULT = [TARGET]
+
+
+def _checksum(payload):
+    teks = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(teks.encode("utf-8")).hexdigest()
+
+
+def export_artifact(model, feature_names, vocabulary, path=ARTIFACT_PATH, metrics=None, targets=None,
+                    intervals=None):
+    """Simpan model hasil training sebagai artefak JSON berversi + checksum."""
+    payload = {
+        "version": ARTIFACT_VERSION,
+        "intercept": np.asarray(model.intercept_, dtype=float).tolist(),
+        "coef": np.asarray(model.coef_, dtype=float).tolist(),
+        "feature_names": list(feature_names),
+        "targets": list(targets or TARGET_DEFAULT),
+        "vocabulary": {kolom: list(opsi) for kolom, opsi in vocabulary.items()},
+        "metrics": dict(metrics or {}),
+    }
+    if intervals is not None:
+        payload["intervals"] = intervals
+    payload["checksum"] = _checksum(payload)
+    with atomic_write(path) as tmp, open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    return payload["checksum"]
+
+
+def load_artifact(path=ARTIFACT_PATH):
+    """
+    Load artefak dan validasi versi & checksum-nya.
+
+    Raises:
+        FileNotFoundError: artefak belum dibuat (jalankan main.py)
+        ValueError: versi tidak didukung atau isi artefak rusak
+    """
+    with open(path, encoding="utf-8") as f:
+        payload = json.load(f)
+
+    checksum = payload.pop("checksum", None)
+    if payload.get("version") not in VERSI_DIDUKUNG:
+        raise ValueError(f"Versi artefak tidak didukung: {payload.get('version')}")
+    if checksum != _checksum(payload):
+        raise ValueError(f"Checksum artefak '{path}' tidak cocok - file rusak atau diubah manual")
+
+    return LinearScorer(
+        payload["intercept"], payload["coef"], payload["feature_names"],
+        payload["vocabulary"], checksum, payload.get("metrics", {}),
+        payload.get("targets", TARGET_DEFAULT), payload.get("intervals"),
+    )
+
+
+class LinearScorer:
+    """
+    Pengganti LinearRegression untuk inference: y = β₀ + X·β.
+
+    Atribut intercept_, coef_ dan feature_names_in_ dibuat sama dengan
+    LinearRegression supaya bisa langsung dipakai oleh kode yang sama
+    (misalnya encoding.build_coef_lookup). Untuk satu target intercept_
+    berupa float dan coef_ vektor (p); untuk multi-output intercept_ (k)
+    dan coef_ (k x p).
+
+    intervals (opsional): {"level", "lower", "upper", ...} dengan lower &
+    upper array (jumlah sel x k), urutan sel sama dengan tabel prediksi.
+    """
+
+    def __init__(self, intercept, coef, feature_names, vocabulary, checksum, metrics=None, targets=None,
+                 intervals=None):
+        self.targets = list(targets or TARGET_DEFAULT)
+        intercept = np.asarray(intercept, dtype=float)
+        self.intercept_ = float(intercept) if intercept.ndim == 0 else intercept
+        self.coef_ = np.asarray(coef, dtype=float)
+        self.feature_names_in_ = np.asarray(feature_names, dtype=object)
+        self.feature_names = list(feature_names)
+        self.vocabulary = vocabulary
+        self.checksum = checksum
+        self.metrics = dict(metrics or {})
+
+        p = len(self.feature_names)
+        bentuk = (p,) if len(self.targets) == 1 else (len(self.targets), p)
+        if self.coef_.shape != bentuk:
+            raise ValueError("Bentuk koefisien tidak sesuai dengan jumlah fitur & target")
+
+        self.intervals = None
+        if intervals is not None:
+            self.intervals = {
+                **intervals,
+                "lower": np.asarray(intervals["lower"], dtype=float),
+                "upper": np.asarray(intervals["upper"], dtype=float),
+            }
+            n_sel = int(np.prod([len(opsi) for opsi in vocabulary.values()]))
+            bentuk = (n_sel, len(self.targets))
+            if self.intervals["lower"].shape != bentuk or self.intervals["upper"].shape != bentuk:
+                raise ValueError("Bentuk interval prediksi tidak sesuai dengan kosakata & target")
+
+    def predict(self, X):
+        """Prediksi dari matriks one-hot (kolom sesuai feature_names): (n) atau (n x k)."""
+        return np.asarray(X, dtype=float) @ self.coef_.T + self.intercept_
+
+    def for_target(self, target):
+        """
+        Model satu target dari model multi-output (self jika sudah satu target).
+
+        Metrik akurasi diambil dari metrics["per_target"][target] jika ada,
+        interval prediksi dari kolom target tersebut.
+
+        Raises:
+            ValueError: target tidak ada di model
+        """
+        if target not in self.targets:
+            raise ValueError(f"Target '{target}' tidak ada di model (tersedia: {', '.join(self.targets)})")
+        if self.coef_.ndim == 1:
+            return self
+        i = self.targets.index(target)
+        metrics = {k: v for k, v in self.metrics.items() if k != "per_target"}
+        metrics.update(self.metrics.get("per_target", {}).get(target, {}))
+        intervals = None
+        if self.intervals is not None:
+            intervals = {
+                **self.intervals,
+                "lower": self.intervals["lower"][:, [i]],
+                "upper": self.intervals["upper"][:, [i]],
+            }
+        return LinearScorer(
+            self.intercept_[i], self.coef_[i], self.feature_names,
+            self.vocabulary, self.checksum, metrics, [target], intervals,
+        )
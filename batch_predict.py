@@ -0,0 +1,152 @@
+"""
+📦 BATCH PREDIKSI NILAI (COMMAND LINE)
+
+Skoring file CSV siswa berukuran besar tanpa Streamlit:
+- File dibaca per chunk (memori tetap terbatas)
+- Setiap chunk di-encode menjadi kode kategori dan diprediksi lewat
+  lookup koefisien model di process pool (memakai semua core)
+- Hasil ditulis berurutan sesuai urutan input
+- Satu kolom prediksi per target model ("predicted math score", dan
+  "predicted reading score" / "predicted writing score" untuk model
+  multi-output)
+- Dengan --explain: kolom kontribusi setiap fitur ("contribution lunch",
+  ...) dari gather koefisien yang sama (lihat explain.py)
+
+Penggunaan:
+    python batch_predict.py input.csv output.csv [--chunksize 200000] [--workers 8] [--explain]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from encoding import KOLOM_FITUR, kolom_hilang, encode_codes, build_coef_lookup, score_codes
+from artifact import ARTIFACT_PATH, load_artifact
+from explain import kolom_kontribusi, explain_chunk
+
+KOLOM_PREDIKSI = "predicted math score"
+
+# Lookup koefisien & target per proses worker (di-load sekali oleh _init_worker)
+_coef_lookup = None
+_targets = None
+_explain = False
+
+
+def kolom_prediksi(targets):
+    """Nama kolom output untuk setiap target model."""
+    return [f"predicted {target}" for target in targets]
+
+
+def score_chunk(chunk, coef_lookup, targets=("math score",), explain=False, monitor=None):
+    """
+    Tambahkan kolom prediksi ke satu chunk (encoding & prediksi vectorized).
+
+    Semua target dihitung dari satu gather koefisien. Baris dengan nilai
+    kategori yang tidak dikenal diberi prediksi kosong (NaN). Dengan
+    explain=True kolom kontribusi per fitur ikut ditambahkan dari kode
+    kategori yang sama. monitor (drift.DriftMonitor, opsional) ikut mencatat
+    input & prediksi target pertama chunk ini.
+    """
+    kode = encode_codes(chunk)
+    prediksi = score_codes(kode, coef_lookup).reshape(len(chunk), len(targets))
+    chunk[kolom_prediksi(targets)] = np.clip(prediksi, 0, 100).round(1)
+    if monitor is not None:
+        monitor.observe(kode, prediksi[:, 0])
+    if explain:
+        explain_chunk(chunk, coef_lookup, targets, kode)
+    return chunk
+
+
+def _init_worker(artifact_path, explain):
+    global _coef_lookup, _targets, _explain
+    model = load_artifact(artifact_path)
+    _coef_lookup = build_coef_lookup(model, model.feature_names)
+    _targets = model.targets
+    _explain = explain
+
+
+def _score_chunk_csv(chunk):
+    # Serialisasi ke teks CSV juga dikerjakan di worker, bukan di proses utama
+    chunk = score_chunk(chunk, _coef_lookup, _targets, _explain)
+    return chunk.to_csv(header=False, index=False), len(chunk)
+
+
+def run(input_path, output_path, chunksize, workers, artifact_path, explain=False):
+    # Validasi artefak di proses utama dulu supaya error-nya jelas
+    targets = load_artifact(artifact_path).targets
+
+    total_baris = 0
+    # Jumlah chunk yang boleh "in-flight" dibatasi supaya memori tetap terbatas
+    max_pending = workers * 2
+    pending = deque()
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(artifact_path, explain),
+    ) as executor, open(output_path, "w", newline="") as output:
+
+        def tulis_hasil_terdepan():
+            nonlocal total_baris
+            teks, n = pending.popleft().result()
+            output.write(teks)
+            total_baris += n
+
+        for i, chunk in enumerate(pd.read_csv(input_path, chunksize=chunksize)):
+            if i == 0:
+                hilang = kolom_hilang(chunk)
+                if hilang:
+                    raise ValueError(f"Kolom tidak ditemukan: {', '.join(hilang)}")
+                kolom_output = [*chunk.columns, *kolom_prediksi(targets)]
+                if explain:
+                    kolom_output += kolom_kontribusi(targets)
+                pd.DataFrame(columns=kolom_output).to_csv(output, index=False)
+
+            pending.append(executor.submit(_score_chunk_csv, chunk))
+            # Hasil ditulis sesuai urutan input: selalu tunggu future paling depan
+            while len(pending) >= max_pending:
+                tulis_hasil_terdepan()
+
+        while pending:
+            tulis_hasil_terdepan()
+
+    return total_baris
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch prediksi nilai siswa dari file CSV")
+    parser.add_argument("input", help="File CSV siswa (kolom sama seperti StudentsPerformance.csv)")
+    parser.add_argument("output", help="File CSV hasil prediksi")
+    parser.add_argument("--chunksize", type=int, default=200_000, help="Jumlah baris per chunk")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Jumlah proses worker")
+    parser.add_argument("--artifact", default=ARTIFACT_PATH, help="Path artefak model hasil main.py")
+    parser.add_argument("--explain", action="store_true", help="Tambahkan kolom kontribusi setiap fitur")
+    args = parser.parse_args(argv)
+
+    print(f"📦 Batch prediksi: {args.input} → {args.output}")
+    print(f"   chunk {args.chunksize:,} baris | {args.workers} worker")
+
+    mulai = time.perf_counter()
+    try:
+        total_baris = run(
+            args.input, args.output, args.chunksize, args.workers, args.artifact, args.explain
+        )
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}")
+        print(f"   Pastikan model sudah di-training ('python main.py') dan file memiliki kolom: {', '.join(KOLOM_FITUR)}")
+        return 1
+
+    durasi = time.perf_counter() - mulai
+    print(f"✅ {total_baris:,} siswa diprediksi dalam {durasi:.1f} detik "
+          f"({total_baris / max(durasi, 1e-9):,.0f} baris/detik)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+📊 STATISTIK DASHBOARD DARI DATASET & MODEL
+
+Semua angka di app.py (rata-rata per kelompok, gap sosial-ekonomi, metrik
+evaluasi, koefisien) dihitung dari 'StudentsPerformance.csv' dan artefak
+model, bukan di-hardcode.
+
+Dataset cukup di-scan SATU KALI: satu groupby atas kelima fitur + nilai
+menghasilkan histogram nilai per sel (maksimal 240 sel x 101 nilai).
+Rata-rata, median, standar deviasi dan jumlah siswa untuk setiap kategori
+lalu diturunkan dari histogram kecil itu, tanpa membaca ulang dataset.
+Error model per kelompok (subgroups.py) juga dihitung dari histogram yang
+sama: prediksi konstan per sel, jadi residual cukup satu per (sel, nilai).
+"""
+
+import numpy as np
+
+from encoding import OPSI_FITUR, KOLOM_FITUR, encode_codes, build_coef_lookup, score_codes
+from schema import TARGET
+from dataset import DATASET_PATH, load_dataset
+from subgroups import cell_aggregates, residuals, subgroup_table
+
+
+def score_histogram(df, target=TARGET):
+    """Jumlah siswa per (sel kategori, nilai) dalam satu pass groupby."""
+    return df.groupby(KOLOM_FITUR + [target], observed=True).size()
+
+
+def _ringkas(hist):
+    """Ringkasan statistik dari histogram (index = nilai, isi = jumlah siswa)."""
+    hist = hist.groupby(level=-1).sum().sort_index()
+    nilai = hist.index.to_numpy(dtype=float)
+    jumlah = hist.to_numpy(dtype=float)
+    n = jumlah.sum()
+
+    mean = (nilai * jumlah).sum() / n
+    var = ((nilai - mean) ** 2 * jumlah).sum() / (n - 1) if n > 1 else 0.0
+
+    # Median: nilai di peringkat tengah (rata-rata dua nilai tengah jika n genap)
+    kumulatif = np.cumsum(jumlah)
+    tengah = [(n - 1) // 2, n // 2]
+    median = nilai[np.searchsorted(kumulatif, tengah, side="right")].mean()
+
+    return {
+        "jumlah": int(n),
+        "mean": float(mean),
+        "median": float(median),
+        "std": float(np.sqrt(var)),
+        "min": float(nilai[0]),
+        "max": float(nilai[-1]),
+    }
+
+
+def compute_dashboard_stats(df, model):
+    """
+    Hitung semua statistik dashboard dari dataset dan model.
+
+    Returns:
+        dict berisi ringkasan nilai keseluruhan, jumlah nilai kosong
+        (missing) di kolom fitur & target, ringkasan per kategori
+        setiap fitur, metrik evaluasi dan koefisien model (untuk model
+        multi-output: koefisien & metrik target math score), serta error
+        model per kelompok & irisan dua fitur pada dataset ini
+    """
+    model = model.for_target(TARGET)
+    hist = score_histogram(df)
+
+    per_kategori = {}
+    for kolom, opsi in OPSI_FITUR.items():
+        per_nilai = hist.groupby(level=[kolom, TARGET], observed=True).sum()
+        per_kategori[kolom] = {
+            nilai: _ringkas(per_nilai.xs(nilai, level=kolom))
+            for nilai in opsi
+            if nilai in per_nilai.index.get_level_values(kolom)
+        }
+
+    sel = hist.index.to_frame(index=False)
+    kode = encode_codes(sel)
+    residual = residuals(sel[TARGET], score_codes(kode, build_coef_lookup(model, model.feature_names_in_)))
+    error_subgroup = subgroup_table(cell_aggregates(kode, residual, hist.to_numpy()), max_level=2)
+
+    return {
+        "nilai": _ringkas(hist),
+        "missing": int(df[KOLOM_FITUR + [TARGET]].isna().sum().sum()),
+        "per_kategori": per_kategori,
+        "metrics": dict(getattr(model, "metrics", {}) or {}),
+        "intercept": float(model.intercept_),
+        "koefisien": dict(zip(model.feature_names_in_, map(float, model.coef_))),
+        "error_subgroup": error_subgroup,
+    }
+
+
+def load_dashboard_stats(model, path=DATASET_PATH):
+    """Baca dataset (hanya kolom yang dibutuhkan) lalu hitung statistik dashboard."""
+    df = load_dataset(path, KOLOM_FITUR + [TARGET])
+    return compute_dashboard_stats(df, model)
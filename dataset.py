@@ -0,0 +1,150 @@
+"""
+🗃️ DATASET KOLOMNAR (PARQUET) & LOADER BERSAMA
+
+Konversi sekali:
+    python dataset.py                       # StudentsPerformance.csv → .parquet
+    python dataset.py export_besar.csv      # → export_besar.parquet
+
+Di file Parquet, kelima kolom kategori disimpan dictionary-encoded (setiap
+nilai teks hanya disimpan sekali, baris berisi kode) dan nilai ujian
+sebagai uint8. Saat dibaca, kolom kategori langsung menjadi
+pandas.Categorical (kode int8) tanpa parsing teks & tanpa kolom object,
+dan nilai ujian menjadi UInt8 (nullable) dari CSV maupun Parquet: nilai
+yang kosong tetap terbaca sebagai <NA> dan ikut dihitung sebagai missing.
+
+load_dataset() dan iter_dataset() dipakai main.py, incremental.py dan
+dashboard_stats.py. Hanya kolom yang diminta yang dibaca (column
+projection), dan untuk path .csv otomatis memakai file .parquet di
+sebelahnya jika ada dan tidak lebih tua dari CSV-nya.
+"""
+
+import argparse
+import os
+import sys
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+from encoding import KOLOM_FITUR
+from fileio import atomic_write
+
+DATASET_PATH = "StudentsPerformance.csv"
+KOLOM_SKOR = ["math score", "reading score", "writing score"]
+
+# Tipe kolom di file Parquet (dan dtype pandas untuk pembacaan CSV). Nilai
+# ujian memakai UInt8 nullable: uint8 biasa gagal membaca CSV yang punya
+# satu nilai kosong
+TIPE_ARROW = {
+    **{kolom: pa.dictionary(pa.int32(), pa.string()) for kolom in KOLOM_FITUR},
+    **{kolom: pa.uint8() for kolom in KOLOM_SKOR},
+}
+DTYPE_CSV = {
+    **{kolom: "category" for kolom in KOLOM_FITUR},
+    **{kolom: "UInt8" for kolom in KOLOM_SKOR},
+}
+# uint8 Arrow (yang bisa null) → UInt8 pandas, sama dengan pembacaan CSV
+_TIPE_PANDAS = {pa.uint8(): pd.UInt8Dtype()}.get
+
+
+def parquet_path(csv_path):
+    return os.path.splitext(csv_path)[0] + ".parquet"
+
+
+def resolve_dataset_path(path=DATASET_PATH):
+    """Path yang benar-benar dibaca: .parquet hasil konversi jika masih up to date."""
+    if not path.endswith(".csv"):
+        return path
+    kolomnar = parquet_path(path)
+    try:
+        if os.stat(kolomnar).st_mtime_ns >= os.stat(path).st_mtime_ns:
+            return kolomnar
+    except FileNotFoundError:
+        pass
+    return path
+
+
+def _kolom_file(path):
+    if path.endswith(".parquet"):
+        return pq.read_schema(path).names
+    return pd.read_csv(path, nrows=0).columns.tolist()
+
+
+def _cek_kolom(path, columns):
+    if columns is None:
+        return
+    hilang = [kolom for kolom in columns if kolom not in _kolom_file(path)]
+    if hilang:
+        raise ValueError(f"Kolom tidak ditemukan: {', '.join(hilang)}")
+
+
+def load_dataset(path=DATASET_PATH, columns=None):
+    """
+    Baca dataset utuh (hanya kolom `columns` jika diberikan).
+
+    Raises:
+        FileNotFoundError: file dataset tidak ada
+        ValueError: kolom yang diminta tidak ada di file
+    """
+    path = resolve_dataset_path(path)
+    _cek_kolom(path, columns)
+    if path.endswith(".parquet"):
+        return pq.read_table(path, columns=columns).to_pandas(types_mapper=_TIPE_PANDAS)
+    return pd.read_csv(path, usecols=columns, dtype=DTYPE_CSV)
+
+
+def iter_dataset(path=DATASET_PATH, columns=None, chunksize=500_000):
+    """Baca dataset per chunk DataFrame (untuk training out-of-core)."""
+    path = resolve_dataset_path(path)
+    _cek_kolom(path, columns)
+    if path.endswith(".parquet"):
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas(types_mapper=_TIPE_PANDAS)
+    else:
+        yield from pd.read_csv(path, usecols=columns, dtype=DTYPE_CSV, chunksize=chunksize)
+
+
+def convert_to_parquet(csv_path, output_path=None, block_size=64 << 20):
+    """
+    Konversi CSV → Parquet secara streaming (memori ~ block_size).
+
+    Returns:
+        (path output, jumlah baris)
+    """
+    output_path = output_path or parquet_path(csv_path)
+    reader = pacsv.open_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(block_size=block_size),
+        convert_options=pacsv.ConvertOptions(column_types=TIPE_ARROW),
+    )
+
+    n = 0
+    with atomic_write(output_path) as tmp, pq.ParquetWriter(tmp, reader.schema, compression="zstd") as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+            n += batch.num_rows
+    return output_path, n
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Konversi dataset CSV ke Parquet kolomnar")
+    parser.add_argument("input", nargs="?", default=DATASET_PATH, help="File CSV dataset")
+    parser.add_argument("--output", help="File Parquet output (default: nama sama, ekstensi .parquet)")
+    args = parser.parse_args(argv)
+
+    try:
+        output, n = convert_to_parquet(args.input, args.output)
+    except (FileNotFoundError, pa.ArrowInvalid) as e:
+        print(f"❌ {e}")
+        return 1
+
+    ukuran_csv = os.path.getsize(args.input)
+    ukuran_parquet = os.path.getsize(output)
+    print(f"✅ {n:,} baris dikonversi ke '{output}'")
+    print(f"   Ukuran: {ukuran_csv / 1e6:,.2f} MB (CSV) → {ukuran_parquet / 1e6:,.2f} MB (Parquet)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
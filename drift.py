@@ -0,0 +1,208 @@
+"""
+📡 MONITORING DRIFT INPUT & PREDIKSI MODEL YANG DILAYANI
+
+Mencatat apa yang ditanyakan ke model (kelima fitur kategori) dan apa
+jawabannya (histogram prediksi nilai matematika), lalu membandingkannya
+dengan distribusi data training (StudentsPerformance.csv) memakai:
+- PSI (Population Stability Index): Σ (q - p) · ln(q / p), p = proporsi
+  training, q = proporsi yang dilayani. < 0.1 stabil, 0.1-0.25 waspada,
+  > 0.25 drift
+- uji chi-square goodness-of-fit (p-value kecil = distribusi berbeda)
+
+Memori monitor konstan berapa pun jumlah prediksinya: hanya jumlah per
+kategori (17), kategori tidak dikenal per fitur (5) dan jumlah per bin
+prediksi (BIN_PREDIKSI bin selebar 100 / BIN_PREDIKSI poin). Mencatat satu
+prediksi = satu bincount kecil; laporan baru dihitung saat diminta
+(report()).
+
+State monitor (referensi + jumlah yang dilayani) bisa ditulis ke
+DRIFT_PATH lalu dilaporkan dari proses lain. app.py menulisnya bersama
+metrics.prom (throttle yang sama).
+
+Penggunaan:
+    python drift.py [drift_state.npz] [--min-observasi 100]
+"""
+
+import argparse
+import sys
+import threading
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from encoding import OPSI_FITUR, KOLOM_FITUR, OFFSET_KODE
+from fileio import atomic_write
+
+DRIFT_PATH = "drift_state.npz"
+
+# 20 bin prediksi selebar 5 poin pada rentang 0-100
+BIN_PREDIKSI = 20
+N_KATEGORI = sum(len(opsi) for opsi in OPSI_FITUR.values())
+
+# Ambang PSI yang umum dipakai
+PSI_WASPADA = 0.1
+PSI_DRIFT = 0.25
+# Jumlah observasi minimal sebelum status drift dilaporkan
+MIN_OBSERVASI = 100
+# Proporsi 0 diganti nilai kecil supaya ln(q / p) & chi-square tetap terhingga
+EPSILON = 1e-4
+
+# Jumlah per kategori, kategori tidak dikenal per fitur & per bin prediksi
+Distribusi = namedtuple("Distribusi", ["kategori", "tidak_dikenal", "prediksi"])
+
+
+def distribution_counts(kode, prediksi):
+    """
+    Distribusi sekumpulan prediksi dari kode kategori (n x 5) & prediksi (n).
+
+    Prediksi NaN (input tidak dikenal) tidak masuk histogram prediksi;
+    prediksi dibatasi 0-100 sebelum dimasukkan ke bin.
+    """
+    kode = np.asarray(kode)
+    valid = kode >= 0
+    kategori = np.bincount((kode + OFFSET_KODE)[valid], minlength=N_KATEGORI)
+    tidak_dikenal = (~valid).sum(axis=0)
+
+    prediksi = np.asarray(prediksi, dtype=float).reshape(-1)
+    prediksi = np.clip(prediksi[~np.isnan(prediksi)], 0, 100)
+    bin_prediksi = np.minimum((prediksi * (BIN_PREDIKSI / 100)).astype(np.int64), BIN_PREDIKSI - 1)
+    return Distribusi(
+        kategori.astype(np.int64),
+        tidak_dikenal.astype(np.int64),
+        np.bincount(bin_prediksi, minlength=BIN_PREDIKSI).astype(np.int64),
+    )
+
+
+def psi(referensi, observasi):
+    """Population Stability Index dua vektor jumlah (bin yang sama)."""
+    p = np.maximum(referensi / referensi.sum(), EPSILON)
+    q = np.maximum(observasi / observasi.sum(), EPSILON)
+    return float(np.sum((q - p) * np.log(q / p)))
+
+
+def chi_square(referensi, observasi):
+    """Uji chi-square observasi terhadap proporsi referensi: (statistik, p-value)."""
+    p = np.maximum(referensi / referensi.sum(), EPSILON)
+    hasil = stats.chisquare(observasi, f_exp=p / p.sum() * observasi.sum())
+    return float(hasil.statistic), float(hasil.pvalue)
+
+
+def _status(nilai_psi, n, min_observasi):
+    if n < min_observasi:
+        return "data kurang"
+    if nilai_psi > PSI_DRIFT:
+        return "drift"
+    if nilai_psi > PSI_WASPADA:
+        return "waspada"
+    return "stabil"
+
+
+def drift_report(referensi, observasi, min_observasi=MIN_OBSERVASI):
+    """
+    Bandingkan distribusi yang dilayani dengan distribusi training.
+
+    Returns:
+        DataFrame satu baris per fitur + satu baris prediksi: n (observasi
+        dengan nilai dikenal), tidak_dikenal, psi, chi2, p_value, status
+    """
+    pasangan = [
+        (kolom, referensi.kategori[awal:awal + len(opsi)], observasi.kategori[awal:awal + len(opsi)], tidak_dikenal)
+        for (kolom, opsi), awal, tidak_dikenal in zip(OPSI_FITUR.items(), OFFSET_KODE, observasi.tidak_dikenal)
+    ]
+    pasangan.append(("prediksi", referensi.prediksi, observasi.prediksi, 0))
+
+    baris = []
+    for nama, ref, obs, tidak_dikenal in pasangan:
+        n = int(obs.sum())
+        nilai_psi, chi2, p_value = np.nan, np.nan, np.nan
+        if n > 0:
+            nilai_psi = psi(ref, obs)
+            chi2, p_value = chi_square(ref, obs)
+        baris.append({
+            "fitur": nama, "n": n, "tidak_dikenal": int(tidak_dikenal),
+            "psi": nilai_psi, "chi2": chi2, "p_value": p_value,
+            "status": _status(nilai_psi, n, min_observasi),
+        })
+    return pd.DataFrame(baris)
+
+
+class DriftMonitor:
+    """
+    Jumlah streaming input & prediksi yang dilayani terhadap satu referensi.
+
+    observe() aman dipanggil dari banyak thread (lock seperti metrics.py);
+    biaya & memorinya tidak bergantung pada jumlah prediksi sebelumnya.
+    """
+
+    def __init__(self, referensi, model_checksum=""):
+        self.referensi = referensi
+        self.model_checksum = model_checksum
+        self._jumlah = Distribusi(
+            np.zeros(N_KATEGORI, dtype=np.int64),
+            np.zeros(len(KOLOM_FITUR), dtype=np.int64),
+            np.zeros(BIN_PREDIKSI, dtype=np.int64),
+        )
+        self._lock = threading.Lock()
+
+    def observe(self, kode, prediksi):
+        """Catat kode kategori (n x 5) & prediksi nilai matematika (n) yang dilayani."""
+        baru = distribution_counts(kode, prediksi)
+        with self._lock:
+            for jumlah, tambahan in zip(self._jumlah, baru):
+                jumlah += tambahan
+
+    def snapshot(self):
+        with self._lock:
+            return Distribusi(*(jumlah.copy() for jumlah in self._jumlah))
+
+    def report(self, min_observasi=MIN_OBSERVASI):
+        return drift_report(self.referensi, self.snapshot(), min_observasi)
+
+    def write_file(self, path=DRIFT_PATH):
+        """Simpan referensi & jumlah saat ini (dibaca load_state / CLI)."""
+        observasi = self.snapshot()
+        with atomic_write(path) as tmp, open(tmp, "wb") as f:
+            np.savez(
+                f, model_checksum=self.model_checksum,
+                **{f"referensi_{nama}": nilai for nama, nilai in self.referensi._asdict().items()},
+                **{f"observasi_{nama}": nilai for nama, nilai in observasi._asdict().items()},
+            )
+
+
+def load_state(path=DRIFT_PATH):
+    """Baca file hasil DriftMonitor.write_file: (referensi, observasi, model_checksum)."""
+    with np.load(path) as data:
+        referensi = Distribusi(*(data[f"referensi_{nama}"] for nama in Distribusi._fields))
+        observasi = Distribusi(*(data[f"observasi_{nama}"] for nama in Distribusi._fields))
+        return referensi, observasi, str(data["model_checksum"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Laporan drift input & prediksi yang dilayani")
+    parser.add_argument("state", nargs="?", default=DRIFT_PATH, help="File state monitor drift (ditulis app.py)")
+    parser.add_argument("--min-observasi", type=int, default=MIN_OBSERVASI,
+                        help="Jumlah observasi minimal sebelum status drift dilaporkan")
+    args = parser.parse_args(argv)
+
+    try:
+        referensi, observasi, model_checksum = load_state(args.state)
+    except FileNotFoundError:
+        print(f"❌ File state '{args.state}' tidak ditemukan. Jalankan app.py dan lakukan prediksi terlebih dahulu.")
+        return 1
+
+    tabel = drift_report(referensi, observasi, args.min_observasi)
+    print(f"📡 Drift {int(observasi.prediksi.sum()):,} prediksi dilayani vs "
+          f"{int(referensi.prediksi.sum()):,} siswa training (model {model_checksum[:12]})")
+    print("-" * 60)
+    for _, baris in tabel.iterrows():
+        print(f"  {baris['fitur']:<28} n {baris['n']:>9,} | PSI {baris['psi']:7.4f} | "
+              f"p {baris['p_value']:.3g} | {baris['status']}")
+        if baris["tidak_dikenal"]:
+            print(f"  {'':<28} ⚠️ {baris['tidak_dikenal']:,} nilai tidak dikenal")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
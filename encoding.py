@@ -0,0 +1,224 @@
+"""
+🔄 ENCODING FITUR KATEGORIKAL
+
+Satu-satunya tempat encoding fitur, dipakai bersama oleh main.py (training),
+app.py (prediksi tunggal & batch) dan batch_predict.py supaya encoding
+training dan serving SELALU SAMA.
+
+Untuk prediksi, setiap nilai kategori dipetakan ke kode integer dan
+prediksi dihitung sebagai:
+    y = β₀ + Σ bobot[kategori]
+yaitu intercept ditambah koefisien yang diambil (gather) sesuai kode,
+tanpa membentuk matriks one-hot.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse as sp
+
+# Skema fitur ada di schema.py (tanpa NumPy / pandas, dipakai juga oleh artifact.py)
+from schema import OPSI_FITUR, KOLOM_FITUR, UKURAN_SEL, N_SEL
+
+# Kode kategori per kolom: nilai → index (untuk input dict/JSON tanpa pandas)
+_KODE_KATEGORI = [
+    {nilai: kode for kode, nilai in enumerate(opsi)}
+    for opsi in OPSI_FITUR.values()
+]
+
+# Posisi awal setiap kolom di vektor bobot (flat, satu entri per kategori)
+OFFSET_KODE = np.cumsum([0] + [len(opsi) for opsi in OPSI_FITUR.values()])[:-1]
+
+
+def kolom_hilang(df):
+    """Daftar kolom fitur yang tidak ada di DataFrame input."""
+    return [kolom for kolom in KOLOM_FITUR if kolom not in df.columns]
+
+
+def training_feature_names():
+    """
+    Nama kolom dummy hasil pd.get_dummies(drop_first=True) pada dataset.
+
+    get_dummies mengurutkan kategori secara alfabetis dan membuang yang
+    pertama, jadi kategori dasar (koefisien 0) adalah nilai terkecil secara
+    alfabetis di setiap kolom.
+    """
+    return [
+        f"{kolom}_{nilai}"
+        for kolom, opsi in OPSI_FITUR.items()
+        for nilai in sorted(opsi)[1:]
+    ]
+
+
+def encode_codes(df):
+    """
+    Kode kategori setiap baris (n x 5, int8) dalam satu pass vectorized.
+
+    Nilai yang tidak dikenal diberi kode -1.
+    """
+    kode = np.empty((len(df), len(OPSI_FITUR)), dtype=np.int8)
+    for j, (kolom, opsi) in enumerate(OPSI_FITUR.items()):
+        kode[:, j] = pd.Categorical(df[kolom], categories=opsi).codes
+    return kode
+
+
+def cell_index(kode):
+    """Index sel (0 .. N_SEL-1) setiap baris kode kategori yang valid (n x 5)."""
+    return np.ravel_multi_index(np.asarray(kode).T, UKURAN_SEL)
+
+
+def cell_codes(sel=None):
+    """
+    Kode kategori (n x 5, int8) dari index sel; tanpa argumen = semua N_SEL
+    sel, urut index sel (sama dengan urutan tabel prediksi per sel).
+    """
+    sel = np.arange(N_SEL) if sel is None else sel
+    return np.stack(np.unravel_index(sel, UKURAN_SEL), axis=1).astype(np.int8)
+
+
+def valid_rows(kode):
+    """Mask baris yang semua nilai kategorinya dikenal (tidak ada kode -1)."""
+    return (kode >= 0).all(axis=1)
+
+
+def drop_unknown(df):
+    """
+    Buang baris dengan nilai kategori yang tidak dikenal (NaN, salah ketik,
+    spasi di akhir seperti "male ") sebelum training.
+
+    Returns:
+        (DataFrame tanpa baris tersebut, jumlah baris yang dibuang)
+    """
+    valid = valid_rows(encode_codes(df))
+    if valid.all():
+        return df, 0
+    return df[valid], int((~valid).sum())
+
+
+def encode_record(record):
+    """
+    Kode kategori satu siswa dari dict fitur mentah (tanpa pandas).
+
+    Raises:
+        ValueError: fitur hilang atau nilai kategori tidak dikenal
+    """
+    if not isinstance(record, dict):
+        raise ValueError("Data siswa harus berupa objek/dict")
+    kode = []
+    for kolom, kode_kategori in zip(KOLOM_FITUR, _KODE_KATEGORI):
+        if kolom not in record:
+            raise ValueError(f"fitur '{kolom}' tidak ada")
+        try:
+            kode.append(kode_kategori[record[kolom]])
+        except (KeyError, TypeError):
+            raise ValueError(f"nilai '{record[kolom]}' tidak valid untuk '{kolom}'") from None
+    return kode
+
+
+def encode_records(records):
+    """
+    Kode kategori (n x 5, int8) untuk daftar dict fitur mentah.
+
+    Raises:
+        ValueError: dengan nomor siswa yang datanya tidak valid
+    """
+    kode = np.empty((len(records), len(KOLOM_FITUR)), dtype=np.int8)
+    for i, record in enumerate(records):
+        try:
+            kode[i] = encode_record(record)
+        except ValueError as e:
+            raise ValueError(f"Siswa ke-{i}: {e}") from None
+    return kode
+
+
+def _kolom_desain(feature_names):
+    """
+    Index kolom matriks desain untuk setiap kategori (flat, urutan
+    OPSI_FITUR); -1 untuk kategori dasar yang tidak punya kolom dummy.
+    """
+    posisi = {nama: j for j, nama in enumerate(feature_names)}
+    return np.array([
+        posisi.get(f"{kolom}_{nilai}", -1)
+        for kolom, opsi in OPSI_FITUR.items()
+        for nilai in opsi
+    ])
+
+
+def design_matrix(kode, feature_names, sparse=False):
+    """
+    Matriks desain one-hot (n x p, float64) langsung dari kode kategori.
+
+    Setiap baris punya paling banyak 5 angka 1, jadi matriks cukup diisi
+    lewat index (kode → kolom) tanpa membentuk DataFrame dummy. Kode -1
+    (nilai tidak dikenal) dan kategori dasar menjadi baris nol. Dengan
+    sparse=True hasilnya CSR (≤ 5 nilai per baris) untuk akumulasi XᵀX.
+    """
+    kolom = _kolom_desain(feature_names)[np.where(kode >= 0, kode + OFFSET_KODE, 0)]
+    kolom[kode < 0] = -1
+    baris, posisi = np.nonzero(kolom >= 0)
+    kolom = kolom[baris, posisi]
+
+    bentuk = (len(kode), len(feature_names))
+    if sparse:
+        return sp.csr_matrix((np.ones(len(baris)), (baris, kolom)), shape=bentuk)
+    X = np.zeros(bentuk)
+    X[baris, kolom] = 1.0
+    return X
+
+
+def encode_onehot(df, feature_names):
+    """
+    One-hot encoding satu DataFrame dalam satu pass vectorized (untuk training).
+
+    Kolom kategori di-encode ke kode integer (kategori tetap dari
+    OPSI_FITUR, jadi semua kolom dummy selalu ada walaupun sebuah chunk
+    tidak memuat semua kategori) lalu matriks desain diisi langsung dari
+    kode tersebut. Kolom mengikuti feature_names (kategori dasar yang
+    di-drop saat training tidak punya kolom).
+
+    Raises:
+        ValueError: ada baris dengan nilai kategori tidak dikenal (baris
+            nol di matriks desain = diam-diam dilatih sebagai kategori
+            dasar); buang dulu dengan drop_unknown
+    """
+    kode = encode_codes(df)
+    tidak_dikenal = int((~valid_rows(kode)).sum())
+    if tidak_dikenal:
+        raise ValueError(f"{tidak_dikenal} baris memiliki nilai kategori yang tidak dikenal")
+    X = design_matrix(kode, feature_names)
+    return pd.DataFrame(X, index=df.index, columns=list(feature_names), copy=False)
+
+
+def build_coef_lookup(model, feature_names):
+    """
+    Ubah model.coef_ menjadi (intercept, bobot) untuk score_codes.
+
+    bobot punya satu baris per kategori (urutan OPSI_FITUR): koefisien
+    kolom dummy-nya, atau 0 untuk kategori dasar. Untuk model multi-output
+    (coef_ k x p) setiap baris berisi k koefisien dan intercept berupa
+    vektor (k), jadi satu gather menghasilkan semua target sekaligus.
+    """
+    coef = np.asarray(model.coef_, dtype=float)
+    koefisien = dict(zip(feature_names, coef.T))
+    nol = np.zeros(coef.shape[:-1])
+    bobot = np.array([
+        koefisien.pop(f"{kolom}_{nilai}", nol)
+        for kolom, opsi in OPSI_FITUR.items()
+        for nilai in opsi
+    ])
+    if koefisien:
+        raise ValueError(f"Fitur model tidak dikenal oleh encoder: {', '.join(koefisien)}")
+    intercept = np.asarray(model.intercept_, dtype=float)
+    return (float(intercept) if intercept.ndim == 0 else intercept), bobot
+
+
+def score_codes(kode, coef_lookup):
+    """
+    Prediksi dari kode kategori: intercept + jumlah bobot yang di-gather.
+
+    Hasilnya (n) untuk satu target atau (n x k) untuk model multi-output.
+    Baris dengan kode -1 (nilai tidak dikenal) diberi prediksi NaN.
+    """
+    intercept, bobot = coef_lookup
+    prediksi = intercept + bobot[kode + OFFSET_KODE].sum(axis=1)
+    prediksi[(kode < 0).any(axis=1)] = np.nan
+    return prediksi
@@ -0,0 +1,72 @@
+"""
+💡 PENJELASAN PREDIKSI PER FITUR (DARI KOEFISIEN MODEL)
+
+Model linear: prediksi = intercept + Σ koefisien kategori terpilih, jadi
+setiap prediksi terurai PERSIS menjadi:
+- intercept: prediksi siswa dengan semua kategori dasar (koefisien 0)
+- kontribusi setiap fitur: koefisien kategori siswa untuk fitur itu,
+  relatif terhadap kategori dasarnya
+
+Kontribusi sekumpulan siswa adalah SATU gather dari lookup koefisien
+(build_coef_lookup) dengan kode kategori - langkah yang sama dengan
+score_codes sebelum dijumlahkan - menghasilkan matriks siswa x fitur.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from encoding import OPSI_FITUR, KOLOM_FITUR, OFFSET_KODE, encode_codes
+
+# Penjelasan satu fitur untuk satu siswa: kontribusi kategorinya dan
+# kategori lain dengan koefisien tertinggi (selisih prediksi jika diganti)
+Kontribusi = namedtuple("Kontribusi", ["kolom", "nilai", "kontribusi", "nilai_terbaik", "potensi"])
+
+
+def contributions(kode, coef_lookup):
+    """
+    Kontribusi setiap fitur: (n x 5), atau (n x 5 x k) untuk multi-output.
+
+    intercept + kontribusi.sum(axis=1) sama dengan score_codes. Fitur
+    dengan nilai tidak dikenal (kode -1) diberi kontribusi NaN.
+    """
+    _, bobot = coef_lookup
+    kontribusi = bobot[np.where(kode >= 0, kode + OFFSET_KODE, 0)]
+    kontribusi[kode < 0] = np.nan
+    return kontribusi
+
+
+def kolom_kontribusi(targets):
+    """Nama kolom output kontribusi (urutan sama dengan contributions().reshape(n, -1))."""
+    if len(targets) == 1:
+        return [f"contribution {kolom}" for kolom in KOLOM_FITUR]
+    return [f"contribution {kolom} ({target})" for kolom in KOLOM_FITUR for target in targets]
+
+
+def explain_chunk(chunk, coef_lookup, targets=("math score",), kode=None):
+    """Tambahkan kolom kontribusi per fitur ke satu chunk (satu gather vectorized)."""
+    if kode is None:
+        kode = encode_codes(chunk)
+    kontribusi = contributions(kode, coef_lookup).reshape(len(chunk), -1)
+    chunk[kolom_kontribusi(targets)] = kontribusi.round(2)
+    return chunk
+
+
+def explain_student(kode, coef_lookup):
+    """
+    Penjelasan satu siswa (5 kode kategori) untuk model satu target.
+
+    Returns:
+        (intercept, daftar Kontribusi satu per fitur, urutan OPSI_FITUR)
+    """
+    intercept, bobot = coef_lookup
+    kontribusi = contributions(np.asarray([kode]), coef_lookup)[0]
+    rincian = []
+    for j, (kolom, opsi) in enumerate(OPSI_FITUR.items()):
+        bobot_kolom = bobot[OFFSET_KODE[j]:OFFSET_KODE[j] + len(opsi)]
+        terbaik = int(np.argmax(bobot_kolom))
+        rincian.append(Kontribusi(
+            kolom, opsi[kode[j]], float(kontribusi[j]),
+            opsi[terbaik], float(bobot_kolom[terbaik] - kontribusi[j]),
+        ))
+    return float(intercept), rincian
@@ -0,0 +1,45 @@
+"""
+💾 PENULISAN FILE ATOMIK & SIGNATURE FILE
+
+Semua file output yang dibaca proses lain selagi ditulis (artefak model,
+Parquet, state training & drift, metrik, cache stage) ditulis lewat
+atomic_write: isi ditulis ke file sementara di direktori yang sama lalu
+di-rename (os.replace), jadi pembaca hanya pernah melihat file lama atau
+file baru yang utuh, tidak pernah setengah tertulis.
+
+Sisi pembaca memakai file_signature (mtime, ukuran) untuk tahu kapan file
+berubah: kunci cache dashboard & stage training, dan pengecekan hot reload
+artefak model.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+
+
+def file_signature(path):
+    """(mtime, ukuran) file - dipakai sebagai kunci cache supaya cache
+    otomatis tidak berlaku lagi saat file berubah."""
+    info = os.stat(path)
+    return info.st_mtime_ns, info.st_size
+
+
+@contextmanager
+def atomic_write(path):
+    """
+    Context manager yang memberi path file sementara untuk ditulis.
+
+    Jika blok selesai tanpa error, file sementara menggantikan `path`;
+    jika gagal, file sementara dihapus dan `path` tidak berubah. Nama file
+    sementara memuat pid & thread, jadi penulis paralel tidak saling timpa.
+    """
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        yield tmp
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    os.replace(tmp, path)
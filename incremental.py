@@ -0,0 +1,346 @@
+"""
+🔁 UPDATE MODEL INKREMENTAL (TANPA TRAINING ULANG DARI AWAL)
+
+OLS hanya butuh sufficient statistics: XᵀX, Xᵀy, jumlah baris dan jumlah
+kuadrat y. main.py menyimpannya ke 'training_state.npz', sehingga saat
+ada hasil ujian baru cukup:
+
+    python incremental.py nilai_semester_baru.csv
+
+Batch baru dibaca per chunk dan ditambahkan ke statistik dalam O(baris baru),
+lalu koefisien diselesaikan ulang dari sistem kecil (p+1 x p+1) dan
+model.pkl, feature_names.pkl serta artefak inference ditulis ulang.
+
+Sebelum di-update, model lama dievaluasi pada batch baru (evaluasi
+prequential), jadi metrik di artefak tetap metrik data yang belum dilihat.
+
+State menyimpan checksum artefak yang dibuat bersamanya. Jika artefak
+aktif berasal dari model lain (misalnya Ridge/Lasso hasil 'main.py --cv'),
+update ditolak supaya model tersebut tidak diam-diam diganti OLS dari
+statistik lama.
+
+train_streaming() memakai akumulator yang sama untuk training out-of-core
+('python main.py --chunked') pada dataset yang lebih besar dari RAM.
+"""
+
+import argparse
+import sys
+
+import joblib
+import numpy as np
+from scipy import sparse
+from sklearn.linear_model import LinearRegression
+
+from artifact import ARTIFACT_PATH, export_artifact, load_artifact
+from encoding import OPSI_FITUR, KOLOM_FITUR, encode_codes, valid_rows, design_matrix, build_coef_lookup, score_codes
+from schema import TARGET
+from dashboard_stats import score_histogram
+from dataset import iter_dataset
+from fileio import atomic_write
+
+STATE_PATH = "training_state.npz"
+
+
+class NormalEquations:
+    """
+    Sufficient statistics OLS dengan intercept, untuk satu atau beberapa
+    target sekaligus.
+
+    Matriks desain diperluas dengan kolom konstanta 1 di depan, jadi
+    xtx berukuran (p+1 x p+1) dan xty (p+1 x k) untuk k target. XᵀX sama
+    untuk semua target, jadi semua target diselesaikan dari SATU sistem.
+    """
+
+    def __init__(self, feature_names, xtx=None, xty=None, n=0, sum_y=0.0, sum_y2=0.0, targets=(TARGET,),
+                 model_checksum=""):
+        p = len(feature_names) + 1
+        k = len(targets)
+        self.feature_names = list(feature_names)
+        self.targets = list(targets)
+        self.xtx = np.zeros((p, p)) if xtx is None else np.asarray(xtx, dtype=float)
+        # State lama (satu target) menyimpan xty (p+1) dan sum_y skalar
+        self.xty = np.zeros((p, k)) if xty is None else np.asarray(xty, dtype=float).reshape(p, k)
+        self.n = int(n)
+        self.sum_y = np.zeros(k) + sum_y
+        self.sum_y2 = np.zeros(k) + sum_y2
+        # Checksum artefak yang dibuat dari statistik ini ("" = tidak diketahui)
+        self.model_checksum = model_checksum
+
+    def update(self, X, y):
+        """
+        Tambahkan satu batch ke statistik.
+
+        X: n x p one-hot (dense, atau CSR dari design_matrix(sparse=True)
+        sehingga XᵀX hanya menyentuh nilai yang bukan nol), y: n atau n x k.
+        """
+        if sparse.issparse(X):
+            X1 = sparse.hstack([np.ones((X.shape[0], 1)), X], format="csr")
+            y = np.asarray(y, dtype=float).reshape(X.shape[0], -1)
+            self.xtx += (X1.T @ X1).toarray()
+        else:
+            X = np.asarray(X, dtype=float)
+            y = np.asarray(y, dtype=float).reshape(len(X), -1)
+            X1 = np.hstack([np.ones((len(X), 1)), X])
+            self.xtx += X1.T @ X1
+        self.xty += X1.T @ y
+        self.n += len(y)
+        self.sum_y += y.sum(axis=0)
+        self.sum_y2 += (y * y).sum(axis=0)
+
+    def solve(self):
+        """
+        Selesaikan persamaan normal → (intercept, coef).
+
+        Satu target: (float, vektor p). Multi-output: (vektor k, matriks
+        k x p), sama seperti atribut LinearRegression. Memakai lstsq supaya
+        tetap stabil jika ada kategori yang belum pernah muncul (XᵀX singular).
+        """
+        beta = np.linalg.lstsq(self.xtx, self.xty, rcond=None)[0]
+        if len(self.targets) == 1:
+            return float(beta[0, 0]), beta[1:, 0]
+        return beta[0], beta[1:].T
+
+    def save(self, path=STATE_PATH):
+        with atomic_write(path) as tmp, open(tmp, "wb") as f:
+            np.savez(
+                f, xtx=self.xtx, xty=self.xty, n=self.n,
+                sum_y=self.sum_y, sum_y2=self.sum_y2,
+                feature_names=np.array(self.feature_names),
+                targets=np.array(self.targets),
+                model_checksum=np.array(self.model_checksum),
+            )
+
+    @classmethod
+    def load(cls, path=STATE_PATH):
+        with np.load(path) as state:
+            targets = state["targets"].tolist() if "targets" in state else [TARGET]
+            model_checksum = str(state["model_checksum"]) if "model_checksum" in state else ""
+            return cls(
+                state["feature_names"].tolist(), state["xtx"], state["xty"],
+                state["n"], state["sum_y"], state["sum_y2"], targets, model_checksum,
+            )
+
+
+def metrics_per_target(targets, mae, rmse, r2, n_train, n_test):
+    """
+    Dict metrik untuk artefak: metrik target pertama (math score) di level
+    atas seperti model satu target, ditambah "per_target" untuk multi-output.
+    """
+    mae, rmse, r2 = (np.atleast_1d(np.asarray(m, dtype=float)) for m in (mae, rmse, r2))
+    per_target = {
+        target: {"mae": float(mae[i]), "rmse": float(rmse[i]), "r2": float(r2[i])}
+        for i, target in enumerate(targets)
+    }
+    metrics = {**per_target[targets[0]], "n_train": int(n_train), "n_test": int(n_test)}
+    if len(targets) > 1:
+        metrics["per_target"] = per_target
+    return metrics
+
+
+def fitted_linear_regression(intercept, coef, feature_names):
+    """LinearRegression 'siap pakai' dari koefisien hasil persamaan normal,
+    supaya model.pkl tetap kompatibel dengan output main.py."""
+    model = LinearRegression()
+    intercept = np.asarray(intercept, dtype=float)
+    model.intercept_ = float(intercept) if intercept.ndim == 0 else intercept
+    model.coef_ = np.asarray(coef, dtype=float)
+    model.n_features_in_ = len(feature_names)
+    model.feature_names_in_ = np.asarray(feature_names, dtype=object)
+    return model
+
+
+def save_model_outputs(model, feature_names, metrics, targets=None):
+    """Tulis model.pkl, feature_names.pkl dan artefak inference (sama seperti main.py)."""
+    joblib.dump(model, "model.pkl")
+    joblib.dump(list(feature_names), "feature_names.pkl")
+    return export_artifact(model, feature_names, OPSI_FITUR, ARTIFACT_PATH, metrics=metrics, targets=targets)
+
+
+def _baris_valid(chunk, kode, targets):
+    """
+    Mask baris yang kategorinya dikenal DAN semua nilai targetnya terisi,
+    beserta jumlah baris yang dibuang karena masing-masing alasan.
+    """
+    dikenal = valid_rows(kode)
+    terisi = chunk[targets].notna().all(axis=1).to_numpy()
+    return dikenal & terisi, int((~dikenal).sum()), int((dikenal & ~terisi).sum())
+
+
+def _log_dibuang(log, tidak_dikenal, kosong):
+    if tidak_dikenal:
+        log(f"⚠️ {tidak_dikenal:,} baris dengan nilai kategori tidak dikenal dibuang")
+    if kosong:
+        log(f"⚠️ {kosong:,} baris dengan nilai target kosong dibuang")
+
+
+def append_batch(csv_path, state, chunksize=200_000, log=print):
+    """
+    Update statistik dengan batch baru dari CSV / Parquet (per chunk).
+
+    Baris dengan nilai kategori tidak dikenal atau nilai target kosong tidak
+    ikut evaluasi maupun statistik yang disimpan (jumlahnya dilaporkan lewat
+    log).
+
+    Returns:
+        metrik model LAMA pada batch baru (lihat metrics_per_target)
+    """
+    intercept, coef = state.solve()
+    n_sebelum = state.n
+
+    # Akumulator evaluasi prequential (satu entri per target)
+    n = tidak_dikenal = kosong = 0
+    total_abs = total_sq = total_y = total_y2 = 0.0
+
+    for chunk in iter_dataset(csv_path, KOLOM_FITUR + state.targets, chunksize):
+        kode = encode_codes(chunk)
+        valid, tanpa_kategori, tanpa_nilai = _baris_valid(chunk, kode, state.targets)
+        tidak_dikenal += tanpa_kategori
+        kosong += tanpa_nilai
+        X = design_matrix(kode[valid], state.feature_names, sparse=True)
+        y = chunk[state.targets].to_numpy(dtype=float)[valid]
+
+        error = y - (intercept + X @ coef.T).reshape(len(y), len(state.targets))
+        n += len(y)
+        total_abs += np.abs(error).sum(axis=0)
+        total_sq += (error * error).sum(axis=0)
+        total_y += y.sum(axis=0)
+        total_y2 += (y * y).sum(axis=0)
+
+        state.update(X, y)
+
+    _log_dibuang(log, tidak_dikenal, kosong)
+    if n == 0:
+        raise ValueError(f"File '{csv_path}' tidak berisi data")
+
+    sst = total_y2 - total_y ** 2 / n
+    r2 = np.where(sst > 0, 1 - total_sq / np.where(sst > 0, sst, 1), 0.0)
+    return metrics_per_target(state.targets, total_abs / n, np.sqrt(total_sq / n), r2, n_sebelum, n)
+
+
+def evaluate_histogram(hist, model):
+    """
+    MAE, RMSE dan R² dari histogram (sel kategori, nilai) → jumlah siswa.
+
+    Prediksi model konstan per sel, jadi error cukup dihitung sekali per
+    pasangan (sel, nilai) lalu diberi bobot jumlah siswanya.
+    """
+    sel = hist.index.to_frame(index=False)
+    kode = encode_codes(sel)
+    prediksi = score_codes(kode, build_coef_lookup(model, model.feature_names_in_))
+    y = sel[TARGET].to_numpy(dtype=float)
+    bobot = hist.to_numpy(dtype=float)
+
+    # Sel dengan kategori tidak dikenal tidak bisa dievaluasi (mask yang
+    # sama dengan yang membuang baris tersebut dari training)
+    valid = valid_rows(kode)
+    y, prediksi, bobot = y[valid], prediksi[valid], bobot[valid]
+    n = bobot.sum()
+    error = y - prediksi
+    sse = (bobot * error ** 2).sum()
+    sst = (bobot * (y - (bobot * y).sum() / n) ** 2).sum()
+    return {
+        "mae": float((bobot * np.abs(error)).sum() / n),
+        "rmse": float(np.sqrt(sse / n)),
+        "r2": float(1 - sse / sst) if sst > 0 else 0.0,
+        "n_test": int(n),
+    }
+
+
+def train_streaming(csv_path, feature_names, chunksize=500_000, test_size=0.2, random_state=42, log=print):
+    """
+    Training OLS out-of-core: dataset (CSV / Parquet) dibaca per chunk,
+    tidak pernah utuh di memori.
+
+    Setiap baris masuk ke data test dengan peluang test_size (RNG ber-seed).
+    Baris training diakumulasikan ke persamaan normal; baris test cukup
+    dihitung ke histogram (sel kategori, nilai) yang ukurannya terbatas
+    (maksimal 240 sel x jumlah nilai unik), jadi evaluasi juga tidak perlu
+    membaca CSV dua kali.
+
+    Baris dengan nilai kategori tidak dikenal dibuang sebelum split, jadi
+    training & evaluasi melihat data yang sama; jumlahnya dilaporkan lewat log.
+
+    Returns:
+        (state NormalEquations, model LinearRegression, metrics)
+    """
+    state = NormalEquations(feature_names)
+    rng = np.random.default_rng(random_state)
+    hist_test = None
+    tidak_dikenal = kosong = 0
+
+    for chunk in iter_dataset(csv_path, KOLOM_FITUR + [TARGET], chunksize):
+        kode = encode_codes(chunk)
+        valid, tanpa_kategori, tanpa_nilai = _baris_valid(chunk, kode, [TARGET])
+        if not valid.all():
+            tidak_dikenal += tanpa_kategori
+            kosong += tanpa_nilai
+            chunk, kode = chunk[valid], kode[valid]
+
+        is_test = rng.random(len(chunk)) < test_size
+        state.update(
+            design_matrix(kode[~is_test], feature_names, sparse=True),
+            chunk[TARGET].to_numpy(dtype=float)[~is_test],
+        )
+        hist = score_histogram(chunk[is_test])
+        hist_test = hist if hist_test is None else hist_test.add(hist, fill_value=0)
+
+    _log_dibuang(log, tidak_dikenal, kosong)
+    if state.n == 0 or hist_test is None or hist_test.empty:
+        raise ValueError(f"Data di '{csv_path}' terlalu sedikit untuk training & testing")
+
+    intercept, coef = state.solve()
+    model = fitted_linear_regression(intercept, coef, feature_names)
+    metrics = evaluate_histogram(hist_test, model)
+    metrics["n_train"] = state.n
+    return state, model, metrics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Update model dengan batch data siswa baru")
+    parser.add_argument("input", help="File CSV batch baru (kolom sama seperti StudentsPerformance.csv)")
+    parser.add_argument("--state", default=STATE_PATH, help="File sufficient statistics hasil main.py")
+    parser.add_argument("--chunksize", type=int, default=200_000, help="Jumlah baris per chunk")
+    args = parser.parse_args(argv)
+
+    try:
+        state = NormalEquations.load(args.state)
+    except FileNotFoundError:
+        print(f"⚠️ State '{args.state}' belum ada! Jalankan 'python main.py' terlebih dahulu.")
+        return 1
+
+    try:
+        checksum_aktif = load_artifact(ARTIFACT_PATH).checksum
+    except FileNotFoundError:
+        checksum_aktif = state.model_checksum
+    except ValueError as e:
+        checksum_aktif = f"artefak tidak valid: {e}"
+    if checksum_aktif != state.model_checksum:
+        print(f"⚠️ State '{args.state}' bukan milik artefak model aktif '{ARTIFACT_PATH}' "
+              "(misalnya model Ridge/Lasso hasil 'python main.py --cv').")
+        print("   Update dibatalkan. Jalankan 'python main.py' untuk membuat ulang model & state.")
+        return 1
+
+    print(f"🔁 Update model dengan {args.input} (data sebelumnya: {state.n:,} siswa)")
+    try:
+        metrics = append_batch(args.input, state, args.chunksize)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"\n📊 Evaluasi model LAMA pada {metrics['n_test']:,} siswa baru:")
+    for target, m in metrics.get("per_target", {state.targets[0]: metrics}).items():
+        print(f"  {target:14s} MAE {m['mae']:.2f} | RMSE {m['rmse']:.2f} | R² {m['r2']:.4f}")
+
+    intercept, coef = state.solve()
+    model = fitted_linear_regression(intercept, coef, state.feature_names)
+    checksum = save_model_outputs(model, state.feature_names, metrics, state.targets)
+    state.model_checksum = checksum
+    state.save(args.state)
+
+    print(f"\n✅ Model di-update: total {state.n:,} siswa ({', '.join(state.targets)})")
+    print(f"✅ Artefak inference disimpan ke '{ARTIFACT_PATH}' (sha256: {checksum[:12]})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+📏 INTERVAL PREDIKSI BOOTSTRAP UNTUK SETIAP KOMBINASI INPUT
+
+Selain prediksi titik, main.py menyimpan rentang nilai (default 95%) untuk
+ke-240 kombinasi input (2 x 5 x 6 x 2 x 2 sel) di artefak model, jadi app
+cukup me-lookup rentang sel input seperti tabel prediksinya.
+
+Bootstrap OLS biasa = ratusan kali resample data training lalu
+LinearRegression().fit. Di sini semua resample di-fit sekaligus:
+- Data training diringkas menjadi histogram (sel kategori, nilai) →
+  jumlah siswa (score_histogram), paling banyak 240 x 101 entri berapa
+  pun jumlah barisnya
+- Resample n baris dengan pengembalian = jumlah baru setiap entri
+  histogram ~ Multinomial(n, jumlah / n), satu baris matriks per resample
+- XᵀX dan Xᵀy setiap resample dibentuk dari jumlah siswa & jumlah nilai
+  per sel, lalu semua sistem (p+1 x p+1) diselesaikan dalam satu pinv batch
+- Distribusi nilai satu sel = campuran (prediksi resample + SELURUH
+  residual data training, berbobot jumlah siswa); batas interval = kuantil
+  campuran tersebut, dicari dengan bisection pada CDF-nya (tanpa menarik
+  residual acak, jadi tidak ada noise Monte Carlo dari residual)
+
+Resample dikerjakan per blok dengan seed turunan (bisa paralel lewat
+joblib), jadi hasilnya sama berapa pun jumlah prosesnya. Entri histogram
+diurutkan per (sel, nilai) sebelum resample, jadi hasilnya juga tidak
+bergantung pada urutan baris / loader dataset (CSV atau Parquet). Interval dihitung
+per target; artefak hasil incremental.py tidak membawa interval (model
+berubah, data training lama tidak tersedia).
+"""
+
+import numpy as np
+from joblib import Parallel, delayed
+from scipy import sparse
+
+from encoding import encode_codes, design_matrix, cell_index, cell_codes
+from dashboard_stats import score_histogram
+
+N_BOOTSTRAP = 500
+LEVEL = 0.95
+UKURAN_BLOK = 100
+# Presisi bisection kuantil (poin nilai)
+TOLERANSI_KUANTIL = 1e-4
+
+
+def _matriks_sel(feature_names):
+    """Matriks desain (kolom konstanta 1 di depan) untuk semua sel: 240 x (p+1)."""
+    X = design_matrix(cell_codes(), feature_names)
+    return np.hstack([np.ones((len(X), 1)), X])
+
+
+def _entri_histogram(hist):
+    """
+    (index sel, nilai, jumlah siswa) setiap entri histogram yang kategorinya
+    valid, diurutkan per (sel, nilai) supaya resample tidak bergantung pada
+    urutan entri.
+    """
+    entri = hist.index.to_frame(index=False)
+    kode = encode_codes(entri)
+    valid = (kode >= 0).all(axis=1)
+    sel = cell_index(kode[valid])
+    nilai = entri.iloc[:, -1].to_numpy(dtype=float)[valid]
+    jumlah = hist.to_numpy(dtype=float)[valid]
+    urutan = np.lexsort((nilai, sel))
+    return sel[urutan], nilai[urutan], jumlah[urutan]
+
+
+def _fit_batch(D, sel, nilai, bobot):
+    """
+    Koefisien OLS (B x p+1) untuk B pembobotan entri histogram sekaligus.
+
+    Memakai pinv supaya tetap stabil jika sebuah kategori tidak muncul di
+    resample (XᵀX singular), sama seperti lstsq di NormalEquations.solve.
+    """
+    indikator = sparse.csr_matrix(
+        (np.ones(len(sel)), (np.arange(len(sel)), sel)), shape=(len(sel), len(D))
+    )
+    # Jumlah siswa & jumlah nilai per sel untuk setiap resample (B x 240)
+    jumlah_sel = (indikator.T @ bobot.T).T
+    total_sel = (indikator.T @ (bobot * nilai).T).T
+    xtx = np.einsum("bc,ci,cj->bij", jumlah_sel, D, D, optimize=True)
+    xty = total_sel @ D
+    return np.einsum("bij,bj->bi", np.linalg.pinv(xtx, hermitian=True), xty)
+
+
+def _prediksi_blok(seed, n_resample, D, sel, nilai, jumlah):
+    """Prediksi model setiap resample untuk semua sel (n_resample x 240)."""
+    rng = np.random.default_rng(seed)
+    n = int(jumlah.sum())
+    bobot = rng.multinomial(n, jumlah / n, size=n_resample).astype(float)
+    return _fit_batch(D, sel, nilai, bobot) @ D.T
+
+
+def _kuantil_campuran(prediksi, residual, bobot, q):
+    """
+    Kuantil q setiap sel dari campuran prediksi[b, sel] + residual
+    (residual berbobot `bobot`, setiap resample b berbobot sama).
+
+    CDF campuran = rata-rata CDF residual yang digeser prediksi setiap
+    resample, dievaluasi untuk semua sel sekaligus lewat searchsorted;
+    bisection mencari t terkecil dengan CDF(t) ≥ q.
+    """
+    urutan = np.argsort(residual)
+    residual = residual[urutan]
+    cdf_residual = np.cumsum(bobot[urutan]) / bobot.sum()
+
+    def cdf(t):
+        posisi = np.searchsorted(residual, t[None, :] - prediksi, side="right")
+        return np.where(posisi > 0, cdf_residual[posisi - 1], 0.0).mean(axis=0)
+
+    bawah = prediksi.min(axis=0) + residual[0] - 1
+    atas = prediksi.max(axis=0) + residual[-1]
+    while (atas - bawah).max() > TOLERANSI_KUANTIL:
+        tengah = (bawah + atas) / 2
+        cukup = cdf(tengah) >= q
+        atas = np.where(cukup, tengah, atas)
+        bawah = np.where(cukup, bawah, tengah)
+    return atas
+
+
+def bootstrap_intervals(hist, feature_names, n_bootstrap=N_BOOTSTRAP, level=LEVEL, n_jobs=1, seed=42):
+    """
+    Interval prediksi bootstrap satu target untuk semua sel.
+
+    Args:
+        hist: histogram data training (sel kategori, nilai) → jumlah siswa
+
+    Returns:
+        (bawah, atas): array (240) urutan sel sama dengan tabel prediksi,
+        dibatasi 0-100
+    """
+    D = _matriks_sel(feature_names)
+    sel, nilai, jumlah = _entri_histogram(hist)
+    if jumlah.sum() < 2:
+        raise ValueError("Data training terlalu sedikit untuk interval bootstrap")
+
+    # Residual model dari data asli (bobot = jumlah siswa setiap entri)
+    beta = _fit_batch(D, sel, nilai, jumlah[None, :])[0]
+    residual = nilai - D[sel] @ beta
+
+    n_blok = -(-n_bootstrap // UKURAN_BLOK)
+    ukuran = [min(UKURAN_BLOK, n_bootstrap - i * UKURAN_BLOK) for i in range(n_blok)]
+    prediksi = np.vstack(Parallel(n_jobs=n_jobs)(
+        delayed(_prediksi_blok)(seed_blok, n_resample, D, sel, nilai, jumlah)
+        for seed_blok, n_resample in zip(np.random.SeedSequence(seed).spawn(n_blok), ukuran)
+    ))
+
+    alpha = (1 - level) / 2
+    bawah = _kuantil_campuran(prediksi, residual, jumlah, alpha)
+    atas = _kuantil_campuran(prediksi, residual, jumlah, 1 - alpha)
+    return np.clip(bawah, 0, 100), np.clip(atas, 0, 100)
+
+
+def prediction_intervals(df, feature_names, targets, n_bootstrap=N_BOOTSTRAP, level=LEVEL, n_jobs=1, seed=42):
+    """
+    Interval prediksi semua target untuk disimpan di artefak.
+
+    Returns:
+        dict {"level", "n_bootstrap", "lower", "upper"}; lower & upper
+        berukuran 240 x k (satu kolom per target)
+    """
+    batas = [
+        bootstrap_intervals(score_histogram(df, target), feature_names, n_bootstrap, level, n_jobs, seed)
+        for target in targets
+    ]
+    return {
+        "level": level,
+        "n_bootstrap": n_bootstrap,
+        "lower": np.column_stack([bawah for bawah, _ in batas]).round(2).tolist(),
+        "upper": np.column_stack([atas for _, atas in batas]).round(2).tolist(),
+    }
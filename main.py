@@ -19,85 +19,348 @@ Input Fitur:
 
 Output:
 - Prediksi Nilai Matematika (0-100)
+- Prediksi Nilai Membaca & Menulis (0-100), dari model multi-output yang
+  sama: ketiga target di-fit sekaligus dari SATU faktorisasi matriks desain
+- Interval prediksi bootstrap (default 95%) untuk setiap kombinasi input
+
+Penggunaan:
+    python main.py                      # training biasa, 3 target (dataset dimuat utuh)
+    python main.py --math-only          # training biasa, hanya math score
+    python main.py --bootstrap 1000     # training biasa, 1000 resample untuk interval
+    python main.py --no-cache           # training biasa, semua stage dijalankan ulang
+    python main.py --chunked [--data big.csv] [--chunksize 500000]
+                                        # training out-of-core, memori terbatas
+    python main.py --cv [--folds 5] [--repeats 3] [--math-only]
+                                        # CV paralel OLS/Ridge/Lasso, simpan model terbaik
+
+Training biasa dijalankan sebagai stage (load → encode → split → fit →
+evaluate → intervals → export) yang output-nya di-cache di '.cache_training'
+(lihat pipeline.py): stage yang input, parameter & kodenya tidak berubah
+dilewati, jadi run ulang tanpa perubahan data cukup beberapa detik.
+
+Dataset dibaca lewat dataset.py: jalankan 'python dataset.py' sekali untuk
+membuat StudentsPerformance.parquet, setelah itu file Parquet tersebut yang
+otomatis dipakai (jauh lebih cepat & hemat memori untuk dataset besar).
 """
 
+import argparse
+import os
+import sys
+
 import pandas as pd
 import joblib
+import sklearn
 from sklearn.model_selection import train_test_split
+from sklearn.base import clone
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_absolute_error, r2_score, mean_squared_error
 import numpy as np
 
+import dataset
+import dashboard_stats
+import encoding
+import incremental
+import intervals
+import subgroups
+from encoding import (
+    OPSI_FITUR, KOLOM_FITUR, training_feature_names, drop_unknown, encode_onehot, encode_codes,
+    build_coef_lookup, score_codes,
+)
+from dataset import DATASET_PATH, KOLOM_SKOR, load_dataset, resolve_dataset_path
+from artifact import ARTIFACT_PATH, export_artifact
+from intervals import N_BOOTSTRAP, LEVEL, prediction_intervals
+from incremental import STATE_PATH, NormalEquations, train_streaming, save_model_outputs, metrics_per_target
+from tuning import candidate_models, cross_validate_candidates
+from fileio import file_signature
+from pipeline import CACHE_DIR, Pipeline
+from subgroups import MIN_N, subgroup_errors, label_subgroup
+
+parser = argparse.ArgumentParser(description="Training model prediksi nilai matematika")
+parser.add_argument("--data", default=DATASET_PATH, help="File dataset (CSV atau Parquet)")
+parser.add_argument("--chunked", action="store_true",
+                    help="Training out-of-core: CSV dibaca per chunk & diakumulasi ke persamaan normal")
+parser.add_argument("--chunksize", type=int, default=500_000, help="Jumlah baris per chunk (mode --chunked)")
+parser.add_argument("--cv", action="store_true",
+                    help="Repeated k-fold CV paralel untuk OLS, Ridge & Lasso lalu simpan model terbaik")
+parser.add_argument("--folds", type=int, default=5, help="Jumlah fold (mode --cv)")
+parser.add_argument("--repeats", type=int, default=3, help="Jumlah pengulangan k-fold (mode --cv)")
+parser.add_argument("--jobs", type=int, default=-1,
+                    help="Jumlah proses paralel, -1 = semua core (mode --cv & interval bootstrap)")
+parser.add_argument("--bootstrap", type=int, default=N_BOOTSTRAP,
+                    help="Jumlah resample untuk interval prediksi, 0 = tanpa interval (training biasa)")
+parser.add_argument("--math-only", action="store_true",
+                    help="Hanya math score (training biasa & --cv; mode --chunked selalu math score saja)")
+parser.add_argument("--cache-dir", default=CACHE_DIR, help="Direktori cache output stage (training biasa)")
+parser.add_argument("--no-cache", action="store_true", help="Jalankan ulang semua stage tanpa membaca/menulis cache")
+args = parser.parse_args()
+
 print("=" * 60)
 print("🎓 TRAINING MODEL PREDIKSI NILAI MATEMATIKA SISWA")
 print("=" * 60)
 
-# 1. Load Dataset
-print("\n📊 Loading dataset...")
-df = pd.read_csv("StudentsPerformance.csv")
 
-print(f"✅ Dataset loaded: {df.shape[0]} rows, {df.shape[1]} columns")
-print(f"\nKolom yang tersedia:")
-for col in df.columns:
-    print(f"  - {col}")
+def buang_tidak_dikenal(df, targets):
+    """Baris dengan nilai kategori tidak dikenal / nilai target kosong tidak ikut training (dilaporkan)."""
+    df, dibuang = drop_unknown(df)
+    if dibuang:
+        print(f"⚠️ {dibuang:,} baris dengan nilai kategori tidak dikenal dibuang")
+    kosong = df[targets].isna().any(axis=1)
+    if kosong.any():
+        print(f"⚠️ {int(kosong.sum()):,} baris dengan nilai target kosong dibuang")
+        df = df[~kosong]
+    return df
 
-# 2. Explorasi Data
-print("\n📈 Statistik Dataset:")
-print(df.describe())
 
-print("\n📋 Info Dataset:")
-print(df.info())
+# ========================================
+# MODE OUT-OF-CORE (--chunked)
+# ========================================
+if args.chunked:
+    feature_names = training_feature_names()
+    print(f"\n📊 Streaming dataset '{resolve_dataset_path(args.data)}' per {args.chunksize:,} baris...")
+    state, model, metrics = train_streaming(args.data, feature_names, args.chunksize)
 
-# 3. Encoding Fitur Kategorikal
-print("\n🔄 Encoding fitur kategorikal...")
-df_encoded = pd.get_dummies(df, drop_first=True)
+    print(f"✅ Training set: {metrics['n_train']:,} samples")
+    print(f"✅ Testing set: {metrics['n_test']:,} samples")
 
-# 4. Tentukan X & y (hanya prediksi math score)
-X = df_encoded.drop(["math score", "reading score", "writing score"], axis=1)
-y = df_encoded["math score"]
+    print("\n📊 EVALUASI MODEL:")
+    print("-" * 60)
+    print(f"MAE  (Mean Absolute Error)     : {metrics['mae']:.2f}")
+    print(f"RMSE (Root Mean Squared Error) : {metrics['rmse']:.2f}")
+    print(f"R²   (Coefficient of Determination): {metrics['r2']:.4f}")
 
-print(f"\n✅ Fitur yang digunakan untuk prediksi ({len(X.columns)} fitur):")
-for col in X.columns:
-    print(f"  - {col}")
+    print("\n💾 Menyimpan model...")
+    checksum = save_model_outputs(model, feature_names, metrics)
+    state.model_checksum = checksum
+    state.save(STATE_PATH)
+    print("✅ Model disimpan ke 'model.pkl'")
+    print("✅ Feature names disimpan ke 'feature_names.pkl'")
+    print(f"✅ Artefak inference disimpan ke '{ARTIFACT_PATH}' (sha256: {checksum[:12]})")
+    print(f"✅ State training disimpan ke '{STATE_PATH}'")
+    print("\n📌 Jalankan aplikasi dengan: streamlit run app.py")
+    sys.exit(0)
+
+# ========================================
+# MODE CROSS-VALIDATION (--cv)
+# ========================================
+if args.cv:
+    # Target sama dengan training biasa, jadi --cv tidak menurunkan
+    # artefak multi-output menjadi model math score saja
+    targets = ["math score"] if args.math_only else KOLOM_SKOR
+    print(f"\n📊 Loading dataset '{resolve_dataset_path(args.data)}'...")
+    df = buang_tidak_dikenal(load_dataset(args.data, KOLOM_FITUR + targets), targets)
+    feature_names = training_feature_names()
+    X = encode_onehot(df[KOLOM_FITUR], feature_names)
+    y = df[targets] if len(targets) > 1 else df[targets[0]]
+
+    kandidat = candidate_models()
+    print(f"\n🔬 Repeated {args.folds}-fold CV ({args.repeats}x) untuk {len(kandidat)} kandidat model...")
+    ringkasan = cross_validate_candidates(X, y, kandidat, args.folds, args.repeats, args.jobs)
+
+    print("\n📊 HASIL CROSS-VALIDATION (mean ± std):")
+    print("-" * 60)
+    for nama, baris in ringkasan.iterrows():
+        print(f"  {nama:20s} MAE {baris['mae_mean']:.2f} ± {baris['mae_std']:.2f} | "
+              f"RMSE {baris['rmse_mean']:.2f} ± {baris['rmse_std']:.2f} | "
+              f"R² {baris['r2_mean']:.4f} ± {baris['r2_std']:.4f}")
+
+    # Model terbaik (RMSE rata-rata terkecil) di-fit ulang dengan seluruh data
+    terbaik = ringkasan.index[0]
+    print(f"\n🏆 Model terbaik: {terbaik}")
+    model = clone(kandidat[terbaik]).fit(X, y)
+
+    metrics = metrics_per_target(
+        targets, *(ringkasan.loc[terbaik, [f"{metrik} {target}" for target in targets]] for metrik in ("mae", "rmse", "r2")),
+        len(X) - len(X) // args.folds, len(X) // args.folds,
+    )
+    print("\n💾 Menyimpan model...")
+    checksum = save_model_outputs(model, feature_names, metrics, targets)
+    print("✅ Model disimpan ke 'model.pkl'")
+    print("✅ Feature names disimpan ke 'feature_names.pkl'")
+    print(f"✅ Artefak inference disimpan ke '{ARTIFACT_PATH}' (sha256: {checksum[:12]})")
+
+    # State incremental.py hanya valid untuk OLS: statistik dibentuk ulang
+    # dari seluruh data (sama dengan fit di atas), selain itu state lama dihapus
+    if isinstance(model, LinearRegression):
+        state = NormalEquations(feature_names, targets=targets, model_checksum=checksum)
+        state.update(X, y)
+        state.save(STATE_PATH)
+        print(f"✅ State training disimpan ke '{STATE_PATH}'")
+    elif os.path.exists(STATE_PATH):
+        os.remove(STATE_PATH)
+        print(f"🗑️ State '{STATE_PATH}' dihapus: {terbaik} tidak bisa di-update dengan 'python incremental.py'")
+    print("\n📌 Jalankan aplikasi dengan: streamlit run app.py")
+    sys.exit(0)
+
+# ========================================
+# TRAINING BIASA: STAGE DENGAN CACHE (pipeline.py)
+# ========================================
+def stage_load(path, signature, targets):
+    # 1. Load Dataset (hanya kolom fitur & target yang dipakai)
+    print(f"\n📊 Loading dataset '{path}'...")
+    df = load_dataset(path, KOLOM_FITUR + targets)
+
+    print(f"✅ Dataset loaded: {df.shape[0]} rows, {df.shape[1]} columns")
+    df = buang_tidak_dikenal(df, targets)
+    print("\nKolom yang tersedia:")
+    for col in df.columns:
+        print(f"  - {col}")
+
+    # 2. Explorasi Data (hanya saat dataset benar-benar dibaca ulang)
+    print("\n📈 Statistik Dataset:")
+    print(df.describe())
+
+    print("\n📋 Info Dataset:")
+    print(df.info())
+    return df
+
+
+def stage_encode(df):
+    # 3. Encoding Fitur Kategorikal (encoder yang sama dengan app.py)
+    print("\n🔄 Encoding fitur kategorikal...")
+    return encode_onehot(df[KOLOM_FITUR], training_feature_names())
 
-# 5. Split Data (80% training, 20% testing)
-print("\n✂️ Splitting data (80% train, 20% test)...")
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=0.2, random_state=42
-)
 
-print(f"✅ Training set: {X_train.shape[0]} samples")
-print(f"✅ Testing set: {X_test.shape[0]} samples")
+def target_y(df, targets):
+    # y 2 dimensi → semua target diselesaikan dari satu least squares (X sama)
+    return df[targets] if len(targets) > 1 else df[targets[0]]
 
-# 6. Training Model Linear Regression
-print("\n🤖 Training Linear Regression Model...")
-model = LinearRegression()
-model.fit(X_train, y_train)
 
+def stage_split(df, test_size, random_state):
+    # 5. Split Data: cukup index baris train & test (urutan sama dengan
+    # train_test_split pada X & y karena hanya bergantung pada jumlah baris)
+    print(f"\n✂️ Splitting data ({1 - test_size:.0%} train, {test_size:.0%} test)...")
+    return train_test_split(np.arange(len(df)), test_size=test_size, random_state=random_state)
+
+
+def stage_fit(df, X, split, targets):
+    # 6. Training Model Linear Regression + sufficient statistics untuk
+    # update inkremental (incremental.py) dari data training yang sama
+    idx_train, _ = split
+    X_train, y_train = X.iloc[idx_train], target_y(df, targets).iloc[idx_train]
+    print("\n🤖 Training Linear Regression Model...")
+    model = LinearRegression()
+    model.fit(X_train, y_train)
+
+    state = NormalEquations(X.columns, targets=targets)
+    state.update(X_train, y_train)
+    return model, state
+
+
+def stage_evaluate(df, X, split, fitted, targets):
+    # 7. Evaluasi Model: satu nilai per target (urutan sama dengan `targets`)
+    _, idx_test = split
+    model, _ = fitted
+    y_test = target_y(df, targets).iloc[idx_test]
+    y_pred = model.predict(X.iloc[idx_test])
+    return (
+        mean_absolute_error(y_test, y_pred, multioutput="raw_values"),
+        np.sqrt(mean_squared_error(y_test, y_pred, multioutput="raw_values")),
+        r2_score(y_test, y_pred, multioutput="raw_values"),
+    )
+
+
+def stage_subgroups(df, split, fitted, targets):
+    # Error per kelompok & irisan dua fitur pada data test (target pertama),
+    # dari satu agregasi residual per sel kategori; prediksi dibatasi 0-100
+    # di subgroup_errors, sama dengan subgroups.py & dashboard
+    _, idx_test = split
+    model, _ = fitted
+    test = df.iloc[idx_test]
+    kode = encode_codes(test)
+    prediksi = score_codes(kode, build_coef_lookup(model, training_feature_names())).reshape(len(test), -1)[:, 0]
+    return subgroup_errors(kode, test[targets[0]], prediksi, max_level=2)
+
+
+def stage_intervals(df, split, targets, n_bootstrap, n_jobs):
+    # 9. Interval Prediksi Bootstrap (semua resample di-fit sekaligus)
+    idx_train, _ = split
+    print(f"\n📏 Interval prediksi {LEVEL:.0%} ({n_bootstrap} resample bootstrap)...")
+    return prediction_intervals(df.iloc[idx_train], training_feature_names(), targets, n_bootstrap, n_jobs=n_jobs)
+
+
+def stage_export(fitted, split, evaluasi, targets, intervals):
+    # 10. Simpan Model (selalu ditulis: file output bisa saja sudah
+    # ditimpa incremental.py atau mode lain)
+    model, state = fitted
+    idx_train, idx_test = split
+    feature_names = training_feature_names()
+    print("\n💾 Menyimpan model...")
+    joblib.dump(model, "model.pkl")
+
+    # Simpan juga nama kolom untuk validasi di app.py
+    joblib.dump(feature_names, "feature_names.pkl")
+
+    # Artefak ringan untuk inference tanpa scikit-learn (dipakai app.py)
+    metrics = metrics_per_target(targets, *evaluasi, len(idx_train), len(idx_test))
+    checksum = export_artifact(
+        model, feature_names, OPSI_FITUR, ARTIFACT_PATH, metrics=metrics, targets=targets, intervals=intervals
+    )
+    state.model_checksum = checksum
+    state.save(STATE_PATH)
+    return checksum
+
+
+# 4. Tentukan y: ketiga nilai (multi-output) atau hanya math score
+targets = ["math score"] if args.math_only else KOLOM_SKOR
+print(f"\n🎯 Target: {', '.join(targets)}")
+
+feature_names = training_feature_names()
+print(f"\n✅ Fitur yang digunakan untuk prediksi ({len(feature_names)} fitur):")
+for col in feature_names:
+    print(f"  - {col}")
+
+# Kunci setiap stage = hash parameter + kunci stage input + source code-nya,
+# jadi stage yang input & kodenya tidak berubah dilewati (output dari cache)
+path_data = resolve_dataset_path(args.data)
+pipeline = Pipeline(args.cache_dir, enabled=not args.no_cache)
+load = pipeline.stage("load", stage_load, params={"path": path_data, "signature": file_signature(path_data), "targets": targets},
+                      sumber=[dataset, encoding, buang_tidak_dikenal])
+# Output encode (n x p float) tidak disimpan: membentuknya ulang dari kode
+# kategori lebih cepat daripada membacanya dari disk
+encode = pipeline.stage("encode", stage_encode, [load], sumber=[encoding], cache=False)
+split = pipeline.stage("split", stage_split, [load], params={"test_size": 0.2, "random_state": 42})
+fit = pipeline.stage("fit", stage_fit, [load, encode, split],
+                     params={"targets": targets}, sumber=[target_y, incremental], versi=sklearn.__version__)
+evaluate = pipeline.stage("evaluate", stage_evaluate, [load, encode, split, fit], params={"targets": targets},
+                          sumber=[target_y], versi=sklearn.__version__)
+subgroup = pipeline.stage("subgroups", stage_subgroups, [load, split, fit], params={"targets": targets},
+                          sumber=[subgroups, encoding])
+interval = pipeline.stage("intervals", stage_intervals, [load, split],
+                          params={"targets": targets, "n_bootstrap": args.bootstrap},
+                          runtime={"n_jobs": args.jobs}, sumber=[intervals, encoding, dashboard_stats])
+
+model, _ = fit.get()
+idx_train, idx_test = split.get()
+print(f"✅ Training set: {len(idx_train)} samples")
+print(f"✅ Testing set: {len(idx_test)} samples")
 print("✅ Model berhasil di-training!")
 
-# 7. Evaluasi Model
 print("\n📊 EVALUASI MODEL:")
 print("-" * 60)
+mae, rmse, r2 = evaluate.get()
+for i, target in enumerate(targets):
+    if len(targets) > 1:
+        print(f"[{target}]")
+    print(f"MAE  (Mean Absolute Error)     : {mae[i]:.2f}")
+    print(f"RMSE (Root Mean Squared Error) : {rmse[i]:.2f}")
+    print(f"R²   (Coefficient of Determination): {r2[i]:.4f}")
 
-y_pred = model.predict(X_test)
-
-mae = mean_absolute_error(y_test, y_pred)
-rmse = np.sqrt(mean_squared_error(y_test, y_pred))
-r2 = r2_score(y_test, y_pred)
-
-print(f"MAE  (Mean Absolute Error)     : {mae:.2f}")
-print(f"RMSE (Root Mean Squared Error) : {rmse:.2f}")
-print(f"R²   (Coefficient of Determination): {r2:.4f}")
+print("\n💡 Interpretasi:")
+print(f"   - Model rata-rata meleset {mae[0]:.2f} poin dari nilai matematika sebenarnya")
+print(f"   - Model menjelaskan {r2[0]*100:.2f}% variasi dalam nilai matematika")
 
-print(f"\n💡 Interpretasi:")
-print(f"   - Model rata-rata meleset {mae:.2f} poin dari nilai sebenarnya")
-print(f"   - Model menjelaskan {r2*100:.2f}% variasi dalam nilai matematika")
+# Kelompok dengan error terbesar (data test, minimal MIN_N siswa)
+error_subgroup = subgroup.get()
+kandidat = error_subgroup[(error_subgroup["level"] > 0) & (error_subgroup["n"] >= MIN_N)]
+print(f"\n⚖️ Subgroup dengan MAE terbesar ({targets[0]}, n ≥ {MIN_N}):")
+for _, baris in kandidat.nlargest(5, "mae").iterrows():
+    print(f"   MAE {baris['mae']:6.2f} | bias {baris['bias']:+6.2f} | n {baris['n']:>6,} | {label_subgroup(baris)}")
 
 # 8. Interpretasi Koefisien (Fitur paling berpengaruh)
 print("\n🔍 FITUR PALING BERPENGARUH:")
 print("-" * 60)
-coef = pd.Series(model.coef_, index=X.columns)
+# Koefisien target pertama (math score)
+coef = pd.Series(np.atleast_2d(model.coef_)[0], index=feature_names)
 top_features = coef.sort_values(ascending=False).head(5)
 
 print("Top 5 Fitur Positif (meningkatkan nilai):")
@@ -109,15 +372,21 @@ print("\nTop 5 Fitur Negatif (menurunkan nilai):")
 for feat, val in bottom_features.items():
     print(f"  {feat:40s} : {val:.2f}")
 
-# 9. Simpan Model
-print("\n💾 Menyimpan model...")
-joblib.dump(model, "model.pkl")
+hasil_interval = None
+if args.bootstrap > 0:
+    hasil_interval = interval.get()
+    lebar = np.subtract(hasil_interval["upper"], hasil_interval["lower"]).mean(axis=0)
+    for target, rata in zip(targets, lebar):
+        print(f"  {target:15s} lebar rata-rata ±{rata / 2:.2f} poin")
 
-# Simpan juga nama kolom untuk validasi di app.py
-joblib.dump(X.columns.tolist(), "feature_names.pkl")
+export = pipeline.stage("export", stage_export, [fit, split, evaluate],
+                        params={"targets": targets}, runtime={"intervals": hasil_interval}, cache=False)
+checksum = export.get()
 
 print("✅ Model disimpan ke 'model.pkl'")
 print("✅ Feature names disimpan ke 'feature_names.pkl'")
+print(f"✅ Artefak inference disimpan ke '{ARTIFACT_PATH}' (sha256: {checksum[:12]})")
+print(f"✅ State training (untuk 'python incremental.py') disimpan ke '{STATE_PATH}'")
 
 print("\n" + "=" * 60)
 print("✨ TRAINING SELESAI! Model siap digunakan di Streamlit")
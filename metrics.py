@@ -0,0 +1,141 @@
+"""
+📈 INSTRUMENTASI WAKTU HOT PATH & METRIK FORMAT PROMETHEUS
+
+Timer ringan (time.perf_counter + bisect ke bucket tetap) untuk load model,
+encoding input, prediksi dan rendering hasil, plus counter prediksi dan
+error. Semua metrik dikumpulkan di REGISTRY (satu per proses) dan bisa:
+- di-render sebagai teks format Prometheus (endpoint /metrics di server.py)
+- ditulis ke file 'metrics.prom' (app.py, dibaca node_exporter textfile
+  collector atau tools lain)
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from fileio import atomic_write
+
+METRICS_PATH = "metrics.prom"
+
+# Bucket latency (detik): 10 µs sampai 5 detik
+BUCKETS_DETIK = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+
+class Counter:
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help_text = help_text
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, n=1):
+        with self._lock:
+            self._value += n
+
+    def render(self):
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} counter",
+            f"{self.name} {self._value}",
+        ]
+
+
+class Histogram:
+    """Histogram bucket tetap: observe() O(log jumlah bucket), memori konstan."""
+
+    def __init__(self, name, help_text, buckets=BUCKETS_DETIK):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[i] += 1
+            self._sum += value
+
+    def render(self):
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+
+        baris = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        kumulatif = 0
+        for batas, jumlah in zip(self.buckets, counts):
+            kumulatif += jumlah
+            baris.append(f'{self.name}_bucket{{le="{batas:g}"}} {kumulatif}')
+        kumulatif += counts[-1]
+        baris.append(f'{self.name}_bucket{{le="+Inf"}} {kumulatif}')
+        baris.append(f"{self.name}_sum {total:.9f}")
+        baris.append(f"{self.name}_count {kumulatif}")
+        return baris
+
+
+class MetricsRegistry:
+    def __init__(self, prefix="prediksi_nilai"):
+        self.prefix = prefix
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self._terakhir_ditulis = 0.0
+
+    def _get(self, cls, name, help_text):
+        nama_penuh = f"{self.prefix}_{name}"
+        metric = self._metrics.get(nama_penuh)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.setdefault(nama_penuh, cls(nama_penuh, help_text))
+        return metric
+
+    def counter(self, name, help_text=""):
+        return self._get(Counter, name, help_text or name)
+
+    def histogram(self, name, help_text=""):
+        return self._get(Histogram, name, help_text or name)
+
+    def observe(self, span, seconds):
+        """Catat durasi satu span ke histogram '<span>_seconds'."""
+        self.histogram(f"{span}_seconds", f"Durasi {span} (detik)").observe(seconds)
+
+    @contextmanager
+    def span(self, name):
+        mulai = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - mulai)
+
+    def render(self):
+        """Semua metrik dalam format teks Prometheus."""
+        baris = []
+        for metric in list(self._metrics.values()):
+            baris.extend(metric.render())
+        return "\n".join(baris) + "\n"
+
+    def write_file(self, path=METRICS_PATH, min_interval=0.0):
+        """
+        Tulis metrik ke file secara atomik (fileio.atomic_write).
+
+        Dengan min_interval > 0 penulisan di-throttle supaya tidak ada I/O
+        file di setiap request.
+        """
+        sekarang = time.monotonic()
+        if sekarang - self._terakhir_ditulis < min_interval:
+            return False
+        self._terakhir_ditulis = sekarang
+
+        with atomic_write(path) as tmp, open(tmp, "w") as f:
+            f.write(self.render())
+        return True
+
+
+REGISTRY = MetricsRegistry()
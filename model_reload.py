@@ -0,0 +1,160 @@
+"""
+♻️ HOT RELOAD MODEL DENGAN SWAP ATOMIK
+
+Setelah main.py / incremental.py menulis artefak baru, app yang sedang
+berjalan otomatis memakai model baru tanpa restart proses (dan tanpa
+memutus session yang aktif):
+
+1. get() mengecek signature file artefak (mtime, ukuran) - hanya satu
+   os.stat, paling sering sekali per CHECK_INTERVAL detik
+2. Jika berubah, artefak di-load & divalidasi (versi, checksum, fitur
+   dikenal encoder) di thread background; request tetap dilayani model lama
+3. Model baru beserta tabel prediksinya dibungkus satu snapshot immutable
+   lalu dipasang dengan satu assignment referensi (atomik), jadi request
+   tidak pernah melihat campuran model lama & baru
+
+Artefak yang tidak valid (atau gagal di-load karena error apa pun) tidak
+dipasang: model lama tetap dipakai, pesan error disimpan di last_error dan
+signature file itu tidak dicoba lagi sampai file berubah.
+"""
+
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from artifact import ARTIFACT_PATH, load_artifact
+from encoding import UKURAN_SEL, build_coef_lookup, score_codes, cell_codes
+from fileio import file_signature
+from metrics import REGISTRY
+
+CHECK_INTERVAL = 1.0
+
+# Semua yang dibutuhkan satu request prediksi, dari SATU versi model
+ServingModel = namedtuple(
+    "ServingModel", ["model", "coef_lookup", "prediction_table", "interval_table", "signature", "loaded_at"]
+)
+
+
+def build_prediction_table(coef_lookup):
+    """
+    Prediksi untuk SEMUA kombinasi input (2 x 5 x 6 x 2 x 2 = 240) sekaligus.
+
+    Hasilnya array 5 dimensi yang di-index dengan kode kategori sesuai
+    urutan OPSI_FITUR, sehingga prediksi per klik cukup berupa lookup array.
+    Untuk model multi-output ada satu dimensi tambahan (k target), jadi satu
+    lookup langsung memberi semua nilai.
+    """
+    prediksi = score_codes(cell_codes(), coef_lookup)
+    return prediksi.reshape(UKURAN_SEL + prediksi.shape[1:])
+
+
+def build_interval_table(model):
+    """
+    Interval prediksi dari artefak sebagai tabel berindeks kode kategori
+    (seperti build_prediction_table), dengan dimensi terakhir (bawah, atas).
+
+    None jika artefak tidak membawa interval (misalnya hasil incremental.py).
+    """
+    if model.intervals is None:
+        return None
+    tabel = np.stack([model.intervals["lower"], model.intervals["upper"]], axis=-1)
+    if tabel.shape[1] == 1:
+        tabel = tabel[:, 0]
+    return tabel.reshape(UKURAN_SEL + tabel.shape[1:])
+
+
+def predict_cell(serving, kode):
+    """
+    Prediksi satu siswa dari kode kategori (tuple 5 int) dengan satu lookup
+    tabel: (target → nilai dibatasi 0-100, target → [bawah, atas]). Dict
+    rentang kosong jika artefak tidak membawa interval.
+    """
+    nilai = serving.prediction_table[kode].reshape(-1).tolist()
+    nilai_target = {target: max(0, min(100, v)) for target, v in zip(serving.model.targets, nilai)}
+    rentang = {}
+    if serving.interval_table is not None:
+        rentang = dict(zip(serving.model.targets, serving.interval_table[kode].reshape(-1, 2).tolist()))
+    return nilai_target, rentang
+
+
+def load_serving_model(path=ARTIFACT_PATH):
+    """
+    Load + validasi artefak dan siapkan lookup koefisien & tabel prediksi.
+
+    Raises:
+        FileNotFoundError: artefak belum dibuat
+        ValueError: artefak rusak atau fiturnya tidak dikenal encoder
+    """
+    with REGISTRY.span("model_load"):
+        # Signature diambil SEBELUM dibaca: jika file berubah saat di-load,
+        # pengecekan berikutnya tetap melihat perubahan itu
+        signature = file_signature(path)
+        model = load_artifact(path)
+        coef_lookup = build_coef_lookup(model, model.feature_names)
+        tabel = build_prediction_table(coef_lookup)
+        interval = build_interval_table(model)
+    return ServingModel(model, coef_lookup, tabel, interval, signature, time.time())
+
+
+class ModelHolder:
+    """Pemegang model aktif yang bisa diganti saat app berjalan."""
+
+    def __init__(self, path=ARTIFACT_PATH, check_interval=CHECK_INTERVAL):
+        self.path = path
+        self.check_interval = check_interval
+        self.last_error = None
+        self._signature_gagal = None
+        # Load pertama sinkron: belum ada model lain untuk melayani request
+        self._current = load_serving_model(path)
+        self._lock = threading.Lock()
+        self._reloading = False
+        self._terakhir_dicek = time.monotonic()
+        self._reloads = REGISTRY.counter("model_reloads_total", "Jumlah model baru yang dipasang tanpa restart")
+
+    def get(self):
+        """Snapshot model aktif; memicu reload background jika artefak berubah."""
+        self.check_for_update()
+        return self._current
+
+    def check_for_update(self):
+        """Cek signature artefak (non-blocking). Returns True jika reload dimulai."""
+        sekarang = time.monotonic()
+        if sekarang - self._terakhir_dicek < self.check_interval:
+            return False
+        self._terakhir_dicek = sekarang
+
+        try:
+            signature = file_signature(self.path)
+        except FileNotFoundError:
+            # Artefak sedang ditulis ulang / dihapus: tetap pakai model lama
+            return False
+        # Artefak yang gagal divalidasi tidak dicoba lagi sampai file berubah
+        if signature in (self._current.signature, self._signature_gagal):
+            return False
+
+        with self._lock:
+            if self._reloading:
+                return False
+            self._reloading = True
+        threading.Thread(target=self._reload, args=(signature,), name="model-reload", daemon=True).start()
+        return True
+
+    def _reload(self, signature):
+        try:
+            baru = load_serving_model(self.path)
+        except Exception as e:
+            # Error apa pun (termasuk yang tidak terduga) tidak boleh membuat
+            # thread reload mati diam-diam dan mencoba ulang file yang sama
+            self._signature_gagal = signature
+            self.last_error = f"{type(e).__name__}: {e}"
+        else:
+            self.last_error = None
+            if baru.model.checksum != self._current.model.checksum:
+                self._reloads.inc()
+            # Swap atomik: satu assignment referensi
+            self._current = baru
+        finally:
+            with self._lock:
+                self._reloading = False
@@ -0,0 +1,123 @@
+"""
+🧱 STAGE TRAINING DENGAN CACHE BERBASIS KONTEN
+
+Training biasa di main.py dipecah menjadi stage bernama (load → encode →
+split → fit → evaluate → intervals → export). Output setiap stage
+disimpan di CACHE_DIR dengan kunci sha256 dari:
+- nama stage & parameternya
+- kunci stage-stage input-nya, jadi perubahan di hulu otomatis mengubah
+  kunci semua stage di hilirnya
+- source code stage tersebut (fungsi stage + modul yang dipakainya) dan
+  versi library yang hasilnya bisa berbeda antar versi (misalnya sklearn)
+
+Kunci dihitung TANPA menjalankan stage, dan output baru di-load saat
+benar-benar dibutuhkan: jika fit & evaluate masih valid, dataset tidak
+dibaca sama sekali. Untuk file dataset, kuncinya memakai signature file
+(mtime, ukuran) seperti cache dashboard.
+
+Setiap stage menyimpan paling banyak MAKS_ENTRI versi output (yang
+terakhir dipakai), jadi berganti-ganti dataset / opsi tetap memakai cache tanpa
+direktori cache tumbuh tanpa batas.
+"""
+
+import glob
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import time
+
+import joblib
+
+from fileio import atomic_write
+
+CACHE_DIR = ".cache_training"
+MAKS_ENTRI = 3
+
+
+def _hash(*bagian):
+    teks = json.dumps(bagian, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(teks.encode("utf-8")).hexdigest()
+
+
+class Stage:
+    """Satu stage pipeline: kunci langsung dihitung, output dihitung / di-load saat get()."""
+
+    def __init__(self, pipeline, name, fn, deps, params, runtime, sumber, versi, cache):
+        self.pipeline = pipeline
+        self.name = name
+        self.fn = fn
+        self.deps = list(deps)
+        self.params = dict(params or {})
+        self.runtime = dict(runtime or {})
+        self.cache = cache
+        kode = [inspect.getsource(fn)] + [inspect.getsource(s) for s in sumber]
+        self.key = _hash(name, self.params, [dep.key for dep in self.deps], kode, versi)
+        self._selesai = False
+        self._value = None
+
+    @property
+    def path(self):
+        return os.path.join(self.pipeline.cache_dir, f"{self.name}-{self.key[:16]}.joblib")
+
+    def get(self):
+        if not self._selesai:
+            self._value = self._load() if self.cache and self.pipeline.enabled else None
+            if not self._selesai:
+                self._value = self._run()
+            self._selesai = True
+        return self._value
+
+    def _load(self):
+        try:
+            value = joblib.load(self.path)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            # Entri cache rusak (misalnya proses terhenti): hitung ulang
+            return None
+        # mtime diperbarui: entri yang sering dipakai tidak ikut dipangkas
+        os.utime(self.path)
+        self._selesai = True
+        self.pipeline.log(f"⚡ Stage '{self.name}': dari cache ({self.key[:12]})")
+        return value
+
+    def _run(self):
+        inputs = [dep.get() for dep in self.deps]
+        mulai = time.perf_counter()
+        value = self.fn(*inputs, **self.params, **self.runtime)
+        self.pipeline.log(f"⏱️ Stage '{self.name}': {time.perf_counter() - mulai:.2f} detik")
+        if self.cache and self.pipeline.enabled:
+            self.pipeline.save(self, value)
+        return value
+
+
+class Pipeline:
+    """
+    Kumpulan stage dengan cache di disk.
+
+    params stage ikut menentukan kunci cache; runtime (misalnya jumlah
+    proses) hanya diteruskan ke fungsi stage karena tidak mengubah hasil;
+    versi hanya ikut menentukan kunci (tidak diteruskan).
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, enabled=True, log=print):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.log = log
+
+    def stage(self, name, fn, deps=(), params=None, runtime=None, sumber=(), versi=None, cache=True):
+        return Stage(self, name, fn, deps, params, runtime, sumber, versi, cache)
+
+    def save(self, stage, value):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with atomic_write(stage.path) as tmp:
+            joblib.dump(value, tmp)
+
+        entri = sorted(
+            glob.glob(os.path.join(self.cache_dir, f"{stage.name}-*.joblib")),
+            key=os.path.getmtime, reverse=True,
+        )
+        for path in entri[MAKS_ENTRI:]:
+            os.remove(path)
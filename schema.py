@@ -0,0 +1,31 @@
+"""
+📋 SKEMA FITUR & TARGET
+
+Konstanta murni (hanya library standar) yang dipakai bersama encoding.py,
+artifact.py dan modul lain: opsi setiap fitur kategori, bentuk grid sel
+kategori dan target default. Sengaja tidak meng-import NumPy / pandas
+supaya loader ringan seperti artifact.py tetap cepat di-import.
+"""
+
+from math import prod
+
+# Urutan opsi = kode kategori (index) yang dipakai untuk lookup tabel prediksi
+OPSI_FITUR = {
+    "gender": ["female", "male"],
+    "race/ethnicity": ["group A", "group B", "group C", "group D", "group E"],
+    "parental level of education": [
+        "some high school", "high school", "some college",
+        "associate's degree", "bachelor's degree", "master's degree"
+    ],
+    "lunch": ["standard", "free/reduced"],
+    "test preparation course": ["none", "completed"],
+}
+
+KOLOM_FITUR = list(OPSI_FITUR)
+
+# Bentuk grid sel kategori (2 x 5 x 6 x 2 x 2): satu sel = satu kombinasi input
+UKURAN_SEL = tuple(len(opsi) for opsi in OPSI_FITUR.values())
+N_SEL = prod(UKURAN_SEL)
+
+# Target prediksi tunggal, dashboard & drift
+TARGET = "math score"
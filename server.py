@@ -0,0 +1,211 @@
+"""
+🌐 LAYANAN HTTP JSON UNTUK PREDIKSI NILAI MATEMATIKA
+
+Server HTTP mandiri (tanpa Streamlit) untuk sistem lain, misalnya SIS dan
+tools konselor. Model di-load sekali dengan cara yang sama seperti
+load_model() di app.py (artefak JSON, tanpa scikit-learn).
+
+Endpoint:
+    GET  /health          → status & checksum model
+    POST /predict         → satu siswa (objek JSON dengan 5 fitur)
+    POST /predict/batch   → banyak siswa ({"students": [ {...}, ... ]})
+    GET  /metrics         → latency & counter format teks Prometheus
+    GET  /drift           → PSI & chi-square input/prediksi yang dilayani vs
+                            dataset training (lihat drift.py)
+
+"prediction(s)" selalu berisi nilai matematika; untuk model multi-output
+respons juga memuat "scores" berisi nilai setiap target (math, reading,
+writing) dari satu prediksi yang sama.
+
+Server memakai HTTP/1.1 (keep-alive) dan satu thread per koneksi, jadi
+klien bisa mengirim banyak request lewat satu koneksi.
+
+Penggunaan:
+    python server.py [--host 127.0.0.1] [--port 8000] [--dataset StudentsPerformance.csv]
+"""
+
+import argparse
+import json
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from artifact import ARTIFACT_PATH, load_artifact
+from dataset import DATASET_PATH, load_dataset
+from drift import DriftMonitor, distribution_counts
+from encoding import KOLOM_FITUR, encode_codes, encode_records, build_coef_lookup, score_codes
+from metrics import REGISTRY
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+MAX_BATCH = 10_000
+
+prediksi_dilayani = REGISTRY.counter("predictions_served_total", "Jumlah siswa yang berhasil diprediksi")
+prediksi_error = REGISTRY.counter("prediction_errors_total", "Jumlah request prediksi yang ditolak (400/413)")
+
+
+class BodyTerlaluBesar(ValueError):
+    """Content-Length melebihi MAX_BODY_BYTES (dijawab 413)."""
+
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 → koneksi keep-alive secara default
+    protocol_version = "HTTP/1.1"
+    server_version = "PrediksiNilai/1.0"
+    # TCP_NODELAY: header & body dikirim terpisah, tanpa ini keep-alive
+    # tertahan delayed-ACK (~40 ms per request)
+    disable_nagle_algorithm = True
+
+    # Diisi oleh make_server()
+    model = None
+    coef_lookup = None
+    targets = None
+    monitor = None
+
+    def log_message(self, format, *args):
+        # Log per request dimatikan: terlalu mahal di ribuan request/detik
+        pass
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        # Body yang ditolak tidak dibaca: koneksi ditutup setelah respons,
+        # supaya sisa body tidak terbaca sebagai request berikutnya
+        try:
+            panjang = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            panjang = -1
+        if panjang < 0:
+            self.close_connection = True
+            raise ValueError("Content-Length tidak valid")
+        if panjang > MAX_BODY_BYTES:
+            self.close_connection = True
+            raise BodyTerlaluBesar(f"Body request terlalu besar (maksimal {MAX_BODY_BYTES:,} byte)")
+        return json.loads(self.rfile.read(panjang) or b"null")
+
+    def _predict(self, students):
+        with REGISTRY.span("encode"):
+            kode = encode_records(students)
+        with REGISTRY.span("predict"):
+            prediksi = score_codes(kode, self.coef_lookup).reshape(len(students), len(self.targets))
+        prediksi_dilayani.inc(len(students))
+        if self.monitor is not None:
+            self.monitor.observe(kode, prediksi[:, 0])
+        # Matriks (siswa x target); kolom pertama = math score
+        return np.clip(prediksi, 0, 100).round(2)
+
+    def _scores(self, prediksi):
+        return [dict(zip(self.targets, baris)) for baris in prediksi.tolist()]
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok", "model_checksum": self.model.checksum, "targets": self.targets})
+        elif self.path == "/metrics":
+            body = REGISTRY.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif self.path == "/drift":
+            if self.monitor is None:
+                self._send_json(503, {"error": "Monitoring drift tidak aktif (dataset training tidak tersedia)"})
+                return
+            laporan = self.monitor.report().replace({np.nan: None})
+            self._send_json(200, {"model_checksum": self.model.checksum, "drift": laporan.to_dict(orient="records")})
+        else:
+            self._send_json(404, {"error": "Endpoint tidak ditemukan"})
+
+    def do_POST(self):
+        try:
+            data = self._read_json()
+            if self.path == "/predict":
+                prediksi = self._predict([data])
+                respons = {"prediction": float(prediksi[0, 0])}
+                if len(self.targets) > 1:
+                    respons["scores"] = self._scores(prediksi)[0]
+                self._send_json(200, respons)
+            elif self.path == "/predict/batch":
+                students = data.get("students") if isinstance(data, dict) else None
+                if not isinstance(students, list):
+                    raise ValueError("Body harus berupa {\"students\": [...]}")
+                if len(students) > MAX_BATCH:
+                    raise ValueError(f"Maksimal {MAX_BATCH} siswa per request")
+                prediksi = self._predict(students)
+                respons = {"predictions": prediksi[:, 0].tolist()}
+                if len(self.targets) > 1:
+                    respons["scores"] = self._scores(prediksi)
+                self._send_json(200, respons)
+            else:
+                self._send_json(404, {"error": "Endpoint tidak ditemukan"})
+        except BodyTerlaluBesar as e:
+            prediksi_error.inc()
+            self._send_json(413, {"error": str(e)})
+        except ValueError as e:
+            # json.JSONDecodeError juga turunan ValueError
+            prediksi_error.inc()
+            self._send_json(400, {"error": str(e)})
+
+
+def make_drift_monitor(model, dataset_path=DATASET_PATH):
+    """Monitor drift dengan referensi dataset training; None jika dataset tidak ada."""
+    try:
+        kode = encode_codes(load_dataset(dataset_path, KOLOM_FITUR))
+    except (FileNotFoundError, ValueError):
+        return None
+    model_math = model.for_target(model.targets[0])
+    prediksi = score_codes(kode, build_coef_lookup(model_math, model_math.feature_names))
+    return DriftMonitor(distribution_counts(kode, prediksi), model.checksum)
+
+
+def make_server(host, port, artifact_path=ARTIFACT_PATH, dataset_path=DATASET_PATH):
+    """Load model sekali lalu buat server HTTP multi-thread."""
+    with REGISTRY.span("model_load"):
+        model = load_artifact(artifact_path)
+    handler = type("Handler", (PredictionHandler,), {
+        "model": model,
+        "coef_lookup": build_coef_lookup(model, model.feature_names),
+        "targets": model.targets,
+        "monitor": make_drift_monitor(model, dataset_path),
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Layanan HTTP JSON prediksi nilai matematika")
+    parser.add_argument("--host", default="127.0.0.1", help="Alamat bind server")
+    parser.add_argument("--port", type=int, default=8000, help="Port server")
+    parser.add_argument("--artifact", default=ARTIFACT_PATH, help="Path artefak model hasil main.py")
+    parser.add_argument("--dataset", default=DATASET_PATH, help="Dataset training sebagai referensi monitoring drift")
+    args = parser.parse_args(argv)
+
+    try:
+        server = make_server(args.host, args.port, args.artifact, args.dataset)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"⚠️ Model tidak bisa di-load: {e}")
+        print("   Jalankan 'python main.py' terlebih dahulu.")
+        return 1
+
+    print(f"🌐 Server prediksi berjalan di http://{args.host}:{args.port}")
+    print("   POST /predict | POST /predict/batch | GET /health | GET /metrics | GET /drift")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Server dihentikan")
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
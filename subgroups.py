@@ -0,0 +1,159 @@
+"""
+⚖️ ANALISIS ERROR PER SUBGROUP & IRISAN FITUR
+
+MAE, RMSE dan bias model untuk setiap kelompok demografi (misalnya
+"lunch = free/reduced") dan setiap irisan fitur (misalnya "group A x
+free/reduced x none"), sampai ke ke-240 sel kombinasi kelima fitur.
+
+Tidak ada filter per subgroup: residual (nilai asli - prediksi) cukup
+diagregasi SEKALI per sel kategori (np.bincount: jumlah siswa, Σe, Σ|e|,
+Σe²). Agregat semua subgroup lain adalah jumlah sel-sel di dalamnya,
+yaitu penjumlahan tensor 2 x 5 x 6 x 2 x 2 sepanjang fitur yang tidak
+dipakai, jadi biayanya tidak bergantung pada jumlah baris.
+
+bias = rata-rata residual: positif berarti model memprediksi terlalu
+RENDAH untuk kelompok itu, negatif terlalu tinggi. Residual selalu
+dihitung terhadap prediksi yang dibatasi 0-100 (residuals()), yaitu nilai
+yang ditampilkan app, jadi CLI ini, main.py & dashboard memberi angka sama.
+
+Penggunaan:
+    python subgroups.py                        # dataset asli, artefak model aktif
+    python subgroups.py data_evaluasi.parquet --level 3 --min-n 100
+"""
+
+import argparse
+import itertools
+import sys
+
+import numpy as np
+import pandas as pd
+
+from artifact import ARTIFACT_PATH, TARGET_DEFAULT, load_artifact
+from dataset import DATASET_PATH, load_dataset
+from encoding import (
+    OPSI_FITUR, KOLOM_FITUR, UKURAN_SEL, N_SEL, encode_codes, valid_rows, cell_index,
+    build_coef_lookup, score_codes,
+)
+
+KOLOM_METRIK = ["n", "mae", "rmse", "bias"]
+# Jumlah siswa minimal supaya metrik sebuah subgroup cukup stabil untuk dilaporkan
+MIN_N = 30
+
+
+def residuals(y, prediksi):
+    """Nilai asli - prediksi yang dibatasi 0-100 (sama seperti yang ditampilkan app)."""
+    return np.asarray(y, dtype=float) - np.clip(np.asarray(prediksi, dtype=float), 0, 100)
+
+
+def cell_aggregates(kode, residual, bobot=None):
+    """
+    Agregat residual per sel kategori: array (4 x 2 x 5 x 6 x 2 x 2) berisi
+    jumlah siswa, Σe, Σ|e| dan Σe² setiap sel.
+
+    bobot (opsional) = jumlah siswa setiap baris, misalnya untuk histogram
+    (sel, nilai) → jumlah. Baris dengan kategori tidak dikenal atau
+    residual NaN diabaikan.
+    """
+    residual = np.asarray(residual, dtype=float)
+    bobot = np.ones(len(residual)) if bobot is None else np.asarray(bobot, dtype=float)
+    valid = valid_rows(kode) & ~np.isnan(residual)
+    sel = cell_index(kode[valid])
+    e, w = residual[valid], bobot[valid]
+
+    agregat = np.stack([
+        np.bincount(sel, weights=bagian, minlength=N_SEL)
+        for bagian in (w, w * e, w * np.abs(e), w * e * e)
+    ])
+    return agregat.reshape((4,) + UKURAN_SEL)
+
+
+def subgroup_table(agregat, max_level=len(KOLOM_FITUR), min_n=1):
+    """
+    Metrik setiap subgroup dari agregat per sel (lihat cell_aggregates).
+
+    Returns:
+        DataFrame satu baris per subgroup: level (jumlah fitur yang
+        dipakai, 0 = seluruh data), nilai setiap fitur (kosong jika fitur
+        tidak dipakai), n, mae, rmse, bias. Subgroup dengan n < min_n
+        tidak ikut.
+    """
+    bagian = []
+    for level in range(max_level + 1):
+        for fitur in itertools.combinations(range(len(KOLOM_FITUR)), level):
+            lain = tuple(1 + j for j in range(len(KOLOM_FITUR)) if j not in fitur)
+            total = agregat.sum(axis=lain).reshape(4, -1)
+            kode = np.unravel_index(np.arange(total.shape[1]), [UKURAN_SEL[j] for j in fitur]) if fitur else ()
+            tabel = pd.DataFrame({"level": level}, index=range(total.shape[1]))
+            for j, kode_fitur in zip(fitur, kode):
+                tabel[KOLOM_FITUR[j]] = np.asarray(OPSI_FITUR[KOLOM_FITUR[j]], dtype=object)[kode_fitur]
+            n, jumlah, jumlah_abs, jumlah_kuadrat = total
+            with np.errstate(invalid="ignore", divide="ignore"):
+                tabel["n"] = n
+                tabel["mae"] = jumlah_abs / n
+                tabel["rmse"] = np.sqrt(jumlah_kuadrat / n)
+                tabel["bias"] = jumlah / n
+            bagian.append(tabel[n >= max(min_n, 1)])
+
+    hasil = pd.concat(bagian, ignore_index=True)
+    hasil = hasil.reindex(columns=["level"] + KOLOM_FITUR + KOLOM_METRIK)
+    return hasil.astype({"n": int})
+
+
+def subgroup_errors(kode, y, prediksi, max_level=len(KOLOM_FITUR), min_n=1):
+    """Metrik error per subgroup langsung dari kode kategori, nilai asli & prediksi."""
+    return subgroup_table(cell_aggregates(kode, residuals(y, prediksi)), max_level, min_n)
+
+
+def label_subgroup(baris):
+    """Label ringkas satu baris tabel subgroup, misalnya 'lunch=standard × test preparation course=none'."""
+    bagian = [f"{kolom}={baris[kolom]}" for kolom in KOLOM_FITUR if isinstance(baris[kolom], str)]
+    return " × ".join(bagian) or "semua siswa"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analisis error model per subgroup & irisan fitur")
+    parser.add_argument("data", nargs="?", default=DATASET_PATH, help="Dataset evaluasi (CSV / Parquet)")
+    parser.add_argument("--artifact", default=ARTIFACT_PATH, help="Path artefak model hasil main.py")
+    parser.add_argument("--target", default=TARGET_DEFAULT[0], help="Target yang dievaluasi")
+    parser.add_argument("--level", type=int, default=2, help="Jumlah fitur maksimal per irisan (1-5)")
+    parser.add_argument("--min-n", type=int, default=MIN_N, help="Jumlah siswa minimal per subgroup")
+    parser.add_argument("--top", type=int, default=10, help="Jumlah subgroup dengan MAE terbesar yang ditampilkan")
+    parser.add_argument("--output", help="Simpan tabel lengkap ke CSV")
+    args = parser.parse_args(argv)
+
+    try:
+        model = load_artifact(args.artifact).for_target(args.target)
+        df = load_dataset(args.data, KOLOM_FITUR + [args.target])
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    kode = encode_codes(df)
+    prediksi = score_codes(kode, build_coef_lookup(model, model.feature_names))
+    agregat = cell_aggregates(kode, residuals(df[args.target], prediksi))
+    tabel = subgroup_table(agregat, args.level, args.min_n)
+
+    # Baris level 0 (seluruh data) dihitung tanpa filter min_n, jadi tetap
+    # ada walaupun n keseluruhan < min_n
+    keseluruhan = subgroup_table(agregat, max_level=0)
+    if keseluruhan.empty:
+        print(f"❌ Tidak ada baris dengan kategori valid & nilai '{args.target}' di '{args.data}'")
+        return 1
+    keseluruhan = keseluruhan.iloc[0]
+    subgroup = tabel[tabel["level"] > 0]
+    print(f"⚖️ Error per subgroup '{args.target}' pada {int(keseluruhan['n']):,} siswa "
+          f"({len(subgroup):,} subgroup, irisan ≤ {args.level} fitur, n ≥ {args.min_n})")
+    print(f"   Keseluruhan: MAE {keseluruhan['mae']:.2f} | RMSE {keseluruhan['rmse']:.2f} | "
+          f"bias {keseluruhan['bias']:+.2f}")
+    print("-" * 60)
+    for _, baris in subgroup.nlargest(args.top, "mae").iterrows():
+        print(f"  MAE {baris['mae']:6.2f} | bias {baris['bias']:+6.2f} | n {baris['n']:>9,} | {label_subgroup(baris)}")
+
+    if args.output:
+        tabel.to_csv(args.output, index=False)
+        print(f"\n✅ Tabel lengkap disimpan ke '{args.output}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
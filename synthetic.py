@@ -0,0 +1,151 @@
+"""
+🧪 GENERATOR DATA SISWA SINTETIS (UNTUK UJI SKALA & LOAD TEST)
+
+Distribusi dipelajari dari dataset asli:
+- Distribusi gabungan kelima fitur: peluang setiap sel kategori
+  (2 x 5 x 6 x 2 x 2 = 240 sel) = proporsi siswa di sel tersebut
+- Distribusi nilai per sel: rata-rata (math, reading, writing) sel itu
+  ditambah residual yang diambil acak dari residual seluruh siswa asli,
+  jadi bentuk sebaran & korelasi antar ketiga nilai ikut terbawa
+
+Output ditulis per chunk (memori ~ chunksize, bukan N) dalam skema yang
+sama dengan StudentsPerformance.csv, sebagai CSV atau Parquet. Hasil
+selalu sama untuk kombinasi (seed, chunksize) yang sama.
+
+Penggunaan:
+    python synthetic.py 1000000 --output sintetis_1m.parquet
+    python synthetic.py 100000000 --output sintetis_100m.csv --seed 7
+"""
+
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from encoding import OPSI_FITUR, KOLOM_FITUR, N_SEL, encode_codes, valid_rows, cell_index, cell_codes
+from dataset import DATASET_PATH, KOLOM_SKOR, load_dataset
+from fileio import atomic_write
+
+
+class SyntheticGenerator:
+    """Distribusi sel kategori + nilai per sel hasil fit dari dataset asli."""
+
+    def __init__(self, cell_prob, cell_mean, residuals):
+        self.cell_prob = np.asarray(cell_prob, dtype=float)
+        self.cell_mean = np.asarray(cell_mean, dtype=float)
+        self.residuals = np.asarray(residuals, dtype=float)
+
+    @classmethod
+    def fit(cls, df):
+        """Fit dari DataFrame berisi kelima fitur dan ketiga nilai ujian."""
+        kode = encode_codes(df)
+        valid = valid_rows(kode)
+        if not valid.any():
+            raise ValueError("Dataset tidak berisi baris dengan kategori yang valid")
+
+        sel = cell_index(kode[valid])
+        skor = df[KOLOM_SKOR].to_numpy(dtype=float)[valid]
+
+        jumlah = np.bincount(sel, minlength=N_SEL)
+        total = np.stack([
+            np.bincount(sel, weights=skor[:, j], minlength=N_SEL)
+            for j in range(len(KOLOM_SKOR))
+        ], axis=1)
+        # Sel kosong punya peluang 0, rata-ratanya tidak pernah dipakai
+        cell_mean = total / np.maximum(jumlah, 1)[:, None]
+
+        return cls(jumlah / jumlah.sum(), cell_mean, skor - cell_mean[sel])
+
+    def sample(self, n, rng):
+        """n siswa sintetis sebagai DataFrame (kategori Categorical, nilai uint8)."""
+        sel = rng.choice(len(self.cell_prob), size=n, p=self.cell_prob)
+        residual = self.residuals[rng.integers(len(self.residuals), size=n)]
+        skor = np.clip(np.rint(self.cell_mean[sel] + residual), 0, 100).astype(np.uint8)
+
+        kode = cell_codes(sel)
+        data = {
+            kolom: pd.Categorical.from_codes(kode[:, j], categories=opsi)
+            for j, (kolom, opsi) in enumerate(OPSI_FITUR.items())
+        }
+        data.update({kolom: skor[:, j] for j, kolom in enumerate(KOLOM_SKOR)})
+        return pd.DataFrame(data)
+
+    def iter_chunks(self, n, chunksize=1_000_000, seed=42):
+        """Generate n siswa per chunk; setiap chunk punya RNG turunan dari seed."""
+        n_chunk = -(-n // chunksize)
+        for i, seed_chunk in enumerate(np.random.SeedSequence(seed).spawn(n_chunk)):
+            ukuran = min(chunksize, n - i * chunksize)
+            yield self.sample(ukuran, np.random.default_rng(seed_chunk))
+
+
+def fit_generator(path=DATASET_PATH):
+    """Fit generator dari dataset asli (CSV / Parquet)."""
+    return SyntheticGenerator.fit(load_dataset(path, KOLOM_FITUR + KOLOM_SKOR))
+
+
+def write_synthetic(generator, n, output, chunksize=1_000_000, seed=42, progress=None):
+    """
+    Tulis n siswa sintetis ke output (.csv atau .parquet) per chunk.
+
+    Returns:
+        jumlah baris yang ditulis
+    """
+    parquet = output.endswith(".parquet")
+    if not parquet and not output.endswith(".csv"):
+        raise ValueError(f"Format output tidak didukung: '{output}' (gunakan .csv atau .parquet)")
+
+    writer = None
+    ditulis = 0
+    with atomic_write(output) as tmp:
+        try:
+            for i, chunk in enumerate(generator.iter_chunks(n, chunksize, seed)):
+                if parquet:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(tmp, table.schema, compression="zstd")
+                    writer.write_table(table)
+                else:
+                    chunk.to_csv(tmp, mode="w" if i == 0 else "a", header=(i == 0), index=False)
+                ditulis += len(chunk)
+                if progress:
+                    progress(ditulis)
+        finally:
+            if writer is not None:
+                writer.close()
+    return ditulis
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generator data siswa sintetis")
+    parser.add_argument("rows", type=int, help="Jumlah siswa yang di-generate")
+    parser.add_argument("--output", required=True, help="File output (.csv atau .parquet)")
+    parser.add_argument("--data", default=DATASET_PATH, help="Dataset asli untuk fit distribusi")
+    parser.add_argument("--seed", type=int, default=42, help="Seed RNG (hasil reprodusibel)")
+    parser.add_argument("--chunksize", type=int, default=1_000_000, help="Jumlah baris per chunk")
+    args = parser.parse_args(argv)
+
+    if args.rows <= 0 or args.chunksize <= 0:
+        print("❌ Jumlah baris dan chunksize harus lebih dari 0")
+        return 1
+
+    try:
+        generator = fit_generator(args.data)
+        print(f"🧪 Distribusi di-fit dari '{args.data}' "
+              f"({int((generator.cell_prob > 0).sum())} dari {generator.cell_prob.size} sel terisi)")
+        n = write_synthetic(
+            generator, args.rows, args.output, args.chunksize, args.seed,
+            progress=lambda ditulis: print(f"   {ditulis:,} / {args.rows:,} baris", end="\r"),
+        )
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"\n✅ {n:,} siswa sintetis disimpan ke '{args.output}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+"""Loader artefak harus tetap ringan: tanpa scikit-learn, pandas maupun SciPy."""
+
+import subprocess
+import sys
+
+
+def test_import_artifact_tidak_memuat_library_berat():
+    # Proses baru: proses pytest sendiri sudah meng-import pandas lewat test lain
+    kode = (
+        "import sys, artifact; "
+        "print(','.join(m for m in ('sklearn', 'pandas', 'scipy') if m in sys.modules))"
+    )
+    hasil = subprocess.run([sys.executable, "-c", kode], capture_output=True, text=True, check=True)
+    assert hasil.stdout.strip() == ""
@@ -0,0 +1,44 @@
+"""Loader dataset: nilai kosong tetap terbaca, CSV & Parquet memberi dtype yang sama."""
+
+import pandas as pd
+
+from dataset import KOLOM_SKOR, convert_to_parquet, iter_dataset, load_dataset
+from encoding import KOLOM_FITUR
+
+CSV = """gender,race/ethnicity,parental level of education,lunch,test preparation course,math score,reading score,writing score
+female,group B,bachelor's degree,standard,none,72,72,74
+male,group C,some college,free/reduced,completed,,90,88
+female,group A,high school,standard,none,90,95,93
+"""
+
+
+def tulis_csv(tmp_path):
+    path = tmp_path / "siswa.csv"
+    path.write_text(CSV)
+    return str(path)
+
+
+def test_csv_dengan_nilai_kosong_bisa_dibaca(tmp_path):
+    df = load_dataset(tulis_csv(tmp_path))
+
+    assert len(df) == 3
+    assert df["math score"].isna().sum() == 1
+    assert df["math score"].dtype == pd.UInt8Dtype()
+    assert isinstance(df["gender"].dtype, pd.CategoricalDtype)
+
+
+def test_parquet_dtype_sama_dengan_csv(tmp_path):
+    csv_path = tulis_csv(tmp_path)
+    dari_csv = load_dataset(csv_path)
+    parquet, n = convert_to_parquet(csv_path)
+
+    dari_parquet = load_dataset(parquet)
+    assert n == 3
+    for kolom in KOLOM_SKOR:
+        assert dari_parquet[kolom].dtype == dari_csv[kolom].dtype
+    pd.testing.assert_frame_equal(
+        dari_parquet[KOLOM_SKOR], dari_csv[KOLOM_SKOR], check_dtype=True
+    )
+    chunk = next(iter_dataset(parquet, KOLOM_FITUR + ["math score"]))
+    assert chunk["math score"].dtype == pd.UInt8Dtype()
+    assert list(chunk.columns) == KOLOM_FITUR + ["math score"]
@@ -0,0 +1,46 @@
+"""Monitor drift: PSI & chi-square, dan state yang ditulis ke file."""
+
+import numpy as np
+
+from drift import DriftMonitor, chi_square, distribution_counts, drift_report, load_state, psi
+
+
+def data_kode(n, seed):
+    rng = np.random.default_rng(seed)
+    kode = np.column_stack([rng.integers(0, k, n) for k in (2, 5, 6, 2, 2)]).astype(np.int8)
+    return kode, rng.uniform(0, 100, n)
+
+
+def test_psi_nol_untuk_distribusi_identik():
+    jumlah = np.array([10, 20, 30, 40])
+    assert psi(jumlah, jumlah) == 0.0
+    # Proporsi yang sama dengan jumlah total berbeda juga identik
+    assert abs(psi(jumlah, jumlah * 7)) < 1e-12
+    _, p_value = chi_square(jumlah, jumlah * 7)
+    assert p_value > 0.99
+
+
+def test_psi_besar_untuk_distribusi_bergeser():
+    assert psi(np.array([90, 10]), np.array([10, 90])) > 0.25
+
+
+def test_laporan_stabil_untuk_input_dari_distribusi_yang_sama():
+    referensi = distribution_counts(*data_kode(20_000, seed=0))
+    observasi = distribution_counts(*data_kode(5_000, seed=1))
+
+    laporan = drift_report(referensi, observasi)
+    assert (laporan["status"] == "stabil").all()
+
+
+def test_state_monitor_bisa_dibaca_ulang(tmp_path):
+    kode, prediksi = data_kode(100, seed=2)
+    monitor = DriftMonitor(distribution_counts(kode, prediksi), model_checksum="abc")
+    kode[0, 0] = -1
+    monitor.observe(kode, prediksi)
+
+    path = tmp_path / "drift_state.npz"
+    monitor.write_file(str(path))
+    referensi, observasi, checksum = load_state(str(path))
+    assert checksum == "abc"
+    assert observasi.tidak_dikenal[0] == 1
+    assert observasi.prediksi.sum() == 100
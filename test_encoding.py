@@ -0,0 +1,37 @@
+"""Encoding training: nilai kategori tidak dikenal tidak boleh menjadi baris nol."""
+
+import pandas as pd
+import pytest
+
+from encoding import training_feature_names, drop_unknown, encode_onehot
+
+
+def data_siswa(gender="male"):
+    return pd.DataFrame({
+        "gender": ["female", gender],
+        "race/ethnicity": ["group A", "group E"],
+        "parental level of education": ["high school", "master's degree"],
+        "lunch": ["standard", "free/reduced"],
+        "test preparation course": ["none", "completed"],
+        "math score": [60, 80],
+    })
+
+
+def test_encode_onehot_menolak_kategori_tidak_dikenal():
+    with pytest.raises(ValueError, match="1 baris"):
+        encode_onehot(data_siswa("Male "), training_feature_names())
+
+
+def test_drop_unknown_membuang_dan_melaporkan():
+    df, dibuang = drop_unknown(data_siswa("Male "))
+    assert dibuang == 1
+    assert df["gender"].tolist() == ["female"]
+
+    X = encode_onehot(df, training_feature_names())
+    assert X.shape == (1, len(training_feature_names()))
+
+
+def test_drop_unknown_data_valid_tidak_berubah():
+    df, dibuang = drop_unknown(data_siswa())
+    assert dibuang == 0
+    assert len(df) == 2
@@ -0,0 +1,66 @@
+"""Training streaming & update inkremental: baris berkategori tidak dikenal tidak ikut statistik."""
+
+import numpy as np
+import pandas as pd
+
+from encoding import training_feature_names
+from incremental import NormalEquations, append_batch, train_streaming
+
+
+def tulis_data(path, n=200, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "gender": rng.choice(["female", "male"], n),
+        "race/ethnicity": rng.choice(["group A", "group B", "group C", "group D", "group E"], n),
+        "parental level of education": rng.choice(["high school", "some college", "master's degree"], n),
+        "lunch": rng.choice(["standard", "free/reduced"], n),
+        "test preparation course": rng.choice(["none", "completed"], n),
+        "math score": rng.integers(0, 101, n),
+        "reading score": rng.integers(0, 101, n),
+        "writing score": rng.integers(0, 101, n),
+    })
+    df.loc[0, "gender"] = "Male "
+    df.to_csv(path, index=False)
+    return df
+
+
+def test_train_streaming_membuang_baris_tidak_dikenal(tmp_path):
+    path = tmp_path / "siswa.csv"
+    tulis_data(path)
+    pesan = []
+
+    state, _, metrics = train_streaming(str(path), training_feature_names(), chunksize=64, log=pesan.append)
+
+    # Training & evaluasi memakai mask yang sama: total = baris valid saja
+    assert metrics["n_train"] + metrics["n_test"] == 199
+    assert state.n == metrics["n_train"]
+    assert pesan == ["⚠️ 1 baris dengan nilai kategori tidak dikenal dibuang"]
+
+
+def test_append_batch_tidak_menyimpan_baris_tidak_dikenal(tmp_path):
+    path = tmp_path / "batch.csv"
+    tulis_data(path, n=50, seed=1)
+    state = NormalEquations(training_feature_names())
+    pesan = []
+
+    metrics = append_batch(str(path), state, chunksize=16, log=pesan.append)
+
+    assert state.n == metrics["n_test"] == 49
+    # Kolom konstanta di XᵀX = jumlah baris yang masuk statistik
+    assert state.xtx[0, 0] == 49
+    assert pesan == ["⚠️ 1 baris dengan nilai kategori tidak dikenal dibuang"]
+
+
+def test_train_streaming_membuang_nilai_target_kosong(tmp_path):
+    path = tmp_path / "siswa.csv"
+    df = tulis_data(path)
+    df["math score"] = df["math score"].astype("Int64")
+    df.loc[1, "math score"] = None
+    df.to_csv(path, index=False)
+    pesan = []
+
+    state, _, metrics = train_streaming(str(path), training_feature_names(), chunksize=64, log=pesan.append)
+
+    assert metrics["n_train"] + metrics["n_test"] == 198
+    assert "⚠️ 1 baris dengan nilai target kosong dibuang" in pesan
+    assert np.isfinite(state.xty).all()
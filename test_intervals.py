@@ -0,0 +1,53 @@
+"""Interval prediksi bootstrap: coverage, kuantil campuran & stabilitas terhadap urutan data."""
+
+import numpy as np
+import pandas as pd
+
+from dashboard_stats import score_histogram
+from encoding import cell_index, encode_codes, training_feature_names
+from intervals import _kuantil_campuran, bootstrap_intervals
+from schema import OPSI_FITUR, TARGET
+
+
+def data_linear(n, seed):
+    """Siswa acak dengan nilai = model linear + noise normal (sd 8), dibulatkan 0-100."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({kolom: rng.choice(opsi, n) for kolom, opsi in OPSI_FITUR.items()})
+    nilai = (
+        60 + 10 * (df["lunch"] == "standard") + 6 * (df["test preparation course"] == "completed")
+        - 4 * (df["gender"] == "female") + rng.normal(0, 8, n)
+    )
+    df[TARGET] = np.clip(np.rint(nilai), 0, 100).astype(int)
+    return df
+
+
+def test_coverage_pada_data_baru_mendekati_level():
+    train, uji = data_linear(5000, seed=0), data_linear(5000, seed=1)
+    bawah, atas = bootstrap_intervals(score_histogram(train), training_feature_names(), n_bootstrap=100, seed=0)
+
+    sel = cell_index(encode_codes(uji))
+    y = uji[TARGET].to_numpy()
+    coverage = ((y >= bawah[sel]) & (y <= atas[sel])).mean()
+    assert 0.93 <= coverage <= 0.97
+
+
+def test_hasil_tidak_bergantung_pada_urutan_histogram():
+    hist = score_histogram(data_linear(2000, seed=2))
+    feature_names = training_feature_names()
+
+    asli = bootstrap_intervals(hist, feature_names, n_bootstrap=50, seed=7)
+    diacak = bootstrap_intervals(hist.sample(frac=1, random_state=3), feature_names, n_bootstrap=50, seed=7)
+    np.testing.assert_array_equal(asli[0], diacak[0])
+    np.testing.assert_array_equal(asli[1], diacak[1])
+
+
+def test_kuantil_campuran_satu_resample_sama_dengan_kuantil_residual():
+    # Satu resample dengan prediksi 0: campuran = distribusi residual itu sendiri
+    residual = np.arange(1.0, 11.0)
+    bobot = np.ones(10)
+    prediksi = np.zeros((1, 3))
+
+    # CDF(t) ≥ 0.25 pertama kali di residual ke-3 (3 dari 10)
+    np.testing.assert_allclose(_kuantil_campuran(prediksi, residual, bobot, 0.25), 3.0, atol=1e-3)
+    # Prediksi yang bergeser menggeser kuantil dengan jumlah yang sama
+    np.testing.assert_allclose(_kuantil_campuran(prediksi + 5, residual, bobot, 0.25), 8.0, atol=1e-3)
@@ -0,0 +1,45 @@
+"""Cache stage pipeline: hit saat input sama, miss (juga di hilir) saat input berubah."""
+
+from pipeline import Pipeline
+
+dipanggil = []
+
+
+def stage_angka(n):
+    dipanggil.append("angka")
+    return list(range(n))
+
+
+def stage_jumlah(angka):
+    dipanggil.append("jumlah")
+    return sum(angka)
+
+
+def jalankan(cache_dir, n=10, versi="1"):
+    pipeline = Pipeline(str(cache_dir), log=lambda pesan: None)
+    angka = pipeline.stage("angka", stage_angka, params={"n": n})
+    jumlah = pipeline.stage("jumlah", stage_jumlah, [angka], versi=versi)
+    return jumlah.get()
+
+
+def test_input_sama_dari_cache(tmp_path):
+    dipanggil.clear()
+    assert jalankan(tmp_path) == 45
+    assert jalankan(tmp_path) == 45
+    # Run kedua: stage hilir dari cache, stage hulu bahkan tidak perlu di-load
+    assert dipanggil == ["angka", "jumlah"]
+
+
+def test_param_hulu_berubah_menghitung_ulang_hilir(tmp_path):
+    jalankan(tmp_path)
+    dipanggil.clear()
+    assert jalankan(tmp_path, n=5) == 10
+    assert dipanggil == ["angka", "jumlah"]
+
+
+def test_versi_berubah_menghitung_ulang_stage_itu_saja(tmp_path):
+    jalankan(tmp_path)
+    dipanggil.clear()
+    assert jalankan(tmp_path, versi="2") == 45
+    # Stage hulu tetap dari cache, hanya stage dengan versi baru yang dijalankan
+    assert dipanggil == ["jumlah"]
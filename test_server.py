@@ -0,0 +1,75 @@
+"""Layanan HTTP: request yang tidak valid dijawab 4xx, bukan error server."""
+
+import http.client
+import json
+import socket
+import threading
+
+import pytest
+
+import server
+from server import make_server
+
+SISWA = {
+    "gender": "female",
+    "race/ethnicity": "group B",
+    "parental level of education": "bachelor's degree",
+    "lunch": "standard",
+    "test preparation course": "none",
+}
+
+
+@pytest.fixture(scope="module")
+def alamat():
+    httpd = make_server("127.0.0.1", 0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def post(alamat, path, body):
+    koneksi = http.client.HTTPConnection(*alamat, timeout=10)
+    koneksi.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+    respons = koneksi.getresponse()
+    hasil = respons.status, json.loads(respons.read()), respons.getheader("Connection")
+    koneksi.close()
+    return hasil
+
+
+def test_prediksi_valid(alamat):
+    status, data, _ = post(alamat, "/predict", json.dumps(SISWA))
+    assert status == 200
+    assert 0 <= data["prediction"] <= 100
+
+
+@pytest.mark.parametrize("body", [
+    "{bukan json",
+    json.dumps({**SISWA, "gender": "Male "}),
+    json.dumps({"lunch": "standard"}),
+    json.dumps([SISWA]),
+])
+def test_payload_tidak_valid_dijawab_400(alamat, body):
+    status, data, _ = post(alamat, "/predict", body)
+    assert status == 400
+    assert data["error"]
+
+
+def test_batch_tanpa_daftar_students_dijawab_400(alamat):
+    status, _, _ = post(alamat, "/predict/batch", json.dumps({"siswa": [SISWA]}))
+    assert status == 400
+
+
+def test_body_terlalu_besar_dijawab_413_dan_koneksi_ditutup(alamat, monkeypatch):
+    monkeypatch.setattr(server, "MAX_BODY_BYTES", 100)
+    status, _, connection = post(alamat, "/predict", json.dumps(SISWA))
+    assert status == 413
+    assert connection == "close"
+
+
+def test_content_length_negatif_dijawab_400(alamat):
+    with socket.create_connection(alamat, timeout=10) as sock:
+        sock.sendall(b"POST /predict HTTP/1.1\r\nHost: x\r\nContent-Length: -5\r\n\r\n")
+        baris_status = sock.makefile("rb").readline()
+    assert b" 400 " in baris_status
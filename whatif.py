@@ -0,0 +1,146 @@
+"""
+🧭 SIMULASI WHAT-IF INTERVENSI UNTUK SATU KOHORT SISWA
+
+Sebuah kebijakan adalah daftar intervensi, misalnya "ubah kursus persiapan
+menjadi completed untuk siswa dengan makan siang bersubsidi". Untuk setiap
+siswa dihitung prediksi baseline dan counterfactual (setelah intervensi)
+dalam satu pass vectorized atas kode kategori (encode_codes), sehingga:
+
+- kohort di-encode SEKALI lalu dipakai ulang untuk banyak kebijakan
+- 100 ribu siswa x beberapa kebijakan tetap jauh di bawah satu detik
+
+Penggunaan:
+    python whatif.py                      # katalog kebijakan pada dataset asli
+    python whatif.py kohort_distrik.csv   # kohort lain (CSV / Parquet)
+"""
+
+import argparse
+import sys
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from artifact import ARTIFACT_PATH, load_artifact
+from dataset import DATASET_PATH, load_dataset
+from encoding import OPSI_FITUR, KOLOM_FITUR, encode_codes, build_coef_lookup, score_codes
+from schema import TARGET
+
+# Ubah `kolom` menjadi `nilai` untuk siswa yang memenuhi SEMUA syarat
+# (dict kolom → daftar nilai); syarat kosong = seluruh kohort
+Intervensi = namedtuple("Intervensi", ["kolom", "nilai", "syarat"], defaults=[None])
+
+HasilSimulasi = namedtuple("HasilSimulasi", ["baseline", "counterfactual", "delta", "terdampak"])
+
+KEBIJAKAN_CONTOH = {
+    "Kursus persiapan untuk siswa makan siang bersubsidi": [
+        Intervensi("test preparation course", "completed", {"lunch": ["free/reduced"]}),
+    ],
+    "Kursus persiapan untuk semua siswa": [
+        Intervensi("test preparation course", "completed"),
+    ],
+    "Kursus persiapan untuk Kelompok A & B": [
+        Intervensi("test preparation course", "completed", {"race/ethnicity": ["group A", "group B"]}),
+    ],
+    "Subsidi dihapus (semua makan siang standard)": [
+        Intervensi("lunch", "standard"),
+    ],
+}
+
+
+def _kode_opsi(kolom, nilai):
+    try:
+        return KOLOM_FITUR.index(kolom), OPSI_FITUR[kolom].index(nilai)
+    except (KeyError, ValueError):
+        raise ValueError(f"Intervensi tidak valid: '{kolom}' = '{nilai}'") from None
+
+
+def apply_interventions(kode, interventions):
+    """
+    Kode kategori counterfactual (n x 5) setelah semua intervensi diterapkan
+    berurutan. Returns (kode baru, mask siswa yang kodenya berubah).
+    """
+    baru = kode.copy()
+    for intervensi in interventions:
+        j, nilai = _kode_opsi(intervensi.kolom, intervensi.nilai)
+        sasaran = np.ones(len(baru), dtype=bool)
+        for kolom, daftar_nilai in (intervensi.syarat or {}).items():
+            kode_syarat = [_kode_opsi(kolom, v)[1] for v in daftar_nilai]
+            k = KOLOM_FITUR.index(kolom)
+            sasaran &= np.isin(baru[:, k], kode_syarat)
+        # Siswa dengan kategori tidak dikenal (-1) tidak diintervensi
+        sasaran &= (baru >= 0).all(axis=1)
+        baru[sasaran, j] = nilai
+    return baru, (baru != kode).any(axis=1)
+
+
+def simulate(kode, coef_lookup, interventions):
+    """
+    Prediksi baseline & counterfactual per siswa (nilai dibatasi 0-100).
+
+    coef_lookup harus untuk satu target (lihat LinearScorer.for_target).
+    """
+    baru, terdampak = apply_interventions(kode, interventions)
+    baseline = np.clip(score_codes(kode, coef_lookup), 0, 100)
+    counterfactual = np.clip(score_codes(baru, coef_lookup), 0, 100)
+    return HasilSimulasi(baseline, counterfactual, counterfactual - baseline, terdampak)
+
+
+def summarize(hasil):
+    """Ringkasan agregat satu simulasi."""
+    n_terdampak = int(hasil.terdampak.sum())
+    return {
+        "jumlah_siswa": len(hasil.delta),
+        "siswa_terdampak": n_terdampak,
+        "rata_baseline": float(np.nanmean(hasil.baseline)),
+        "rata_counterfactual": float(np.nanmean(hasil.counterfactual)),
+        "rata_delta": float(np.nanmean(hasil.delta)),
+        "rata_delta_terdampak": float(np.nanmean(hasil.delta[hasil.terdampak])) if n_terdampak else 0.0,
+        "total_delta": float(np.nansum(hasil.delta)),
+    }
+
+
+def per_student(df, hasil):
+    """Tabel per siswa: fitur + prediksi baseline, counterfactual & selisihnya."""
+    tabel = df[KOLOM_FITUR].copy()
+    tabel["prediksi baseline"] = hasil.baseline.round(1)
+    tabel["prediksi intervensi"] = hasil.counterfactual.round(1)
+    tabel["delta"] = hasil.delta.round(1)
+    return tabel
+
+
+def compare_policies(kode, coef_lookup, policies):
+    """Ringkasan beberapa kebijakan pada kohort yang sama (satu baris per kebijakan)."""
+    return pd.DataFrame({
+        nama: summarize(simulate(kode, coef_lookup, interventions))
+        for nama, interventions in policies.items()
+    }).T.astype({"jumlah_siswa": int, "siswa_terdampak": int})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulasi dampak kebijakan intervensi pada kohort siswa")
+    parser.add_argument("cohort", nargs="?", default=DATASET_PATH, help="File kohort (CSV / Parquet)")
+    parser.add_argument("--artifact", default=ARTIFACT_PATH, help="Path artefak model hasil main.py")
+    args = parser.parse_args(argv)
+
+    try:
+        # Simulasi memakai prediksi nilai matematika
+        model = load_artifact(args.artifact).for_target(TARGET)
+        kode = encode_codes(load_dataset(args.cohort, KOLOM_FITUR))
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    ringkasan = compare_policies(kode, build_coef_lookup(model, model.feature_names), KEBIJAKAN_CONTOH)
+    print(f"🧭 Simulasi {len(KEBIJAKAN_CONTOH)} kebijakan pada {len(kode):,} siswa")
+    print("-" * 60)
+    for nama, baris in ringkasan.iterrows():
+        print(f"  {nama}")
+        print(f"     terdampak {int(baris['siswa_terdampak']):,} siswa | "
+              f"rata-rata {baris['rata_baseline']:.2f} → {baris['rata_counterfactual']:.2f} "
+              f"({baris['rata_delta']:+.2f}) | per siswa terdampak {baris['rata_delta_terdampak']:+.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())